@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+import orjson
+
 from src.agents.prompts.news_prompts import get_news_analysis_system_prompt
 from src.core.models.news import NewsDigest
 from src.core.ports.llm_tasks import TASK_NEWS_ANALYSIS
@@ -94,8 +95,8 @@ Provide your analysis as JSON."""
         response_cleaned = response_cleaned.strip()
 
         try:
-            data = json.loads(response_cleaned)
-        except json.JSONDecodeError as err:
+            data = orjson.loads(response_cleaned)
+        except orjson.JSONDecodeError as err:
             raise ValueError("Failed to parse LLM response as JSON") from err
 
         if "summary" not in data:
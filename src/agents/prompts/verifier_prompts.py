@@ -1,8 +1,7 @@
 def get_verifier_system_prompt() -> str:
-    from src.core.policies.safety_policy import SafetyPolicy
+    from src.core.policies.safety_policy import VERIFIER_RULES
 
-    policy = SafetyPolicy()
-    return policy.get_verifier_rules()
+    return VERIFIER_RULES
 
 
 def get_verifier_user_prompt(task_name: str, inputs_summary: str, author_output: str) -> str:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from src.agents.prompts.synthesis_prompts import get_synthesis_system_prompt
 from src.app.settings import Settings
 from src.core.models.news import NewsDigest
@@ -195,7 +196,7 @@ Constraints:
 
             return recommendation, debug_payload, last_response
 
-        except (ValueError, json.JSONDecodeError) as parse_error:
+        except (ValueError, orjson.JSONDecodeError) as parse_error:
             debug_payload["parse_error"] = str(parse_error)
             extracted_json = self._extract_json(llm_response_obj.text)
             debug_payload["extracted_json"] = self._truncate_string(extracted_json, 2000)
@@ -268,7 +269,7 @@ Invalid output:
 
                     return recommendation, debug_payload, last_response
 
-                except (ValueError, json.JSONDecodeError) as retry_error:
+                except (ValueError, orjson.JSONDecodeError) as retry_error:
                     last_error = retry_error
                     debug_payload["retry_raw_output"] = self._truncate_string(
                         retry_response_obj.text, 6000
@@ -353,15 +354,15 @@ Previous failed attempt:
         response_cleaned = self._extract_json(response)
 
         try:
-            data = json.loads(response_cleaned)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(response_cleaned)
+        except orjson.JSONDecodeError as e:
             try:
                 fixed_response = self._try_fix_json(response_cleaned)
                 if fixed_response:
-                    data = json.loads(fixed_response)
+                    data = orjson.loads(fixed_response)
                 else:
                     raise
-            except (json.JSONDecodeError, ValueError):
+            except (orjson.JSONDecodeError, ValueError):
                 error_pos = getattr(e, "pos", None)
                 error_line = getattr(e, "lineno", None)
                 error_col = getattr(e, "colno", None)
@@ -443,25 +444,25 @@ Previous failed attempt:
                 fixed = fixed[: json_end + 1]
 
         try:
-            json.loads(fixed)
+            orjson.loads(fixed)
             return fixed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         import re
 
         try:
             fixed_escapes = fixed.replace("\\'", "'")
-            json.loads(fixed_escapes)
+            orjson.loads(fixed_escapes)
             return fixed_escapes
-        except (json.JSONDecodeError, Exception):
+        except (orjson.JSONDecodeError, Exception):
             pass
 
         try:
             fixed_quotes = re.sub(r'(?<!\\)"(?=.*":\s*")', lambda m: '\\"', fixed, count=1)
-            json.loads(fixed_quotes)
+            orjson.loads(fixed_quotes)
             return fixed_quotes
-        except (json.JSONDecodeError, Exception):
+        except (orjson.JSONDecodeError, Exception):
             pass
 
         return None
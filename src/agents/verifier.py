@@ -1,9 +1,12 @@
-import json
 import logging
 import re
 
+import orjson
+
 from src.agents.prompts.verifier_prompts import get_verifier_system_prompt, get_verifier_user_prompt
 from src.core.models.verification import (
+    SEVERITY_HIGH,
+    SEVERITY_LOW,
     VerificationIssue,
     VerificationIssueSeverity,
     VerificationReport,
@@ -35,15 +38,15 @@ class VerifierAgent:
         cleaned, was_sanitized = self._extract_json(response_text)
 
         try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError:
+            data = orjson.loads(cleaned)
+        except orjson.JSONDecodeError:
             return VerificationReport(
                 passed=False,
                 issues=[
                     VerificationIssue(
                         code="invalid_json",
                         message="Failed to parse LLM response as JSON",
-                        severity=VerificationIssueSeverity.HIGH,
+                        severity=SEVERITY_HIGH,
                         evidence=response_text[:200],
                     )
                 ],
@@ -69,7 +72,7 @@ class VerifierAgent:
                     VerificationIssue(
                         code="invalid_json",
                         message="LLM response is not a JSON object",
-                        severity=VerificationIssueSeverity.HIGH,
+                        severity=SEVERITY_HIGH,
                     )
                 ],
                 suggested_fix="Verifier must return a JSON object",
@@ -96,7 +99,7 @@ class VerifierAgent:
             try:
                 severity = VerificationIssueSeverity(severity_str.lower())
             except ValueError:
-                severity = VerificationIssueSeverity.LOW
+                severity = SEVERITY_LOW
 
             issues.append(
                 VerificationIssue(
@@ -18,7 +18,12 @@ from src.app.wiring import (
 from src.core.models.journal_entry import JournalEntry
 from src.core.models.news import NewsDigest
 from src.core.models.outcome import Outcome
-from src.core.models.rationale import RationaleType
+from src.core.models.rationale import (
+    RATIONALE_NEWS,
+    RATIONALE_SYNTHESIS,
+    RATIONALE_TECHNICAL,
+    RationaleType,
+)
 from src.core.models.timeframe import Timeframe
 from src.core.pipeline_trace import PipelineTrace
 from src.core.services.reporter import Reporter, generate_reason_codes_table
@@ -45,6 +50,14 @@ def init_db() -> None:
     console.print("[green]Database initialized and migrations applied.[/green]")
 
 
+def _has_outcome_counters() -> bool:
+    with db.get_cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'outcome_counters'"
+        )
+        return cursor.fetchone() is not None
+
+
 def _normalize_action(value: object) -> str:
     action = str(value).strip().upper()
     if action in {"CALL", "PUT", "WAIT"}:
@@ -122,13 +135,9 @@ def show_latest(show_details: bool = False, run_id: int | None = None) -> None:
             console.print("[yellow]No rationales found for this run.[/yellow]")
             return
 
-        technical_rationales = [
-            r for r in rationales if r.rationale_type == RationaleType.TECHNICAL
-        ]
-        news_rationales = [r for r in rationales if r.rationale_type == RationaleType.NEWS]
-        synthesis_rationales = [
-            r for r in rationales if r.rationale_type == RationaleType.SYNTHESIS
-        ]
+        technical_rationales = [r for r in rationales if r.rationale_type == RATIONALE_TECHNICAL]
+        news_rationales = [r for r in rationales if r.rationale_type == RATIONALE_NEWS]
+        synthesis_rationales = [r for r in rationales if r.rationale_type == RATIONALE_SYNTHESIS]
 
         if technical_rationales:
             tech_rationale = technical_rationales[0]
@@ -444,7 +453,10 @@ def analyze(symbol: str, timeframe_str: str = "1h", verbose: bool = False) -> No
             console.print()
 
         orchestrator = create_orchestrator(trace=trace)
-        run_id = orchestrator.run_analysis(symbol=symbol, timeframe=timeframe)
+        try:
+            run_id = orchestrator.run_analysis(symbol=symbol, timeframe=timeframe)
+        finally:
+            orchestrator.close()
 
         recommendation = rec_repo.get_by_run_id(run_id)
         recommendation_id = recommendation.id if recommendation else None
@@ -476,6 +488,13 @@ def journal() -> None:
         console.print("[red]Error: No recommendation found. Run 'analyze' first.[/red]")
         return
 
+    # Saving an outcome also bumps outcome_counters; check before prompting.
+    if not _has_outcome_counters():
+        console.print(
+            "[red]Error: missing outcome_counters table. Run init-db to apply migrations.[/red]"
+        )
+        return
+
     console.print("[cyan]Latest Recommendation:[/cyan]")
     console.print(f"  Symbol: {recommendation.symbol}")
     console.print(f"  Action: {recommendation.action}")
@@ -636,10 +655,16 @@ def journal() -> None:
 
 
 def report() -> None:
-    outcomes_data = outcome_repo.get_all_with_details()
-    reporter = Reporter(outcomes_data)
-    table = reporter.generate_daily_report()
-    console.print(table)
+    if _has_outcome_counters():
+        reporter = Reporter(winrate_stats=outcome_repo.get_counters())
+        table = reporter.generate_daily_report()
+        console.print(table)
+    else:
+        reporter = Reporter()
+        console.print(
+            "[dim]Trading statistics unavailable: missing outcome_counters. "
+            "Run init-db to apply migrations.[/dim]"
+        )
     console.print()
 
     query = """
@@ -651,7 +676,7 @@ def report() -> None:
     from src.core.models.rationale import Rationale
 
     with db.get_cursor() as cursor:
-        cursor.execute(query, (RationaleType.NEWS.value,))
+        cursor.execute(query, (RATIONALE_NEWS.value,))
         rows = cursor.fetchall()
         news_rationales: list[Rationale] = []
         for row in rows:
@@ -765,12 +790,15 @@ def main() -> None:
         console.print()
 
         loop = create_minute_loop()
-        loop.start(
-            symbol=args.symbol,
-            timeframe=timeframe,
-            interval_seconds=args.interval_seconds,
-            max_iterations=args.iterations,
-        )
+        try:
+            loop.start(
+                symbol=args.symbol,
+                timeframe=timeframe,
+                interval_seconds=args.interval_seconds,
+                max_iterations=args.iterations,
+            )
+        finally:
+            loop.close()
     elif args.command == "journal":
         journal()
     elif args.command == "report":
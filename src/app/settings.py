@@ -10,6 +10,8 @@ from urllib.parse import urlparse
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+DEFAULT_OLLAMA_MODEL = "llama3:latest"
+
 
 @dataclass
 class LlmRouteStep:
@@ -54,6 +56,10 @@ class Settings(BaseSettings):
     twelve_data_base_url: Annotated[str, Field(alias="TWELVE_DATA_BASE_URL")] = (
         "https://api.twelvedata.com"
     )
+    twelve_data_cache_dir: Annotated[Path | None, Field(alias="TWELVE_DATA_CACHE_DIR")] = None
+    market_data_hedge_delay_ms: Annotated[int | None, Field(alias="MARKET_DATA_HEDGE_DELAY_MS")] = (
+        None
+    )
 
     # --- GDELT API ---
     gdelt_base_url: Annotated[str, Field(alias="GDELT_BASE_URL")] = "https://api.gdeltproject.org"
@@ -65,7 +71,7 @@ class Settings(BaseSettings):
     # --- Ollama (legacy, for backward compatibility) ---
     ollama_base_url: Annotated[str, Field(alias="OLLAMA_BASE_URL")] = "http://localhost:11434"
     ollama_remote_base_url: Annotated[str | None, Field(alias="OLLAMA_REMOTE_BASE_URL")] = None
-    ollama_model: Annotated[str, Field(alias="OLLAMA_MODEL")] = ""
+    ollama_model: Annotated[str, Field(alias="OLLAMA_MODEL")] = DEFAULT_OLLAMA_MODEL
 
     # --- LLM Providers (new multi-provider config) ---
     ollama_local_url: Annotated[str | None, Field(alias="OLLAMA_LOCAL_URL")] = None
@@ -478,6 +484,23 @@ class Settings(BaseSettings):
             raise ValueError("market_data_window_candles must be at least 50")
         return int_value
 
+    @field_validator("twelve_data_cache_dir", mode="before")
+    @classmethod
+    def validate_twelve_data_cache_dir(cls, value: str | Path | None) -> Path | None:
+        if value is None or str(value).strip() == "":
+            return None
+        return Path(str(value))
+
+    @field_validator("market_data_hedge_delay_ms", mode="before")
+    @classmethod
+    def validate_hedge_delay(cls, value: int | str | None) -> int | None:
+        if value is None or str(value).strip() == "":
+            return None
+        int_value = int(value)
+        if int_value < 0:
+            raise ValueError("market_data_hedge_delay_ms must not be negative")
+        return int_value
+
     @field_validator("storage_sqlite_db_path", "storage_artifacts_dir", "log_dir", mode="before")
     @classmethod
     def _as_path(cls, value: str | Path) -> Path:
@@ -544,6 +567,14 @@ class Settings(BaseSettings):
         domain_pattern = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z0-9.-]+$")
         return bool(domain_pattern.match(hostname) and "." in hostname)
 
+    @field_validator("ollama_model", mode="before")
+    @classmethod
+    def _default_ollama_model(cls, value: str | None) -> str:
+        if value is None:
+            return DEFAULT_OLLAMA_MODEL
+        normalized = str(value).strip()
+        return normalized or DEFAULT_OLLAMA_MODEL
+
     @field_validator("deepseek_api_key", mode="before")
     @classmethod
     def _normalize_api_key(cls, value: str | None) -> str | None:
@@ -611,8 +642,7 @@ class Settings(BaseSettings):
             steps.append(LlmRouteStep(provider=fallback3_provider, model=fallback3_model))
 
         if not steps:
-            default_model = self.ollama_model or "llama3:latest"
-            steps.append(LlmRouteStep(provider="ollama_local", model=default_model))
+            steps.append(LlmRouteStep(provider="ollama_local", model=self.ollama_model))
 
         return LlmTaskRouting(steps=steps)
 
@@ -640,7 +670,7 @@ class Settings(BaseSettings):
     @property
     def llm_last_resort(self) -> RouteCandidate:
         provider = self.llm_last_resort_provider or "ollama_local"
-        model = self.llm_last_resort_model or self.ollama_model or "llama3:latest"
+        model = self.llm_last_resort_model or self.ollama_model
         return RouteCandidate(provider=provider, model=model)
 
     def _build_candidates_from_new_schema(
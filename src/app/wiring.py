@@ -1,9 +1,8 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.agents.news_analyst import NewsAnalyst
-from src.agents.synthesizer import Synthesizer
-from src.agents.technical_analyst import TechnicalAnalyst
-from src.agents.verifier import VerifierAgent
 from src.app.settings import get_settings, settings
 from src.core.pipeline_trace import PipelineTrace
 from src.core.ports.clock import Clock
@@ -23,19 +22,7 @@ from src.core.ports.market_data_provider import MarketDataProvider
 from src.core.ports.news_provider import NewsProvider
 from src.core.ports.orchestrator import OrchestratorProtocol
 from src.core.ports.storage import Storage
-from src.core.services.scheduler import Scheduler
-from src.data_providers.forex.fallback_provider import FallbackMarketDataProvider
-from src.data_providers.forex.oanda_provider import OandaProvider
-from src.data_providers.forex.twelve_data_provider import TwelveDataProvider
-from src.llm.deepseek.deepseek_client import DeepSeekClient
-from src.llm.ollama.ollama_client import OllamaClient
-from src.llm.providers.llm_router import LlmRouter
-from src.news_providers.gdelt_provider import GDELTProvider
-from src.news_providers.multi_news_provider import MultiNewsProvider
-from src.news_providers.newsapi_provider import NewsAPIProvider
 from src.runtime.config import RuntimeConfig
-from src.runtime.loop.minute_loop import MinuteLoop
-from src.runtime.orchestrator import RuntimeOrchestrator
 from src.storage.artifacts.artifact_store import ArtifactStore
 from src.storage.sqlite.connection import DBConnection
 from src.storage.sqlite.repositories.candles_repository import CandlesRepository
@@ -44,7 +31,20 @@ from src.storage.sqlite.repositories.recommendations_repository import Recommend
 from src.storage.sqlite.repositories.runs_repository import RunsRepository
 from src.storage.sqlite.repositories.verification_repository import VerificationRepository
 from src.storage.sqlite.storage import SqliteStorage
-from src.utils.time_utils import SystemClock
+
+# Providers, agents and the runtime loop pull in httpx, pandas and the LLM
+# clients; they are imported inside their factories so callers that only
+# need storage factories do not pay for them at import time.
+if TYPE_CHECKING:
+    from src.agents.news_analyst import NewsAnalyst
+    from src.agents.synthesizer import Synthesizer
+    from src.agents.technical_analyst import TechnicalAnalyst
+    from src.agents.verifier import VerifierAgent
+    from src.data_providers.forex.oanda_provider import OandaProvider
+    from src.data_providers.forex.twelve_data_provider import TwelveDataProvider
+    from src.llm.providers.llm_router import LlmRouter
+    from src.news_providers.newsapi_provider import NewsAPIProvider
+    from src.runtime.loop.minute_loop import MinuteLoop
 
 
 def create_runtime_config() -> RuntimeConfig:
@@ -71,6 +71,11 @@ def create_runtime_config() -> RuntimeConfig:
 
 
 def create_market_data_provider() -> MarketDataProvider:
+    from src.data_providers.cache import CandleFileCache
+    from src.data_providers.forex.fallback_provider import FallbackMarketDataProvider
+    from src.data_providers.forex.oanda_provider import OandaProvider
+    from src.data_providers.forex.twelve_data_provider import TwelveDataProvider
+
     oanda_provider: OandaProvider | None = None
     twelve_data_provider: TwelveDataProvider | None = None
 
@@ -81,15 +86,21 @@ def create_market_data_provider() -> MarketDataProvider:
         )
 
     if settings.twelve_data_api_key:
+        twelve_data_cache: CandleFileCache | None = None
+        if settings.twelve_data_cache_dir is not None:
+            twelve_data_cache = CandleFileCache(settings.twelve_data_cache_dir)
         twelve_data_provider = TwelveDataProvider(
             api_key=settings.twelve_data_api_key,
             base_url=settings.twelve_data_base_url,
+            cache=twelve_data_cache,
         )
 
     if oanda_provider and twelve_data_provider:
+        hedge_delay_ms = settings.market_data_hedge_delay_ms
         return FallbackMarketDataProvider(
             primary=oanda_provider,
             secondary=twelve_data_provider,
+            hedge_delay_seconds=hedge_delay_ms / 1000 if hedge_delay_ms is not None else None,
         )
     elif oanda_provider:
         return oanda_provider
@@ -103,6 +114,10 @@ def create_market_data_provider() -> MarketDataProvider:
 
 
 def create_news_provider() -> NewsProvider:
+    from src.news_providers.gdelt_provider import GDELTProvider
+    from src.news_providers.multi_news_provider import MultiNewsProvider
+    from src.news_providers.newsapi_provider import NewsAPIProvider
+
     gdelt_provider = GDELTProvider(base_url=settings.gdelt_base_url)
 
     newsapi_provider: NewsAPIProvider | None = None
@@ -119,12 +134,15 @@ def create_news_provider() -> NewsProvider:
 
 
 def create_llm_providers() -> dict[str, LlmProvider]:
+    from src.llm.deepseek.deepseek_client import DeepSeekClient
+    from src.llm.ollama.ollama_client import OllamaClient
+
     providers: dict[str, LlmProvider] = {}
 
     ollama_local_url = settings._get_ollama_local_url()
     providers[PROVIDER_OLLAMA_LOCAL] = OllamaClient(
         base_url=ollama_local_url,
-        model=settings.ollama_model or "llama3:latest",
+        model=settings.ollama_model,
         provider_name=PROVIDER_OLLAMA_LOCAL,
     )
 
@@ -133,7 +151,7 @@ def create_llm_providers() -> dict[str, LlmProvider]:
         if ollama_server_url:
             providers[PROVIDER_OLLAMA_SERVER] = OllamaClient(
                 base_url=ollama_server_url,
-                model=settings.ollama_model or "llama3:latest",
+                model=settings.ollama_model,
                 provider_name=PROVIDER_OLLAMA_SERVER,
             )
 
@@ -151,6 +169,7 @@ def create_llm_providers() -> dict[str, LlmProvider]:
 def create_llm_router() -> LlmRouter:
     from src.llm.providers.llm_router import (
         LastResortConfig,
+        LlmRouter,
         LlmRouteStep,
         LlmRoutingConfig,
         LlmTaskRouting,
@@ -177,7 +196,7 @@ def create_llm_router() -> LlmRouter:
             steps = [
                 LlmRouteStep(
                     provider=PROVIDER_OLLAMA_LOCAL,
-                    model=current_settings.ollama_model or "llama3:latest",
+                    model=current_settings.ollama_model,
                 )
             ]
         else:
@@ -248,18 +267,26 @@ def get_llm_router() -> LlmRouter:
 
 
 def create_technical_analyst() -> TechnicalAnalyst:
+    from src.agents.technical_analyst import TechnicalAnalyst
+
     return TechnicalAnalyst(llm_router=get_llm_router())
 
 
 def create_synthesizer() -> Synthesizer:
+    from src.agents.synthesizer import Synthesizer
+
     return Synthesizer(llm_router=get_llm_router())
 
 
 def create_news_analyst() -> NewsAnalyst:
+    from src.agents.news_analyst import NewsAnalyst
+
     return NewsAnalyst(llm_router=get_llm_router())
 
 
 def create_verifier_agent() -> VerifierAgent:
+    from src.agents.verifier import VerifierAgent
+
     return VerifierAgent(llm_router=get_llm_router())
 
 
@@ -298,7 +325,9 @@ def create_artifact_store() -> ArtifactStore:
     return ArtifactStore(artifacts_dir)
 
 
-def create_orchestrator(trace: "PipelineTrace | None" = None) -> OrchestratorProtocol:
+def create_orchestrator(trace: PipelineTrace | None = None) -> OrchestratorProtocol:
+    from src.runtime.orchestrator import RuntimeOrchestrator
+
     storage = create_storage()
     artifact_store = create_artifact_store()
     market_data_provider = create_market_data_provider()
@@ -333,6 +362,10 @@ def create_orchestrator(trace: "PipelineTrace | None" = None) -> OrchestratorPro
 
 
 def create_minute_loop(clock: Clock | None = None) -> MinuteLoop:
+    from src.core.services.scheduler import Scheduler
+    from src.runtime.loop.minute_loop import MinuteLoop
+    from src.utils.time_utils import SystemClock
+
     if clock is None:
         clock = SystemClock()
     orchestrator = create_orchestrator()
@@ -32,22 +32,24 @@ def enter_trade_result(storage: Storage) -> None:
             default="Market changed",
         )
 
-        entry = JournalEntry(
-            recommendation_id=recommendation.id,
-            symbol=recommendation.symbol,
-            open_time=datetime.now(),
-            expiry_seconds=300,
-            user_action="SKIP",
-        )
-        entry_id = storage.journal.save(entry)
-
-        outcome = Outcome(
-            journal_entry_id=entry_id,
-            close_time=datetime.now(),
-            win_or_loss="VOID",
-            comment=reason,
-        )
-        storage.outcomes.save(outcome)
+        now = datetime.now()
+        with storage.transaction():
+            entry = JournalEntry(
+                recommendation_id=recommendation.id,
+                symbol=recommendation.symbol,
+                open_time=now,
+                expiry_seconds=300,
+                user_action="SKIP",
+            )
+            entry_id = storage.journal.save(entry)
+
+            outcome = Outcome(
+                journal_entry_id=entry_id,
+                close_time=now,
+                win_or_loss="VOID",
+                comment=reason,
+            )
+            storage.outcomes.save(outcome)
 
         console.print(f"[green]Trade skipped. Reason: {reason}[/green]")
         return
@@ -64,22 +66,24 @@ def enter_trade_result(storage: Storage) -> None:
         default="Confident",
     )
 
-    entry = JournalEntry(
-        recommendation_id=recommendation.id,
-        symbol=recommendation.symbol,
-        open_time=datetime.now(),
-        expiry_seconds=300,
-        user_action=recommendation.action,
-    )
-    entry_id = storage.journal.save(entry)
-
-    comment = f"Quality: {quality}"
-    outcome = Outcome(
-        journal_entry_id=entry_id,
-        close_time=datetime.now(),
-        win_or_loss=result,
-        comment=comment,
-    )
-    storage.outcomes.save(outcome)
+    now = datetime.now()
+    with storage.transaction():
+        entry = JournalEntry(
+            recommendation_id=recommendation.id,
+            symbol=recommendation.symbol,
+            open_time=now,
+            expiry_seconds=300,
+            user_action=recommendation.action,
+        )
+        entry_id = storage.journal.save(entry)
+
+        comment = f"Quality: {quality}"
+        outcome = Outcome(
+            journal_entry_id=entry_id,
+            close_time=now,
+            win_or_loss=result,
+            comment=comment,
+        )
+        storage.outcomes.save(outcome)
 
     console.print(f"[green]Trade result saved: {result}[/green]")
@@ -1,3 +1,4 @@
+import logging
 import time
 from contextlib import contextmanager
 from typing import Any
@@ -7,35 +8,47 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _format_extra(extra: dict[str, Any]) -> str:
+    return ", ".join(f"{k}={v}" for k, v in extra.items())
+
+
 def log_stage_start(stage: str, **extra: Any) -> None:
     """
     Log the start of a pipeline stage.
 
+    Formatting is skipped entirely when DEBUG logging is disabled.
+
     Args:
         stage: Stage name (e.g., "fetch_candles", "tech_analysis")
         **extra: Additional context to log
     """
-    extra_str = ", ".join(f"{k}={v}" for k, v in extra.items()) if extra else ""
-    message = f"Stage start: {stage}"
-    if extra_str:
-        message += f" ({extra_str})"
-    logger.debug(message)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if extra:
+        logger.debug("Stage start: %s (%s)", stage, _format_extra(extra))
+    else:
+        logger.debug("Stage start: %s", stage)
 
 
 def log_stage_end(stage: str, duration_ms: float, **extra: Any) -> None:
     """
     Log the end of a pipeline stage with duration.
 
+    Formatting is skipped entirely when DEBUG logging is disabled.
+
     Args:
         stage: Stage name
         duration_ms: Duration in milliseconds
         **extra: Additional context to log
     """
-    extra_str = ", ".join(f"{k}={v}" for k, v in extra.items()) if extra else ""
-    message = f"Stage end: {stage}, duration={duration_ms:.1f}ms"
-    if extra_str:
-        message += f" ({extra_str})"
-    logger.debug(message)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if extra:
+        logger.debug(
+            "Stage end: %s, duration=%.1fms (%s)", stage, duration_ms, _format_extra(extra)
+        )
+    else:
+        logger.debug("Stage end: %s, duration=%.1fms", stage, duration_ms)
 
 
 @contextmanager
@@ -43,14 +56,20 @@ def stage_timer(stage: str, **extra: Any):
     """
     Context manager for timing a pipeline stage.
 
+    Duration is always measured with the monotonic performance counter; log
+    lines are only emitted when DEBUG is enabled.
+
     Usage:
         with stage_timer("fetch_candles", symbol="EURUSD"):
             # ... do work ...
     """
-    start_time = time.time()
-    log_stage_start(stage, **extra)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    start_ns = time.perf_counter_ns()
+    if debug_enabled:
+        log_stage_start(stage, **extra)
     try:
         yield
     finally:
-        duration_ms = (time.time() - start_time) * 1000
-        log_stage_end(stage, duration_ms, **extra)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        if debug_enabled:
+            log_stage_end(stage, duration_ms, **extra)
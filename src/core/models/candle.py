@@ -1,5 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel
 
 
@@ -10,3 +13,23 @@ class Candle(BaseModel):
     low: float
     close: float
     volume: float
+
+
+@dataclass(slots=True, frozen=True)
+class CandleArrays:
+    """
+    Column-oriented (structure-of-arrays) view of a candle series.
+
+    Timestamps are UTC ``datetime64[ns]``; price and volume columns are
+    contiguous ``float64`` arrays of the same length.
+    """
+
+    timestamp: npt.NDArray[np.datetime64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.close)
@@ -1,11 +1,11 @@
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel
-
 from src.core.models.timeframe import Timeframe
 
 
-class DecisionContext(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DecisionContext:
     symbol: str
     timestamp: datetime
     timeframe: Timeframe
@@ -9,6 +9,11 @@ class RationaleType(str, Enum):
     SYNTHESIS = "SYNTHESIS"
 
 
+RATIONALE_TECHNICAL = RationaleType.TECHNICAL
+RATIONALE_NEWS = RationaleType.NEWS
+RATIONALE_SYNTHESIS = RationaleType.SYNTHESIS
+
+
 class Rationale(BaseModel):
     id: int | None = None
     run_id: int
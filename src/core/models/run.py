@@ -12,6 +12,11 @@ class RunStatus(str, Enum):
     FAILED = "FAILED"
 
 
+RUN_STATUS_PENDING = RunStatus.PENDING
+RUN_STATUS_SUCCESS = RunStatus.SUCCESS
+RUN_STATUS_FAILED = RunStatus.FAILED
+
+
 class Run(BaseModel):
     id: int | None = None
     symbol: str
@@ -7,3 +7,10 @@ class Timeframe(str, Enum):
     M15 = "15m"
     H1 = "1h"
     D1 = "1d"
+
+
+TIMEFRAME_M1 = Timeframe.M1
+TIMEFRAME_M5 = Timeframe.M5
+TIMEFRAME_M15 = Timeframe.M15
+TIMEFRAME_H1 = Timeframe.H1
+TIMEFRAME_D1 = Timeframe.D1
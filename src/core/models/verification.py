@@ -9,6 +9,11 @@ class VerificationIssueSeverity(str, Enum):
     HIGH = "high"
 
 
+SEVERITY_LOW = VerificationIssueSeverity.LOW
+SEVERITY_MEDIUM = VerificationIssueSeverity.MEDIUM
+SEVERITY_HIGH = VerificationIssueSeverity.HIGH
+
+
 class VerificationIssue(BaseModel):
     code: str
     message: str
@@ -11,54 +11,9 @@ FORBIDDEN_PATTERNS = [
     r"\b(you\s+should|you\s+must|you\s+need\s+to)\s+(trade|execute|place)",
 ]
 
+_MANUAL_DECISION_PATTERN = re.compile(r"manual decision", re.IGNORECASE)
 
-def sanitize_brief(brief: str) -> str:
-    sanitized = brief
-
-    for pattern in FORBIDDEN_PATTERNS:
-        sanitized = re.sub(pattern, "", sanitized, flags=re.IGNORECASE)
-
-    sanitized = re.sub(r"\s+", " ", sanitized).strip()
-
-    if not sanitized.endswith("."):
-        sanitized += "."
-
-    if "manual decision" not in sanitized.lower():
-        sanitized += " [Manual decision required - this is research-only analysis.]"
-
-    return sanitized
-
-
-class SafetyPolicy:
-    def validate(self, recommendation: Recommendation) -> tuple[bool, str | None]:
-        constraint_ok, constraint_error = validate_recommendation(recommendation)
-        if not constraint_ok:
-            return False, constraint_error
-
-        brief_lower = recommendation.brief.lower()
-
-        for pattern in FORBIDDEN_PATTERNS:
-            if re.search(pattern, brief_lower):
-                return False, f"Brief contains forbidden imperative command pattern: {pattern}"
-
-        return True, None
-
-    def sanitize(self, recommendation: Recommendation) -> Recommendation:
-        sanitized_brief = sanitize_brief(recommendation.brief)
-
-        return Recommendation(
-            id=recommendation.id,
-            run_id=recommendation.run_id,
-            symbol=recommendation.symbol,
-            timestamp=recommendation.timestamp,
-            timeframe=recommendation.timeframe,
-            action=recommendation.action,
-            brief=sanitized_brief,
-            confidence=recommendation.confidence,
-        )
-
-    def get_verifier_rules(self) -> str:
-        rules = """You are a verification agent for a trading research assistant. Your role is to verify that agent outputs comply with safety policies and do not contain hallucinations or unsupported claims.
+VERIFIER_RULES = """You are a verification agent for a trading research assistant. Your role is to verify that agent outputs comply with safety policies and do not contain hallucinations or unsupported claims.
 
 VERIFICATION RULES:
 
@@ -105,7 +60,46 @@ Return a VerificationReport in JSON format with:
 - suggested_fix: string (if passed=false)
 - policy_version: "1.0"
 """
-        return rules
+
+
+def sanitize_brief(brief: str) -> str:
+    sanitized = brief
+
+    for pattern in FORBIDDEN_PATTERNS:
+        sanitized = re.sub(pattern, "", sanitized, flags=re.IGNORECASE)
+
+    sanitized = re.sub(r"\s+", " ", sanitized).strip()
+
+    if not sanitized.endswith("."):
+        sanitized += "."
+
+    if not _MANUAL_DECISION_PATTERN.search(sanitized):
+        sanitized += " [Manual decision required - this is research-only analysis.]"
+
+    return sanitized
+
+
+class SafetyPolicy:
+    def validate(self, recommendation: Recommendation) -> tuple[bool, str | None]:
+        constraint_ok, constraint_error = validate_recommendation(recommendation)
+        if not constraint_ok:
+            return False, constraint_error
+
+        brief_lower = recommendation.brief.lower()
+
+        for pattern in FORBIDDEN_PATTERNS:
+            if re.search(pattern, brief_lower):
+                return False, f"Brief contains forbidden imperative command pattern: {pattern}"
+
+        return True, None
+
+    def sanitize(self, recommendation: Recommendation) -> Recommendation:
+        sanitized_brief = sanitize_brief(recommendation.brief)
+
+        return recommendation.model_copy(update={"brief": sanitized_brief})
+
+    def get_verifier_rules(self) -> str:
+        return VERIFIER_RULES
 
     def validate_report(self, report: VerificationReport) -> tuple[bool, str | None]:
         if report.passed and len(report.issues) > 0:
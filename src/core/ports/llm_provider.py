@@ -1,5 +1,7 @@
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 from src.core.models.llm import LlmRequest, LlmResponse
 
@@ -15,14 +17,23 @@ class LlmProvider(ABC):
     def generate(self, system_prompt: str, user_prompt: str) -> str:
         pass
 
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        Yield the completion in pieces as the provider produces them.
+
+        The default implementation yields the whole generate() result once;
+        providers with a streaming API override this.
+        """
+        yield self.generate(system_prompt=system_prompt, user_prompt=user_prompt)
+
     def generate_with_request(self, request: LlmRequest) -> LlmResponse:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             text = self.generate(
                 system_prompt=request.system_prompt,
                 user_prompt=request.user_prompt,
             )
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return LlmResponse(
                 text=text,
                 provider_name=self.get_provider_name(),
@@ -32,7 +43,7 @@ class LlmProvider(ABC):
                 error=None,
             )
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return LlmResponse(
                 text="",
                 provider_name=self.get_provider_name(),
@@ -42,6 +53,22 @@ class LlmProvider(ABC):
                 error=str(e),
             )
 
+    def generate_batch(
+        self, requests: list[LlmRequest], max_concurrency: int = 4
+    ) -> list[LlmResponse]:
+        """
+        Run several requests concurrently and return responses in request order.
+
+        The default implementation overlaps network round trips by running
+        generate_with_request on a bounded thread pool. Providers with a native
+        batch endpoint can override this.
+        """
+        if len(requests) <= 1 or max_concurrency <= 1:
+            return [self.generate_with_request(request) for request in requests]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as executor:
+            return list(executor.map(self.generate_with_request, requests))
+
     @abstractmethod
     def health_check(self) -> HealthCheckResult:
         pass
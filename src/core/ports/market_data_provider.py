@@ -16,3 +16,7 @@ class MarketDataProvider(ABC):
         to_time: datetime | None = None,
     ) -> list[Candle]:
         pass
+
+    def close(self) -> None:
+        """Release pooled connections; a provider without any has nothing to do."""
+        return None
@@ -5,3 +5,5 @@ from src.core.models.timeframe import Timeframe
 
 class OrchestratorProtocol(Protocol):
     def run_analysis(self, symbol: str, timeframe: Timeframe) -> int: ...
+
+    def close(self) -> None: ...
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Protocol
 
@@ -48,6 +50,10 @@ class OutcomesRepositoryPort(Protocol):
 
     def get_all_with_details(self) -> list[dict[str, str | int | None]]: ...
 
+    def get_counters(self) -> list[tuple[str, int, int, int, int]]: ...
+
+    def get_winrate_stats(self) -> list[tuple[str, int, int, int, int]]: ...
+
 
 class Storage(ABC):
     @property
@@ -74,3 +80,13 @@ class Storage(ABC):
     @abstractmethod
     def outcomes(self) -> OutcomesRepositoryPort:
         pass
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group writes across repositories into one atomic unit.
+
+        The default implementation is a no-op; backends that support
+        transactions override it.
+        """
+        yield
@@ -1,113 +1,128 @@
-import json
-from collections import defaultdict
+import heapq
+from collections import Counter
 from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
 
+import orjson
 from rich.table import Table
 
 from src.core.models.news import NewsDigest
-from src.core.models.rationale import Rationale, RationaleType
+from src.core.models.rationale import RATIONALE_NEWS, Rationale
+
+_OUTCOME_BUCKETS = {"WIN": 0, "LOSS": 1, "DRAW": 2, "VOID": 3}
+
+_ColumnSpec = tuple[str, dict[str, Any]]
+
+_DAILY_REPORT_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Symbol", {"style": "cyan", "width": 10}),
+    ("Total Trades", {"style": "yellow", "justify": "right", "width": 12}),
+    ("WinRate (%)", {"style": "bold green", "justify": "right", "width": 12}),
+    ("Wins", {"style": "green", "justify": "right", "width": 8}),
+    ("Losses", {"style": "red", "justify": "right", "width": 8}),
+    ("Draws", {"style": "yellow", "justify": "right", "width": 8}),
+    ("Skipped", {"style": "dim", "justify": "right", "width": 8}),
+)
+_NEWS_STATS_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Quality", {"style": "cyan", "width": 10}),
+    ("Count", {"style": "yellow", "justify": "right", "width": 12}),
+    ("Percentage", {"style": "bold green", "justify": "right", "width": 12}),
+)
+_REASON_CODES_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Reason Code", {"style": "cyan", "width": 32}),
+    ("Count", {"style": "yellow", "justify": "right", "width": 10}),
+    ("Share", {"style": "bold green", "justify": "right", "width": 10}),
+)
+
+
+def _make_table(title: str, columns: tuple[_ColumnSpec, ...]) -> Table:
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 
 class Reporter:
-    def __init__(self, outcomes_data: list[dict[str, str | int | None]]) -> None:
-        self.outcomes_data = outcomes_data
+    def __init__(
+        self,
+        outcomes_data: list[dict[str, str | int | None]] | None = None,
+        winrate_stats: list[tuple[str, int, int, int, int]] | None = None,
+    ) -> None:
+        """
+        Args:
+            outcomes_data: Raw outcome rows, aggregated per symbol in Python.
+            winrate_stats: Pre-aggregated (symbol, wins, losses, draws, skipped)
+                rows, e.g. from OutcomesRepository.get_winrate_stats(). When
+                given, they are used instead of outcomes_data.
+        """
+        self.outcomes_data = outcomes_data or []
+        self.winrate_stats = winrate_stats
 
     def generate_daily_report(self) -> Table:
-        table = Table(title="Trading Statistics", show_header=True, header_style="bold magenta")
-        table.add_column("Symbol", style="cyan", width=10)
-        table.add_column("Total Trades", style="yellow", justify="right", width=12)
-        table.add_column("WinRate (%)", style="bold green", justify="right", width=12)
-        table.add_column("Wins", style="green", justify="right", width=8)
-        table.add_column("Losses", style="red", justify="right", width=8)
-        table.add_column("Draws", style="yellow", justify="right", width=8)
-        table.add_column("Skipped", style="dim", justify="right", width=8)
-
-        stats_by_symbol: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"wins": 0, "losses": 0, "draws": 0, "skipped": 0}
-        )
-
-        for outcome in self.outcomes_data:
-            symbol_raw = outcome.get("symbol", "UNKNOWN")
-            symbol = str(symbol_raw) if symbol_raw is not None else "UNKNOWN"
-
-            result_raw = outcome.get("win_or_loss", "")
-            result = str(result_raw).upper() if result_raw is not None else ""
+        table = _make_table("Trading Statistics", _DAILY_REPORT_COLUMNS)
 
-            if result == "WIN":
-                stats_by_symbol[symbol]["wins"] += 1
-            elif result == "LOSS":
-                stats_by_symbol[symbol]["losses"] += 1
-            elif result == "DRAW":
-                stats_by_symbol[symbol]["draws"] += 1
-            elif result == "VOID":
-                stats_by_symbol[symbol]["skipped"] += 1
+        if self.winrate_stats is not None:
+            counts_by_symbol = {symbol: list(counts) for symbol, *counts in self.winrate_stats}
+        else:
+            counts_by_symbol = self._count_outcomes_by_symbol()
 
-        for symbol in sorted(stats_by_symbol.keys()):
-            stats = stats_by_symbol[symbol]
-            total_trades = stats["wins"] + stats["losses"] + stats["draws"]
-            skipped = stats["skipped"]
+        symbols = sorted(counts_by_symbol)
+        for symbol in symbols:
+            wins, losses, draws, skipped = counts_by_symbol[symbol]
+            total_trades = wins + losses + draws
 
-            winrate = stats["wins"] / total_trades * 100 if total_trades > 0 else 0.0
+            winrate = wins / total_trades * 100 if total_trades > 0 else 0.0
 
             table.add_row(
                 symbol,
                 str(total_trades),
                 f"{winrate:.1f}%",
-                str(stats["wins"]),
-                str(stats["losses"]),
-                str(stats["draws"]),
+                str(wins),
+                str(losses),
+                str(draws),
                 str(skipped),
             )
 
-        if not stats_by_symbol:
+        if not symbols:
             table.add_row("No data", "0", "0.0%", "0", "0", "0", "0")
 
         return table
 
+    def _count_outcomes_by_symbol(self) -> dict[str, list[int]]:
+        counts_by_symbol: dict[str, list[int]] = {}
+        buckets = _OUTCOME_BUCKETS
+
+        for outcome in self.outcomes_data:
+            result_raw = outcome.get("win_or_loss", "")
+            bucket = buckets.get(str(result_raw).upper()) if result_raw is not None else None
+            if bucket is None:
+                continue
+
+            symbol_raw = outcome.get("symbol", "UNKNOWN")
+            symbol = str(symbol_raw) if symbol_raw is not None else "UNKNOWN"
+            counts = counts_by_symbol.get(symbol)
+            if counts is None:
+                counts = counts_by_symbol[symbol] = [0, 0, 0, 0]
+            counts[bucket] += 1
+
+        return counts_by_symbol
+
     def generate_news_stats(self, news_rationales: list[Rationale]) -> Table:
-        table = Table(
-            title="News Quality Statistics", show_header=True, header_style="bold magenta"
-        )
-        table.add_column("Quality", style="cyan", width=10)
-        table.add_column("Count", style="yellow", justify="right", width=12)
-        table.add_column("Percentage", style="bold green", justify="right", width=12)
+        table = _make_table("News Quality Statistics", _NEWS_STATS_COLUMNS)
 
         quality_counts: dict[str, int] = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
         total = 0
 
         for rationale in news_rationales:
-            if rationale.rationale_type != RationaleType.NEWS:
+            if rationale.rationale_type != RATIONALE_NEWS:
                 continue
             if not rationale.raw_data:
                 continue
 
-            try:
-                digest_data: object = json.loads(rationale.raw_data)
-                if isinstance(digest_data, str):
-                    digest_data = json.loads(digest_data)
-
-                quality_value: object | None = None
-                if isinstance(digest_data, dict):
-                    quality_value = digest_data.get("quality")
-
-                    if quality_value is None:
-                        for nested_key in ["news_digest", "digest", "data"]:
-                            nested_value = digest_data.get(nested_key)
-                            if isinstance(nested_value, dict):
-                                quality_value = nested_value.get("quality")
-                                if quality_value is not None:
-                                    break
-
-                if quality_value is None:
-                    digest = NewsDigest.model_validate(digest_data)
-                    quality_value = digest.quality
-
-                quality = str(quality_value).upper()
-                if quality in quality_counts:
-                    quality_counts[quality] += 1
-                    total += 1
-            except (json.JSONDecodeError, ValueError, KeyError, TypeError):
-                continue
+            quality = _extract_news_quality(rationale.raw_data)
+            if quality is not None and quality in quality_counts:
+                quality_counts[quality] += 1
+                total += 1
 
         if total > 0:
             for quality in ["HIGH", "MEDIUM", "LOW"]:
@@ -120,8 +135,36 @@ class Reporter:
         return table
 
 
+@lru_cache(maxsize=4096)
+def _extract_news_quality(raw_data: str) -> str | None:
+    try:
+        digest_data: object = orjson.loads(raw_data)
+        if isinstance(digest_data, str):
+            digest_data = orjson.loads(digest_data)
+
+        quality_value: object | None = None
+        if isinstance(digest_data, dict):
+            quality_value = digest_data.get("quality")
+
+            if quality_value is None:
+                for nested_key in ["news_digest", "digest", "data"]:
+                    nested_value = digest_data.get(nested_key)
+                    if isinstance(nested_value, dict):
+                        quality_value = nested_value.get("quality")
+                        if quality_value is not None:
+                            break
+
+        if quality_value is None:
+            digest = NewsDigest.model_validate(digest_data)
+            quality_value = digest.quality
+
+        return str(quality_value).upper()
+    except (orjson.JSONDecodeError, ValueError, KeyError, TypeError):
+        return None
+
+
 def _parse_reason_codes(value: object) -> list[str]:
-    if value is None:
+    if not value:
         return []
 
     if isinstance(value, list):
@@ -140,14 +183,14 @@ def _parse_reason_codes(value: object) -> list[str]:
         return []
 
     try:
-        parsed: object = json.loads(raw)
-    except (TypeError, ValueError, json.JSONDecodeError):
+        parsed: object = orjson.loads(raw)
+    except (TypeError, ValueError, orjson.JSONDecodeError):
         return []
 
     if isinstance(parsed, str):
         try:
-            parsed = json.loads(parsed)
-        except (TypeError, ValueError, json.JSONDecodeError):
+            parsed = orjson.loads(parsed)
+        except (TypeError, ValueError, orjson.JSONDecodeError):
             return []
 
     if not isinstance(parsed, list):
@@ -162,28 +205,23 @@ def _parse_reason_codes(value: object) -> list[str]:
 
 
 def count_reason_codes(reason_codes_values: Sequence[object]) -> dict[str, int]:
-    counts: dict[str, int] = defaultdict(int)
-    for value in reason_codes_values:
-        for code in _parse_reason_codes(value):
-            counts[code] += 1
-    return dict(counts)
+    return dict(
+        Counter(code for value in reason_codes_values for code in _parse_reason_codes(value))
+    )
 
 
 def generate_reason_codes_table(reason_codes_values: Sequence[object], top_n: int = 10) -> Table:
     counts = count_reason_codes(reason_codes_values)
     total = sum(counts.values())
 
-    table = Table(title="Top Reason Codes", show_header=True, header_style="bold magenta")
-    table.add_column("Reason Code", style="cyan", width=32)
-    table.add_column("Count", style="yellow", justify="right", width=10)
-    table.add_column("Share", style="bold green", justify="right", width=10)
+    table = _make_table("Top Reason Codes", _REASON_CODES_COLUMNS)
 
     if total <= 0:
         table.add_row("No data", "0", "0.0%")
         return table
 
-    sorted_items = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-    for code, count in sorted_items[: max(1, int(top_n))]:
+    top_items = heapq.nsmallest(max(1, int(top_n)), counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    for code, count in top_items:
         share = (count / total) * 100.0
         table.add_row(code, str(count), f"{share:.1f}%")
 
@@ -0,0 +1,122 @@
+import contextlib
+import hashlib
+import os
+import shutil
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from src.core.models.candle import Candle
+from src.core.models.timeframe import Timeframe
+
+# Provider responses only change once a new bar closes, so an entry stays
+# fresh until the close of the bar it was written in.
+DEFAULT_CANDLE_CACHE_TTL_SECONDS: dict[Timeframe, float] = {
+    Timeframe.M1: 60.0,
+    Timeframe.M5: 300.0,
+    Timeframe.M15: 900.0,
+    Timeframe.H1: 3600.0,
+    Timeframe.D1: 86400.0,
+}
+
+
+class CandleFileCache:
+    """
+    On-disk TTL cache for provider candle responses.
+
+    Entries live under ``{cache_dir}/{symbol}/{timeframe}/{md5(params)}.json``
+    and expire at the first bar boundary after their modification time, so
+    repeated research runs and restarts reuse recent fetches instead of
+    spending API quota, yet never miss a bar that has since closed. The
+    ``ttl_seconds`` value is the bar length for each timeframe.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: Mapping[Timeframe, float] | None = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = dict(
+            DEFAULT_CANDLE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+
+    def _entry_path(self, symbol: str, timeframe: Timeframe, params: Mapping[str, Any]) -> Path:
+        digest = hashlib.md5(
+            orjson.dumps(dict(params), option=orjson.OPT_SORT_KEYS), usedforsecurity=False
+        ).hexdigest()
+        return self.cache_dir / _safe_name(symbol) / timeframe.value / f"{digest}.json"
+
+    def get(
+        self, symbol: str, timeframe: Timeframe, params: Mapping[str, Any]
+    ) -> list[Candle] | None:
+        ttl = self.ttl_seconds.get(timeframe, 0.0)
+        if ttl <= 0:
+            return None
+
+        path = self._entry_path(symbol, timeframe, params)
+        try:
+            written_at = path.stat().st_mtime
+            if time.time() >= (written_at // ttl + 1) * ttl:
+                return None
+            rows = orjson.loads(path.read_bytes())
+            return [
+                Candle(
+                    timestamp=datetime.fromisoformat(row[0]),
+                    open=row[1],
+                    high=row[2],
+                    low=row[3],
+                    close=row[4],
+                    volume=row[5],
+                )
+                for row in rows
+            ]
+        except (OSError, orjson.JSONDecodeError, ValueError, TypeError, IndexError):
+            return None
+
+    def put(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        params: Mapping[str, Any],
+        candles: list[Candle],
+    ) -> None:
+        if self.ttl_seconds.get(timeframe, 0.0) <= 0:
+            return
+
+        path = self._entry_path(symbol, timeframe, params)
+        rows = [
+            (
+                candle.timestamp.isoformat(),
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume,
+            )
+            for candle in candles
+        ]
+        # Write then rename so concurrent readers never see a partial file.
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(orjson.dumps(rows))
+            os.replace(temp_path, path)
+        except OSError:
+            # A cache that cannot be written must not fail a successful fetch.
+            with contextlib.suppress(OSError):
+                temp_path.unlink()
+
+    def clear(self, symbol: str | None = None) -> None:
+        """Remove cached entries for one symbol, or the whole cache."""
+        target = self.cache_dir if symbol is None else self.cache_dir / _safe_name(symbol)
+        shutil.rmtree(target, ignore_errors=True)
+
+
+def _safe_name(symbol: str) -> str:
+    return symbol.upper().replace("/", "_")
@@ -1,4 +1,5 @@
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
 from src.core.models.candle import Candle
@@ -11,9 +12,11 @@ class FallbackMarketDataProvider(MarketDataProvider):
         self,
         primary: MarketDataProvider,
         secondary: MarketDataProvider | None = None,
+        hedge_delay_seconds: float | None = None,
     ) -> None:
         self.primary = primary
         self.secondary = secondary
+        self.hedge_delay_seconds = hedge_delay_seconds
 
     def fetch_candles(
         self,
@@ -23,35 +26,103 @@ class FallbackMarketDataProvider(MarketDataProvider):
         from_time: datetime | None = None,
         to_time: datetime | None = None,
     ) -> list[Candle]:
-        try:
-            return self.primary.fetch_candles(
-                symbol=symbol,
-                timeframe=timeframe,
-                count=count,
-                from_time=from_time,
-                to_time=to_time,
+        if self.secondary is not None and self.hedge_delay_seconds is not None:
+            return self._fetch_hedged(
+                self.secondary,
+                self.hedge_delay_seconds,
+                symbol,
+                timeframe,
+                count,
+                from_time,
+                to_time,
             )
+
+        try:
+            return self.primary.fetch_candles(symbol, timeframe, count, from_time, to_time)
         except Exception as e:
             if self.secondary is None:
                 raise
 
-            primary_name = self.primary.__class__.__name__
-            warning_msg = (
-                f"{primary_name} failed: {e}. Falling back to {self.secondary.__class__.__name__}."
-            )
-            warnings.warn(warning_msg, UserWarning, stacklevel=2)
+            self._warn_primary_failed(self.secondary, e)
 
             try:
-                return self.secondary.fetch_candles(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    count=count,
-                    from_time=from_time,
-                    to_time=to_time,
-                )
+                return self.secondary.fetch_candles(symbol, timeframe, count, from_time, to_time)
             except Exception as secondary_error:
-                secondary_name = self.secondary.__class__.__name__
-                raise RuntimeError(
-                    f"Both providers failed. Primary ({primary_name}): {e}. "
-                    f"Secondary ({secondary_name}): {secondary_error}."
-                ) from secondary_error
+                raise self._both_failed(self.secondary, e, secondary_error) from secondary_error
+
+    def _fetch_hedged(
+        self,
+        secondary: MarketDataProvider,
+        hedge_delay_seconds: float,
+        symbol: str,
+        timeframe: Timeframe,
+        count: int,
+        from_time: datetime | None,
+        to_time: datetime | None,
+    ) -> list[Candle]:
+        """
+        Give the primary a head start of hedge_delay_seconds, then race the
+        secondary against it. The first successful result wins; the primary is
+        preferred when both are ready.
+
+        Each call gets its own two-worker executor, so a request that hangs
+        never queues later fetches behind it. The losing request is abandoned,
+        not interrupted: it runs to completion in the background (still
+        spending that provider's rate-limit budget) and its result is discarded.
+        """
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="market-data-hedge")
+        try:
+            primary_future = executor.submit(
+                self.primary.fetch_candles, symbol, timeframe, count, from_time, to_time
+            )
+            wait([primary_future], timeout=hedge_delay_seconds)
+            if primary_future.done() and primary_future.exception() is None:
+                return primary_future.result()
+
+            secondary_future = executor.submit(
+                secondary.fetch_candles, symbol, timeframe, count, from_time, to_time
+            )
+            wait([primary_future, secondary_future], return_when=FIRST_COMPLETED)
+            if primary_future.done() and primary_future.exception() is None:
+                return primary_future.result()
+            if secondary_future.done() and secondary_future.exception() is None:
+                return secondary_future.result()
+
+            # One side failed first; the other is the only remaining chance.
+            wait([primary_future, secondary_future])
+        finally:
+            executor.shutdown(wait=False)
+
+        primary_error = primary_future.exception()
+        if primary_error is None:
+            return primary_future.result()
+        self._warn_primary_failed(secondary, primary_error)
+
+        secondary_error = secondary_future.exception()
+        if secondary_error is None:
+            return secondary_future.result()
+        raise self._both_failed(secondary, primary_error, secondary_error) from secondary_error
+
+    def close(self) -> None:
+        """Close both wrapped providers."""
+        self.primary.close()
+        if self.secondary is not None:
+            self.secondary.close()
+
+    def _warn_primary_failed(self, secondary: MarketDataProvider, error: BaseException) -> None:
+        warning_msg = (
+            f"{self.primary.__class__.__name__} failed: {error}. "
+            f"Falling back to {secondary.__class__.__name__}."
+        )
+        warnings.warn(warning_msg, UserWarning, stacklevel=3)
+
+    def _both_failed(
+        self,
+        secondary: MarketDataProvider,
+        primary_error: BaseException,
+        secondary_error: BaseException,
+    ) -> RuntimeError:
+        return RuntimeError(
+            f"Both providers failed. Primary ({self.primary.__class__.__name__}): "
+            f"{primary_error}. Secondary ({secondary.__class__.__name__}): {secondary_error}."
+        )
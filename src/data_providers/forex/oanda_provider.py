@@ -1,31 +1,67 @@
+import threading
+import time
 from datetime import datetime
+from typing import Any
 
 import httpx
+import numpy as np
+import orjson
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
 from src.core.models.timeframe import Timeframe
 from src.core.ports.market_data_provider import MarketDataProvider
+from src.utils.http_client import HttpClientOwner
+from src.utils.rate_limiter import RateLimiter
 from src.utils.retry import retry_network_call
 
-
-class OandaProvider(MarketDataProvider):
+# Candles only change at bar close, so repeated reads within a quarter of a bar
+# are served from memory instead of another round trip.
+_CANDLES_CACHE_TTL_SECONDS: dict[Timeframe, float] = {
+    Timeframe.M1: 15.0,
+    Timeframe.M5: 75.0,
+    Timeframe.M15: 225.0,
+    Timeframe.H1: 900.0,
+    Timeframe.D1: 21600.0,
+}
+_CANDLES_CACHE_MAX_ENTRIES = 128
+
+_OANDA_GRANULARITIES: dict[Timeframe, str] = {
+    Timeframe.M1: "M1",
+    Timeframe.M5: "M5",
+    Timeframe.M15: "M15",
+    Timeframe.H1: "H1",
+    Timeframe.D1: "D",
+}
+
+# OANDA allows 30 requests per second per IP, so the budget is shared by every
+# provider instance in the process.
+_OANDA_RATE_LIMITER = RateLimiter(rate=30, period=1.0)
+
+_CandlesCacheKey = tuple[str, Timeframe, int, datetime | None, datetime | None]
+
+
+class OandaProvider(HttpClientOwner, MarketDataProvider):
     def __init__(self, api_key: str, base_url: str) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.client = httpx.Client(
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=32,
+                keepalive_expiry=60.0,
+            ),
             headers={"Authorization": f"Bearer {api_key}"},
+            # Concurrent requests share one multiplexed connection; httpx falls
+            # back to HTTP/1.1 when the server does not negotiate h2.
+            http2=True,
         )
+        self._own_client(self.client)
+        self._candles_cache: dict[_CandlesCacheKey, tuple[float, list[Candle]]] = {}
+        self._candles_cache_lock = threading.Lock()
 
     def _convert_timeframe_to_oanda(self, timeframe: Timeframe) -> str:
-        mapping = {
-            Timeframe.M1: "M1",
-            Timeframe.M5: "M5",
-            Timeframe.M15: "M15",
-            Timeframe.H1: "H1",
-            Timeframe.D1: "D",
-        }
-        return mapping[timeframe]
+        return _OANDA_GRANULARITIES[timeframe]
 
     def _format_datetime_for_oanda(self, dt: datetime) -> str:
         return dt.strftime("%Y-%m-%dT%H:%M:%S.000000000Z")
@@ -38,7 +74,6 @@ class OandaProvider(MarketDataProvider):
             return f"{symbol_upper[:3]}_{symbol_upper[3:]}"
         return symbol_upper
 
-    @retry_network_call
     def fetch_candles(
         self,
         symbol: str,
@@ -47,6 +82,113 @@ class OandaProvider(MarketDataProvider):
         from_time: datetime | None = None,
         to_time: datetime | None = None,
     ) -> list[Candle]:
+        cache_key: _CandlesCacheKey = (symbol, timeframe, count, from_time, to_time)
+        now = time.monotonic()
+
+        with self._candles_cache_lock:
+            cached = self._candles_cache.get(cache_key)
+            if cached is not None:
+                expires_at, cached_candles = cached
+                if now < expires_at:
+                    return list(cached_candles)
+                del self._candles_cache[cache_key]
+
+        candles = self._request_candles(symbol, timeframe, count, from_time, to_time)
+
+        ttl = _CANDLES_CACHE_TTL_SECONDS.get(timeframe, 0.0)
+        if ttl > 0:
+            with self._candles_cache_lock:
+                if len(self._candles_cache) >= _CANDLES_CACHE_MAX_ENTRIES:
+                    self._candles_cache.pop(next(iter(self._candles_cache)))
+                self._candles_cache[cache_key] = (now + ttl, candles)
+
+        return list(candles)
+
+    def fetch_candles_columnar(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        count: int,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None,
+    ) -> CandleArrays:
+        """
+        Fetch candles straight into contiguous NumPy columns.
+
+        Skips the per-bar Candle objects entirely; intended for callers that
+        feed the series into vectorized indicator code.
+        """
+        candles_data = self._request_candles_data(symbol, timeframe, count, from_time, to_time)
+        size = len(candles_data)
+
+        open_prices = np.empty(size, dtype=np.float64)
+        high_prices = np.empty(size, dtype=np.float64)
+        low_prices = np.empty(size, dtype=np.float64)
+        close_prices = np.empty(size, dtype=np.float64)
+        volumes = np.empty(size, dtype=np.float64)
+
+        for index, candle_data in enumerate(candles_data):
+            mid = candle_data["mid"]
+            open_prices[index] = float(mid["o"])
+            high_prices[index] = float(mid["h"])
+            low_prices[index] = float(mid["l"])
+            close_prices[index] = float(mid["c"])
+            volumes[index] = float(candle_data.get("volume", 0))
+
+        # OANDA times are RFC 3339 UTC with a trailing "Z", which numpy parses once
+        # the zone designator is dropped.
+        timestamps = np.array(
+            [candle_data["time"].rstrip("Z") for candle_data in candles_data],
+            dtype="datetime64[ns]",
+        )
+
+        return CandleArrays(
+            timestamp=timestamps,
+            open=open_prices,
+            high=high_prices,
+            low=low_prices,
+            close=close_prices,
+            volume=volumes,
+        )
+
+    def _request_candles(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        count: int,
+        from_time: datetime | None,
+        to_time: datetime | None,
+    ) -> list[Candle]:
+        candles_data = self._request_candles_data(symbol, timeframe, count, from_time, to_time)
+
+        candles: list[Candle] = []
+        for candle_data in candles_data:
+            mid = candle_data["mid"]
+            timestamp = datetime.fromisoformat(candle_data["time"].replace("Z", "+00:00"))
+
+            candles.append(
+                Candle(
+                    timestamp=timestamp,
+                    open=float(mid["o"]),
+                    high=float(mid["h"]),
+                    low=float(mid["l"]),
+                    close=float(mid["c"]),
+                    volume=float(candle_data.get("volume", 0)),
+                )
+            )
+
+        return candles
+
+    @retry_network_call(retry_on_status=True)
+    def _request_candles_data(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        count: int,
+        from_time: datetime | None,
+        to_time: datetime | None,
+    ) -> list[dict[str, Any]]:
+        """Return the complete candles from the OANDA response, in API order."""
         oanda_symbol = self._convert_symbol_to_oanda(symbol)
         oanda_timeframe = self._convert_timeframe_to_oanda(timeframe)
         url = f"{self.base_url}/v3/instruments/{oanda_symbol}/candles"
@@ -61,52 +203,30 @@ class OandaProvider(MarketDataProvider):
         if to_time is not None:
             params["to"] = self._format_datetime_for_oanda(to_time)
 
+        _OANDA_RATE_LIMITER.acquire()
         response = self.client.get(url, params=params)
 
         if response.status_code == 400:
-            error_data = (
-                response.json()
-                if response.headers.get("content-type", "").startswith("application/json")
-                else {}
+            try:
+                error_data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                error_data = {}
+            error_message = (
+                error_data.get("errorMessage", "Bad Request")
+                if isinstance(error_data, dict)
+                else "Bad Request"
             )
-            error_message = error_data.get("errorMessage", "Bad Request")
             raise ValueError(
                 f"OANDA API error: {error_message}. Symbol: {symbol} -> {oanda_symbol}"
             )
 
         response.raise_for_status()
 
-        data = response.json()
-        candles_data = data.get("candles", [])
-
-        candles: list[Candle] = []
-        for candle_data in candles_data:
-            if not candle_data.get("complete", False):
-                continue
-
-            mid = candle_data.get("mid")
-            if mid is None:
-                continue
-
-            time_str = candle_data.get("time")
-            if time_str is None:
-                continue
-
-            timestamp = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-
-            candles.append(
-                Candle(
-                    timestamp=timestamp,
-                    open=float(mid["o"]),
-                    high=float(mid["h"]),
-                    low=float(mid["l"]),
-                    close=float(mid["c"]),
-                    volume=float(candle_data.get("volume", 0)),
-                )
-            )
-
-        return candles
-
-    def __del__(self) -> None:
-        if hasattr(self, "client"):
-            self.client.close()
+        data = orjson.loads(response.content)
+        return [
+            candle_data
+            for candle_data in data.get("candles", [])
+            if candle_data.get("complete", False)
+            and candle_data.get("mid") is not None
+            and candle_data.get("time") is not None
+        ]
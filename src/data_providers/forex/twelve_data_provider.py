@@ -1,39 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 
 import httpx
 
 from src.core.models.candle import Candle
 from src.core.models.timeframe import Timeframe
 from src.core.ports.market_data_provider import MarketDataProvider
+from src.data_providers.cache import CandleFileCache
+from src.utils.http_client import HttpClientOwner
 from src.utils.retry import retry_network_call
 
+_TWELVE_DATA_INTERVALS: dict[Timeframe, str] = {
+    Timeframe.M1: "1min",
+    Timeframe.M5: "5min",
+    Timeframe.M15: "15min",
+    Timeframe.H1: "1h",
+    Timeframe.D1: "1day",
+}
 
-class TwelveDataProvider(MarketDataProvider):
-    def __init__(self, api_key: str, base_url: str, timeout: float = 30.0) -> None:
+
+class TwelveDataProvider(HttpClientOwner, MarketDataProvider):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: float = 30.0,
+        cache: CandleFileCache | None = None,
+    ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+        self.cache = cache
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=32,
+                keepalive_expiry=60.0,
+            ),
+            headers={"Accept": "application/json"},
+            # httpx falls back to HTTP/1.1 when the server does not negotiate h2.
+            http2=True,
+        )
+        self._own_client(self.client)
 
     def _convert_symbol_to_twelve_data(self, symbol: str) -> str:
-        symbol_upper = symbol.upper().strip()
-        if "/" in symbol_upper:
-            return symbol_upper
-        if len(symbol_upper) == 6:
-            return f"{symbol_upper[:3]}/{symbol_upper[3:]}"
-        return symbol_upper.replace("_", "/")
+        return _symbol_to_twelve_data(symbol)
 
     def _convert_timeframe_to_twelve_data(self, timeframe: Timeframe) -> str:
-        mapping = {
-            Timeframe.M1: "1min",
-            Timeframe.M5: "5min",
-            Timeframe.M15: "15min",
-            Timeframe.H1: "1h",
-            Timeframe.D1: "1day",
-        }
-        return mapping[timeframe]
+        return _TWELVE_DATA_INTERVALS[timeframe]
 
-    @retry_network_call
     def fetch_candles(
         self,
         symbol: str,
@@ -42,14 +60,9 @@ class TwelveDataProvider(MarketDataProvider):
         from_time: datetime | None = None,
         to_time: datetime | None = None,
     ) -> list[Candle]:
-        twelve_data_symbol = self._convert_symbol_to_twelve_data(symbol)
-        twelve_data_interval = self._convert_timeframe_to_twelve_data(timeframe)
-        url = f"{self.base_url}/time_series"
-
         params: dict[str, str | int] = {
-            "symbol": twelve_data_symbol,
-            "interval": twelve_data_interval,
-            "apikey": self.api_key,
+            "symbol": self._convert_symbol_to_twelve_data(symbol),
+            "interval": self._convert_timeframe_to_twelve_data(timeframe),
             "outputsize": count,
         }
 
@@ -58,7 +71,50 @@ class TwelveDataProvider(MarketDataProvider):
         if to_time is not None:
             params["end_date"] = to_time.strftime("%Y-%m-%d %H:%M:%S")
 
-        response = self.client.get(url, params=params)
+        if self.cache is not None:
+            cached_candles = self.cache.get(symbol, timeframe, params)
+            if cached_candles is not None:
+                return cached_candles
+
+        candles: list[Candle] = self._request_candles(params)
+
+        if self.cache is not None:
+            self.cache.put(symbol, timeframe, params, candles)
+
+        return candles
+
+    def fetch_candles_batch(
+        self,
+        requests: list[tuple[str, Timeframe, int]],
+        max_concurrency: int = 8,
+    ) -> list[list[Candle] | Exception]:
+        """
+        Fetch several (symbol, timeframe, count) windows concurrently.
+
+        Results come back in request order; a request that fails yields its
+        exception in place so one bad symbol does not discard the others.
+        Requests share the pooled client, and at most max_concurrency of them
+        are in flight at once.
+        """
+        if len(requests) <= 1 or max_concurrency <= 1:
+            return [self._fetch_candles_or_error(request) for request in requests]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as executor:
+            return list(executor.map(self._fetch_candles_or_error, requests))
+
+    def _fetch_candles_or_error(
+        self, request: tuple[str, Timeframe, int]
+    ) -> list[Candle] | Exception:
+        symbol, timeframe, count = request
+        try:
+            return self.fetch_candles(symbol=symbol, timeframe=timeframe, count=count)
+        except Exception as error:
+            return error
+
+    @retry_network_call
+    def _request_candles(self, params: dict[str, str | int]) -> list[Candle]:
+        url = f"{self.base_url}/time_series"
+        response = self.client.get(url, params={**params, "apikey": self.api_key})
         response.raise_for_status()
 
         data = response.json()
@@ -76,13 +132,17 @@ class TwelveDataProvider(MarketDataProvider):
             return []
 
         candles: list[Candle] = []
+        newest_first = True
+        previous_timestamp: datetime | None = None
         for value in values:
             try:
                 timestamp_str = value.get("datetime", "")
                 if not timestamp_str:
                     continue
 
-                timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+                # fromisoformat is C-implemented and accepts both the intraday
+                # "YYYY-MM-DD HH:MM:SS" and the daily "YYYY-MM-DD" formats.
+                timestamp = datetime.fromisoformat(timestamp_str)
 
                 open_price = float(value.get("open", 0))
                 high_price = float(value.get("high", 0))
@@ -100,13 +160,27 @@ class TwelveDataProvider(MarketDataProvider):
                         volume=volume,
                     )
                 )
+                if previous_timestamp is not None and timestamp >= previous_timestamp:
+                    newest_first = False
+                previous_timestamp = timestamp
             except (ValueError, KeyError, TypeError):
                 continue
 
-        candles.sort(key=lambda c: c.timestamp)
+        # TwelveData returns newest-first, so a strictly descending series only
+        # needs reversing; anything else falls back to a stable sort.
+        if newest_first:
+            candles.reverse()
+        else:
+            candles.sort(key=attrgetter("timestamp"))
 
         return candles
 
-    def __del__(self) -> None:
-        if hasattr(self, "client"):
-            self.client.close()
+
+@lru_cache(maxsize=512)
+def _symbol_to_twelve_data(symbol: str) -> str:
+    symbol_upper = symbol.upper().strip()
+    if "/" in symbol_upper:
+        return symbol_upper
+    if len(symbol_upper) == 6:
+        return f"{symbol_upper[:3]}/{symbol_upper[3:]}"
+    return symbol_upper.replace("_", "/")
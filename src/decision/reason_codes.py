@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import math
-
 from src.app.settings import Settings
-from src.decision.scoring import DecisionScores
+from src.decision.scoring import DecisionScores, ParsedIndicators, parse_indicators
 
 CONFLICT_TREND_STRUCTURE = "CONFLICT_TREND_STRUCTURE"
 NO_FRESH_CROSSOVER = "NO_FRESH_CROSSOVER"
@@ -14,6 +12,17 @@ RANGE_STRUCTURE = "RANGE_STRUCTURE"
 PARSING_FAILED = "PARSING_FAILED"
 INSUFFICIENT_DATA = "INSUFFICIENT_DATA"
 
+_UNUSABLE_VALIDATION_STATUSES = frozenset({"DEGRADED", "INVALID"})
+_UNUSABLE_VALIDATION_SUFFIXES = (".DEGRADED", ".INVALID")
+
+_CROSSOVER_DIRECTIONS = {
+    "GOLDEN": "BULLISH",
+    "DEATH": "BEARISH",
+    "BULLISH": "BULLISH",
+    "BEARISH": "BEARISH",
+    "NONE": "NONE",
+}
+
 
 def build_reason_codes(
     indicators: dict[str, object],
@@ -22,69 +31,35 @@ def build_reason_codes(
 ) -> list[str]:
     _ = scores
 
+    parsed = parse_indicators(indicators)
+    # Each check below emits a distinct code at most once, so appending in
+    # order already yields a duplicate-free, deterministic list.
     reason_codes: list[str] = []
 
-    if _is_low_volatility_no_squeeze(indicators, settings):
-        _append_once(reason_codes, LOW_VOLATILITY_NO_SQUEEZE)
+    if _is_low_volatility_no_squeeze(parsed, settings):
+        reason_codes.append(LOW_VOLATILITY_NO_SQUEEZE)
 
-    if _is_no_fresh_crossover(indicators, settings):
-        _append_once(reason_codes, NO_FRESH_CROSSOVER)
+    if _is_no_fresh_crossover(parsed, settings):
+        reason_codes.append(NO_FRESH_CROSSOVER)
 
-    if _is_weak_momentum(indicators):
-        _append_once(reason_codes, WEAK_MOMENTUM)
+    if _is_weak_momentum(parsed):
+        reason_codes.append(WEAK_MOMENTUM)
 
-    if _get_str(indicators, "structure") == "RANGE":
-        _append_once(reason_codes, RANGE_STRUCTURE)
+    if parsed.structure == "RANGE":
+        reason_codes.append(RANGE_STRUCTURE)
 
-    if _is_insufficient_data(indicators):
-        _append_once(reason_codes, INSUFFICIENT_DATA)
+    if _is_insufficient_data(parsed):
+        reason_codes.append(INSUFFICIENT_DATA)
 
-    if _detect_conflict_trend_structure(indicators):
-        _append_once(reason_codes, CONFLICT_TREND_STRUCTURE)
+    if _detect_conflict_trend_structure(parsed):
+        reason_codes.append(CONFLICT_TREND_STRUCTURE)
 
     return reason_codes
 
 
-def _append_once(reason_codes: list[str], code: str) -> None:
-    if code in reason_codes:
-        return
-    reason_codes.append(code)
-
-
-def _get_str(indicators: dict[str, object], key: str) -> str | None:
-    value = indicators.get(key)
-    if not isinstance(value, str):
-        return None
-    return value.strip().upper()
-
-
-def _get_float(indicators: dict[str, object], key: str) -> float | None:
-    value = indicators.get(key)
-    if value is None:
-        return None
-
-    if isinstance(value, bool):
-        return float(value)
-
-    if isinstance(value, (int, float)):
-        as_float = float(value)
-        if math.isnan(as_float) or math.isinf(as_float):
-            return None
-        return as_float
-
-    try:
-        as_float = float(value)  # type: ignore[arg-type]
-    except Exception:
-        return None
-
-    if math.isnan(as_float) or math.isinf(as_float):
-        return None
-    return as_float
-
-
-def _is_low_volatility_no_squeeze(indicators: dict[str, object], settings: Settings | None) -> bool:
-    atr_pct = _get_float(indicators, "atr_pct")
-    bb_squeeze_flag = _get_float(indicators, "bb_squeeze_flag")
+def _is_low_volatility_no_squeeze(parsed: ParsedIndicators, settings: Settings | None) -> bool:
+    atr_pct = parsed.atr_pct
+    bb_squeeze_flag = parsed.bb_squeeze_flag
     if atr_pct is None or bb_squeeze_flag is None:
         return False
     threshold = float(settings.decision_atr_pct_low_threshold) if settings else 0.08
@@ -92,14 +67,10 @@ def _is_low_volatility_no_squeeze(indicators: dict[str, object], settings: Setti
 
 
 def _has_fresh_crossover(
-    indicators: dict[str, object],
-    type_key: str,
-    age_key: str,
+    crossover_type: str | None,
+    age_bars: float | None,
     settings: Settings | None,
 ) -> bool:
-    crossover_type = _get_str(indicators, type_key)
-    age_bars = _get_float(indicators, age_key)
-
     if crossover_type is None:
         return False
     if crossover_type == "NONE":
@@ -110,25 +81,23 @@ def _has_fresh_crossover(
     return age_bars <= max_age
 
 
-def _is_no_fresh_crossover(indicators: dict[str, object], settings: Settings | None) -> bool:
+def _is_no_fresh_crossover(parsed: ParsedIndicators, settings: Settings | None) -> bool:
     ema_fresh = _has_fresh_crossover(
-        indicators,
-        type_key="ema9_sma50_crossover_type",
-        age_key="ema9_sma50_crossover_age_bars",
+        parsed.ema9_sma50_crossover_type,
+        parsed.ema9_sma50_crossover_age_bars,
         settings=settings,
     )
     sma_fresh = _has_fresh_crossover(
-        indicators,
-        type_key="sma50_sma200_crossover_type",
-        age_key="sma50_sma200_crossover_age_bars",
+        parsed.sma50_sma200_crossover_type,
+        parsed.sma50_sma200_crossover_age_bars,
         settings=settings,
     )
     return not ema_fresh and not sma_fresh
 
 
-def _is_weak_momentum(indicators: dict[str, object]) -> bool:
-    roc_5 = _get_float(indicators, "roc_5")
-    roc_20 = _get_float(indicators, "roc_20")
+def _is_weak_momentum(parsed: ParsedIndicators) -> bool:
+    roc_5 = parsed.roc_5
+    roc_20 = parsed.roc_20
     if roc_5 is None or roc_20 is None:
         return True
     return abs(roc_5) < 0.02 and abs(roc_20) < 0.05
@@ -138,23 +107,14 @@ def _normalize_crossover_direction(value: str | None) -> str | None:
     """Map GOLDEN/DEATH to BULLISH/BEARISH for consistent comparison."""
     if value is None:
         return None
-    u = value.strip().upper()
-    if u == "GOLDEN":
-        return "BULLISH"
-    if u == "DEATH":
-        return "BEARISH"
-    return u if u in ("BULLISH", "BEARISH", "NONE") else None
-
-
-def _detect_conflict_trend_structure(indicators: dict[str, object]) -> bool:
-    trend = _get_str(indicators, "trend_direction")
-    ema_type = _normalize_crossover_direction(
-        _get_str(indicators, "ema9_sma50_crossover_type") or ""
-    )
-    sma_type = _normalize_crossover_direction(
-        _get_str(indicators, "sma50_sma200_crossover_type") or ""
-    )
-    structure = _get_str(indicators, "structure")
+    return _CROSSOVER_DIRECTIONS.get(value.strip().upper())
+
+
+def _detect_conflict_trend_structure(parsed: ParsedIndicators) -> bool:
+    trend = parsed.trend_direction
+    ema_type = _normalize_crossover_direction(parsed.ema9_sma50_crossover_type or "")
+    sma_type = _normalize_crossover_direction(parsed.sma50_sma200_crossover_type or "")
+    structure = parsed.structure
 
     if (
         trend
@@ -198,20 +158,13 @@ def _detect_conflict_trend_structure(indicators: dict[str, object]) -> bool:
     )
 
 
-def _is_insufficient_data(indicators: dict[str, object]) -> bool:
-    candle_count_used = _get_float(indicators, "candle_count_used")
+def _is_insufficient_data(parsed: ParsedIndicators) -> bool:
+    candle_count_used = parsed.candle_count_used
     if candle_count_used is not None and candle_count_used < 200.0:
         return True
 
-    validation_status = indicators.get("validation_status")
-    if isinstance(validation_status, str):
-        status_text = validation_status.strip().upper()
-    else:
-        status_text = (
-            str(validation_status).strip().upper() if validation_status is not None else ""
-        )
-
-    if status_text in {"DEGRADED", "INVALID"}:
+    status_text = parsed.validation_status
+    if status_text in _UNUSABLE_VALIDATION_STATUSES:
         return True
 
-    return status_text.endswith(".DEGRADED") or status_text.endswith(".INVALID")
+    return status_text.endswith(_UNUSABLE_VALIDATION_SUFFIXES)
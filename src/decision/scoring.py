@@ -6,18 +6,83 @@ from dataclasses import dataclass
 from src.app.settings import Settings
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class DecisionScores:
     bull_score: float
     bear_score: float
     no_trade_score: float
 
 
+@dataclass(slots=True, frozen=True)
+class ParsedIndicators:
+    """Decision inputs read and normalized once from the indicator dicts."""
+
+    trend_direction: str | None
+    trend_strength: float | None
+    structure: str | None
+    dist_sma200_pct: float | None
+    ema9_sma50_crossover_type: str | None
+    ema9_sma50_crossover_age_bars: float | None
+    sma50_sma200_crossover_type: str | None
+    sma50_sma200_crossover_age_bars: float | None
+    roc_5: float | None
+    roc_20: float | None
+    rsi_delta_1: float | None
+    rsi_delta_5: float | None
+    atr_pct: float | None
+    bb_squeeze_flag: float | None
+    candle_count_used: float | None
+    validation_status: str
+
+
+def parse_indicators(
+    indicators: dict[str, object],
+    technical_analysis: dict[str, object] | None = None,
+) -> ParsedIndicators:
+    """
+    Read every decision input in one pass.
+
+    Strings are stripped and upper-cased, numbers become finite floats (or
+    None), and keys missing from indicators fall back to technical_analysis.
+    """
+    validation_status = _get_value(indicators, technical_analysis, "validation_status")
+    return ParsedIndicators(
+        trend_direction=_get_str(indicators, technical_analysis, "trend_direction"),
+        trend_strength=_get_float(indicators, technical_analysis, "trend_strength"),
+        structure=_get_str(indicators, technical_analysis, "structure"),
+        dist_sma200_pct=_get_float(indicators, technical_analysis, "dist_sma200_pct"),
+        ema9_sma50_crossover_type=_get_str(
+            indicators, technical_analysis, "ema9_sma50_crossover_type"
+        ),
+        ema9_sma50_crossover_age_bars=_get_float(
+            indicators, technical_analysis, "ema9_sma50_crossover_age_bars"
+        ),
+        sma50_sma200_crossover_type=_get_str(
+            indicators, technical_analysis, "sma50_sma200_crossover_type"
+        ),
+        sma50_sma200_crossover_age_bars=_get_float(
+            indicators, technical_analysis, "sma50_sma200_crossover_age_bars"
+        ),
+        roc_5=_get_float(indicators, technical_analysis, "roc_5"),
+        roc_20=_get_float(indicators, technical_analysis, "roc_20"),
+        rsi_delta_1=_get_float(indicators, technical_analysis, "rsi_delta_1"),
+        rsi_delta_5=_get_float(indicators, technical_analysis, "rsi_delta_5"),
+        atr_pct=_get_float(indicators, technical_analysis, "atr_pct"),
+        bb_squeeze_flag=_get_float(indicators, technical_analysis, "bb_squeeze_flag"),
+        candle_count_used=_get_float(indicators, technical_analysis, "candle_count_used"),
+        validation_status=(
+            str(validation_status).strip().upper() if validation_status is not None else ""
+        ),
+    )
+
+
 def calculate_scores(
     indicators: dict[str, object],
     technical_analysis: dict[str, object] | None = None,
     settings: Settings | None = None,
 ) -> DecisionScores:
+    parsed = parse_indicators(indicators, technical_analysis)
+
     bull_score = 0.0
     bear_score = 0.0
     no_trade_score = 0.0
@@ -25,18 +90,17 @@ def calculate_scores(
     crossover_max_age = float(settings.decision_crossover_max_age_bars) if settings else 10.0
     atr_low_threshold = float(settings.decision_atr_pct_low_threshold) if settings else 0.08
 
-    trend_direction = _get_str(indicators, technical_analysis, "trend_direction")
-    trend_strength = _get_float(indicators, technical_analysis, "trend_strength")
+    trend_direction = parsed.trend_direction
     if trend_direction == "BULLISH":
         bull_score += 20.0
-        bull_score += _cap(_safe_non_negative(trend_strength) * 0.2, cap=20.0)
+        bull_score += _cap(_safe_non_negative(parsed.trend_strength) * 0.2, cap=20.0)
     elif trend_direction == "BEARISH":
         bear_score += 20.0
-        bear_score += _cap(_safe_non_negative(trend_strength) * 0.2, cap=20.0)
+        bear_score += _cap(_safe_non_negative(parsed.trend_strength) * 0.2, cap=20.0)
     elif trend_direction == "NEUTRAL":
         no_trade_score += 10.0
 
-    structure = _get_str(indicators, technical_analysis, "structure")
+    structure = parsed.structure
     if structure == "BULLISH":
         bull_score += 15.0
     elif structure == "BEARISH":
@@ -44,23 +108,15 @@ def calculate_scores(
     elif structure == "RANGE":
         no_trade_score += 10.0
 
-    dist_sma200_pct = _get_float(indicators, technical_analysis, "dist_sma200_pct")
+    dist_sma200_pct = parsed.dist_sma200_pct
     if dist_sma200_pct is not None:
         if dist_sma200_pct > 0.0:
             bull_score += 10.0
         else:
             bear_score += 10.0
 
-    ema9_sma50_crossover_type = _get_str(
-        indicators,
-        technical_analysis,
-        "ema9_sma50_crossover_type",
-    )
-    ema9_sma50_crossover_age_bars = _get_float(
-        indicators,
-        technical_analysis,
-        "ema9_sma50_crossover_age_bars",
-    )
+    ema9_sma50_crossover_type = parsed.ema9_sma50_crossover_type
+    ema9_sma50_crossover_age_bars = parsed.ema9_sma50_crossover_age_bars
     if ema9_sma50_crossover_type == "NONE":
         no_trade_score += 5.0
     elif (
@@ -76,15 +132,15 @@ def calculate_scores(
     ):
         bear_score += 10.0
 
-    roc_5 = _get_float(indicators, technical_analysis, "roc_5")
+    roc_5 = parsed.roc_5
     if roc_5 is not None:
         if roc_5 > 0.0:
             bull_score += 5.0
         elif roc_5 < 0.0:
             bear_score += 5.0
 
-    rsi_delta_1 = _get_float(indicators, technical_analysis, "rsi_delta_1")
-    rsi_delta_5 = _get_float(indicators, technical_analysis, "rsi_delta_5")
+    rsi_delta_1 = parsed.rsi_delta_1
+    rsi_delta_5 = parsed.rsi_delta_5
     if rsi_delta_1 is not None and rsi_delta_5 is not None:
         if rsi_delta_1 > 0.0 and rsi_delta_5 > 0.0:
             bull_score += 5.0
@@ -93,8 +149,8 @@ def calculate_scores(
         else:
             no_trade_score += 5.0
 
-    atr_pct = _get_float(indicators, technical_analysis, "atr_pct")
-    bb_squeeze_flag = _get_float(indicators, technical_analysis, "bb_squeeze_flag")
+    atr_pct = parsed.atr_pct
+    bb_squeeze_flag = parsed.bb_squeeze_flag
     if (
         atr_pct is not None
         and bb_squeeze_flag is not None
@@ -144,23 +200,25 @@ def _get_float(
     if value is None:
         return None
 
+    # Exact-type checks first: indicator values are almost always plain floats.
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if type(value) is int:
+        return float(value)
+
     if isinstance(value, bool):
         return float(value)
 
     if isinstance(value, (int, float)):
         as_float = float(value)
-        if math.isnan(as_float) or math.isinf(as_float):
-            return None
-        return as_float
+        return as_float if math.isfinite(as_float) else None
 
     try:
         as_float = float(value)  # type: ignore[arg-type]
     except Exception:
         return None
 
-    if math.isnan(as_float) or math.isinf(as_float):
-        return None
-    return as_float
+    return as_float if math.isfinite(as_float) else None
 
 
 def _safe_non_negative(value: float | None) -> float:
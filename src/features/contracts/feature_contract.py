@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
-from src.core.models.candle import Candle
+import numpy as np
+
+from src.core.models.candle import Candle, CandleArrays
+
+_MISSING: Any = object()
 
 
 class ValidationStatus(str, Enum):
@@ -13,7 +19,7 @@ class ValidationStatus(str, Enum):
     INVALID = "INVALID"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     status: ValidationStatus
     reasons: list[str]
@@ -24,7 +30,20 @@ class ValidationResult:
 
 class FeatureContract:
     @staticmethod
-    def validate(candles: list[Candle], min_count: int = 200) -> ValidationResult:
+    def validate(
+        candles: list[Candle] | CandleArrays, min_count: int = 200, fail_fast: bool = False
+    ) -> ValidationResult:
+        """
+        Check candles against the feature contract.
+
+        CandleArrays input is checked with whole-column NumPy reductions; a
+        candle list is walked once and may hold objects missing timestamp or
+        volume attributes.
+
+        With fail_fast=True (for backtests replaying many windows) validation
+        stops at the first INVALID finding; the result then carries only the
+        reasons found so far and no degraded checks.
+        """
         candle_count = len(candles)
         invalid_reasons: list[str] = []
         degraded_reasons: list[str] = []
@@ -73,32 +92,112 @@ class FeatureContract:
                 degraded_flags=degraded_flags,
             )
 
+        if fail_fast and invalid_reasons:
+            return ValidationResult(
+                status=ValidationStatus.INVALID,
+                reasons=invalid_reasons,
+                candle_count=candle_count,
+                missing_fields=missing_fields,
+                degraded_flags=degraded_flags,
+            )
+
         has_non_positive_prices = False
         has_high_less_than_low = False
         has_open_outside_range = False
         has_close_outside_range = False
+        previous_timestamp: datetime | None = None
+        has_timestamp_attr = True
+        has_non_monotonic_timestamps = False
+        has_duplicate_timestamps = False
+        min_delta_seconds = math.inf
+        max_delta_seconds = 0.0
+        has_volume_attr = True
+        all_zero_volume = True
+
+        if isinstance(candles, CandleArrays):
+            (
+                has_non_positive_prices,
+                has_high_less_than_low,
+                has_open_outside_range,
+                has_close_outside_range,
+            ) = _price_faults(candles)
+
+            # The int64 view of the timestamps is nanoseconds since the epoch.
+            deltas = np.diff(candles.timestamp.view(np.int64))
+            has_non_monotonic_timestamps = bool((deltas < 0).any())
+            has_duplicate_timestamps = bool((deltas == 0).any())
+            positive_deltas = deltas[deltas > 0]
+            if positive_deltas.size:
+                min_delta_seconds = float(positive_deltas.min()) / 1e9
+                max_delta_seconds = float(positive_deltas.max()) / 1e9
+            all_zero_volume = not bool(candles.volume.any())
+        else:
+            # One pass gathers everything the price, timestamp and volume checks need.
+            for candle in candles:
+                try:
+                    open_price = float(candle.open)
+                    high_price = float(candle.high)
+                    low_price = float(candle.low)
+                    close_price = float(candle.close)
+                except Exception:
+                    has_non_positive_prices = True
+                else:
+                    if (
+                        open_price <= 0.0
+                        or high_price <= 0.0
+                        or low_price <= 0.0
+                        or close_price <= 0.0
+                    ):
+                        has_non_positive_prices = True
 
-        for candle in candles:
-            try:
-                open_price = float(candle.open)
-                high_price = float(candle.high)
-                low_price = float(candle.low)
-                close_price = float(candle.close)
-            except Exception:
-                has_non_positive_prices = True
-                continue
+                    if high_price < low_price:
+                        has_high_less_than_low = True
 
-            if open_price <= 0.0 or high_price <= 0.0 or low_price <= 0.0 or close_price <= 0.0:
-                has_non_positive_prices = True
+                    if open_price < low_price or open_price > high_price:
+                        has_open_outside_range = True
 
-            if high_price < low_price:
-                has_high_less_than_low = True
+                    if close_price < low_price or close_price > high_price:
+                        has_close_outside_range = True
 
-            if open_price < low_price or open_price > high_price:
-                has_open_outside_range = True
+                if fail_fast and (
+                    has_non_positive_prices
+                    or has_high_less_than_low
+                    or has_open_outside_range
+                    or has_close_outside_range
+                ):
+                    break
 
-            if close_price < low_price or close_price > high_price:
-                has_close_outside_range = True
+                if has_timestamp_attr:
+                    timestamp = getattr(candle, "timestamp", _MISSING)
+                    if timestamp is _MISSING:
+                        has_timestamp_attr = False
+                    elif not has_non_monotonic_timestamps:
+                        if previous_timestamp is not None:
+                            if timestamp < previous_timestamp:
+                                has_non_monotonic_timestamps = True
+                            else:
+                                delta_seconds = (timestamp - previous_timestamp).total_seconds()
+                                if delta_seconds > 0.0:
+                                    if delta_seconds < min_delta_seconds:
+                                        min_delta_seconds = delta_seconds
+                                    if delta_seconds > max_delta_seconds:
+                                        max_delta_seconds = delta_seconds
+                                else:
+                                    # Sorted input keeps equal timestamps adjacent.
+                                    has_duplicate_timestamps = True
+                        previous_timestamp = timestamp
+
+                if has_volume_attr:
+                    volume_value = getattr(candle, "volume", _MISSING)
+                    if volume_value is _MISSING:
+                        has_volume_attr = False
+                    elif all_zero_volume:
+                        try:
+                            volume = float(volume_value)
+                        except Exception:
+                            volume = 0.0
+                        if volume != 0.0:
+                            all_zero_volume = False
 
         if has_non_positive_prices:
             invalid_reasons.append("non_positive_prices")
@@ -109,67 +208,39 @@ class FeatureContract:
         if has_close_outside_range:
             invalid_reasons.append("close_outside_range")
 
-        timestamps: list[datetime] = []
-        has_timestamp_attr = True
-        for candle in candles:
-            if not hasattr(candle, "timestamp"):
-                has_timestamp_attr = False
-                break
-            timestamps.append(candle.timestamp)
-
-        if has_timestamp_attr and timestamps:
-            has_non_monotonic_timestamps = False
-            for idx in range(1, len(timestamps)):
-                if timestamps[idx] < timestamps[idx - 1]:
-                    has_non_monotonic_timestamps = True
-                    break
+        if fail_fast and invalid_reasons:
+            return ValidationResult(
+                status=ValidationStatus.INVALID,
+                reasons=invalid_reasons,
+                candle_count=candle_count,
+                missing_fields=missing_fields,
+                degraded_flags=degraded_flags,
+            )
 
+        if has_timestamp_attr:
             if has_non_monotonic_timestamps:
                 invalid_reasons.append("timestamps_not_monotonic_non_decreasing")
             else:
-                if len(set(timestamps)) < len(timestamps):
+                if has_duplicate_timestamps:
                     degraded_reasons.append("duplicate_timestamps")
                     degraded_flags.append("duplicate_timestamps")
 
-                positive_deltas_seconds: list[float] = []
-                for idx in range(1, len(timestamps)):
-                    delta_seconds = (timestamps[idx] - timestamps[idx - 1]).total_seconds()
-                    if delta_seconds > 0.0:
-                        positive_deltas_seconds.append(delta_seconds)
-
-                if positive_deltas_seconds:
-                    expected_step_seconds = min(positive_deltas_seconds)
-                    if expected_step_seconds > 0.0:
-                        has_gaps = False
-                        for delta_seconds in positive_deltas_seconds:
-                            if delta_seconds > expected_step_seconds * 1.5:
-                                has_gaps = True
-                                break
-                        if has_gaps:
-                            degraded_reasons.append("timestamp_gaps_detected")
-                            degraded_flags.append("timestamp_gaps_detected")
+                # min_delta_seconds stays inf when there is no positive delta.
+                if max_delta_seconds > min_delta_seconds * 1.5:
+                    degraded_reasons.append("timestamp_gaps_detected")
+                    degraded_flags.append("timestamp_gaps_detected")
         else:
             missing_fields.append("timestamp")
             degraded_flags.append("timestamp_missing")
             degraded_reasons.append("timestamp_missing")
 
-        if not all(hasattr(candle, "volume") for candle in candles):
+        if not has_volume_attr:
             missing_fields.append("volume")
             degraded_flags.append("volume_missing_or_all_zero")
             degraded_reasons.append("volume_missing_or_all_zero")
-        else:
-            all_zero_volume = True
-            for candle in candles:
-                try:
-                    volume = float(candle.volume)
-                except Exception:
-                    volume = 0.0
-                if volume != 0.0:
-                    all_zero_volume = False
-                    break
-            if all_zero_volume:
-                degraded_reasons.append("volume_missing_or_all_zero")
-                degraded_flags.append("volume_missing_or_all_zero")
+        elif all_zero_volume:
+            degraded_reasons.append("volume_missing_or_all_zero")
+            degraded_flags.append("volume_missing_or_all_zero")
 
         if invalid_reasons:
             return ValidationResult(
@@ -196,3 +267,21 @@ class FeatureContract:
             missing_fields=missing_fields,
             degraded_flags=degraded_flags,
         )
+
+
+def _price_faults(candles: CandleArrays) -> tuple[bool, bool, bool, bool]:
+    open_price = candles.open
+    high_price = candles.high
+    low_price = candles.low
+    close_price = candles.close
+    return (
+        bool(
+            (open_price <= 0.0).any()
+            or (high_price <= 0.0).any()
+            or (low_price <= 0.0).any()
+            or (close_price <= 0.0).any()
+        ),
+        bool((high_price < low_price).any()),
+        bool(((open_price < low_price) | (open_price > high_price)).any()),
+        bool(((close_price < low_price) | (close_price > high_price)).any()),
+    )
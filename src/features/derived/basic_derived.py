@@ -1,47 +1,64 @@
 from __future__ import annotations
 
-import pandas as pd
+import math
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
 
+_DEFAULT_OUTPUT: dict[str, float] = {
+    "price_change_pct_1": 0.0,
+    "price_change_pct_5": 0.0,
+    "price_change_pct_20": 0.0,
+    "range_pct": 0.0,
+    "body_pct": 0.0,
+}
 
-def calculate_basic_derived(candles: list[Candle]) -> dict[str, float]:
-    keys = [
-        "price_change_pct_1",
-        "price_change_pct_5",
-        "price_change_pct_20",
-        "range_pct",
-        "body_pct",
-    ]
+_PRICE_CHANGE_PERIODS = {
+    "price_change_pct_1": 1,
+    "price_change_pct_5": 5,
+    "price_change_pct_20": 20,
+}
 
+
+def calculate_basic_derived(candles: list[Candle] | CandleArrays) -> dict[str, float]:
     if not candles:
-        return dict.fromkeys(keys, 0.0)
+        return _DEFAULT_OUTPUT.copy()
+
+    # Every feature reads the last bar plus at most 20 bars of history, so only
+    # that tail is touched.
+    if isinstance(candles, CandleArrays):
+        closes = candles.close[-21:].tolist()
+        last_open = float(candles.open[-1])
+        last_high = float(candles.high[-1])
+        last_low = float(candles.low[-1])
+    else:
+        closes = [float(candle.close) for candle in candles[-21:]]
+        last_open = float(candles[-1].open)
+        last_high = float(candles[-1].high)
+        last_low = float(candles[-1].low)
+
+    last_close = closes[-1]
+    derived: dict[str, float] = {}
 
-    frame = pd.DataFrame(
-        {
-            "open": [candle.open for candle in candles],
-            "high": [candle.high for candle in candles],
-            "low": [candle.low for candle in candles],
-            "close": [candle.close for candle in candles],
-            "volume": [candle.volume for candle in candles],
-        }
-    )
+    for key, periods in _PRICE_CHANGE_PERIODS.items():
+        derived[key] = (
+            _percent_change(last_close, closes[-1 - periods]) if len(closes) > periods else 0.0
+        )
 
-    close = frame["close"].astype(float)
-    open_price = frame["open"].astype(float)
-    high = frame["high"].astype(float)
-    low = frame["low"].astype(float)
+    if last_close == 0.0:
+        derived["range_pct"] = 0.0
+        derived["body_pct"] = 0.0
+    else:
+        derived["range_pct"] = _finite_or_zero(((last_high - last_low) / last_close) * 100.0)
+        derived["body_pct"] = _finite_or_zero((abs(last_open - last_close) / last_close) * 100.0)
 
-    derived = pd.DataFrame(index=frame.index)
+    return derived
 
-    derived["price_change_pct_1"] = (close / close.shift(1) - 1.0) * 100.0
-    derived["price_change_pct_5"] = (close / close.shift(5) - 1.0) * 100.0
-    derived["price_change_pct_20"] = (close / close.shift(20) - 1.0) * 100.0
 
-    derived["range_pct"] = ((high - low) / close) * 100.0
-    derived["body_pct"] = ((open_price - close).abs() / close) * 100.0
+def _percent_change(current: float, previous: float) -> float:
+    if previous == 0.0:
+        return 0.0
+    return _finite_or_zero((current / previous - 1.0) * 100.0)
 
-    derived = derived.replace([float("inf"), float("-inf")], pd.NA).fillna(0.0)
 
-    last_row = derived.iloc[-1]
-    return {key: float(last_row[key]) for key in keys}
+def _finite_or_zero(value: float) -> float:
+    return value if math.isfinite(value) else 0.0
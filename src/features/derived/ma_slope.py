@@ -2,32 +2,32 @@ from __future__ import annotations
 
 import math
 
-import pandas as pd
-
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
+from src.features.indicators.moving_averages import MovingAverages, calculate_moving_averages
 from src.features.math.slope import calculate_normalized_slope
 
+_DEFAULT_OUTPUT: dict[str, float] = {
+    "sma50_slope_pct": 0.0,
+    "sma200_slope_pct": 0.0,
+    "ema9_slope_pct": 0.0,
+}
 
-def calculate_ma_slopes(candles: list[Candle], slope_window: int = 10) -> dict[str, float]:
-    output = {
-        "sma50_slope_pct": 0.0,
-        "sma200_slope_pct": 0.0,
-        "ema9_slope_pct": 0.0,
-    }
 
+def calculate_ma_slopes(
+    candles: list[Candle] | CandleArrays,
+    slope_window: int = 10,
+    moving_averages: MovingAverages | None = None,
+) -> dict[str, float]:
     if len(candles) < 2:
-        return output
+        return _DEFAULT_OUTPUT.copy()
 
     try:
-        close = pd.Series([candle.close for candle in candles], dtype=float)
-
-        sma_50 = close.rolling(window=50).mean()
-        sma_200 = close.rolling(window=200).mean()
-        ema_9 = close.ewm(span=9, adjust=False).mean()
+        if moving_averages is None:
+            moving_averages = calculate_moving_averages(candles)
 
-        sma50_slope = float(calculate_normalized_slope(sma_50, window=slope_window))
-        sma200_slope = float(calculate_normalized_slope(sma_200, window=slope_window))
-        ema9_slope = float(calculate_normalized_slope(ema_9, window=slope_window))
+        sma50_slope = calculate_normalized_slope(moving_averages.sma_50, window=slope_window)
+        sma200_slope = calculate_normalized_slope(moving_averages.sma_200, window=slope_window)
+        ema9_slope = calculate_normalized_slope(moving_averages.ema_9, window=slope_window)
 
         if not math.isfinite(sma50_slope):
             sma50_slope = 0.0
@@ -42,4 +42,4 @@ def calculate_ma_slopes(candles: list[Candle], slope_window: int = 10) -> dict[s
             "ema9_slope_pct": ema9_slope,
         }
     except Exception:
-        return output
+        return _DEFAULT_OUTPUT.copy()
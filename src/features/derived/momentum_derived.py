@@ -1,51 +1,49 @@
 from __future__ import annotations
 
-import pandas as pd
-from ta.momentum import RSIIndicator
+import math
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
+from src.features.arrays import as_candle_arrays
+from src.features.math.smoothing import rsi_last
 
+_DEFAULT_OUTPUT: dict[str, float] = {
+    "rsi_delta_1": 0.0,
+    "rsi_delta_5": 0.0,
+    "roc_5": 0.0,
+    "roc_20": 0.0,
+}
 
-def calculate_momentum_features(candles: list[Candle]) -> dict[str, float]:
-    output = {
-        "rsi_delta_1": 0.0,
-        "rsi_delta_5": 0.0,
-        "roc_5": 0.0,
-        "roc_20": 0.0,
-    }
 
+def calculate_momentum_features(candles: list[Candle] | CandleArrays) -> dict[str, float]:
     if len(candles) < 21:
-        return output
+        return _DEFAULT_OUTPUT.copy()
 
     try:
-        frame = pd.DataFrame({"close": [candle.close for candle in candles]})
-        close = frame["close"].astype(float)
+        close = as_candle_arrays(candles).close
 
-        rsi = RSIIndicator(close=close, window=14).rsi()
+        # Only three RSI values are needed: the latest and the ones 1 and 5
+        # bars earlier, each taken over the full history it would have seen.
+        rsi = rsi_last(close, window=14)
+        rsi_previous = rsi_last(close[:-1], window=14)
+        rsi_five_back = rsi_last(close[:-5], window=14)
 
-        rsi_delta_1 = rsi.diff(1)
-        rsi_delta_5 = rsi.diff(5)
-
-        roc_5 = (close / close.shift(5) - 1.0) * 100.0
-        roc_20 = (close / close.shift(20) - 1.0) * 100.0
-
-        derived = pd.DataFrame(
-            {
-                "rsi_delta_1": rsi_delta_1,
-                "rsi_delta_5": rsi_delta_5,
-                "roc_5": roc_5,
-                "roc_20": roc_20,
-            }
-        )
-
-        derived = derived.replace([float("inf"), float("-inf")], pd.NA).fillna(0.0)
-        last_row = derived.iloc[-1]
+        last_close = float(close[-1])
 
         return {
-            "rsi_delta_1": float(last_row["rsi_delta_1"]),
-            "rsi_delta_5": float(last_row["rsi_delta_5"]),
-            "roc_5": float(last_row["roc_5"]),
-            "roc_20": float(last_row["roc_20"]),
+            "rsi_delta_1": _finite_or_zero(rsi - rsi_previous),
+            "rsi_delta_5": _finite_or_zero(rsi - rsi_five_back),
+            "roc_5": _rate_of_change(last_close, float(close[-6])),
+            "roc_20": _rate_of_change(last_close, float(close[-21])),
         }
     except Exception:
-        return output
+        return _DEFAULT_OUTPUT.copy()
+
+
+def _rate_of_change(current: float, previous: float) -> float:
+    if previous == 0.0:
+        return 0.0
+    return _finite_or_zero((current / previous - 1.0) * 100.0)
+
+
+def _finite_or_zero(value: float) -> float:
+    return value if math.isfinite(value) else 0.0
@@ -2,40 +2,37 @@ from __future__ import annotations
 
 BB_SQUEEZE_BANDWIDTH_PCT_THRESHOLD = 0.2
 
+_DEFAULT_OUTPUT: dict[str, float] = {
+    "bb_position": 0.0,
+    "bb_bandwidth_pct": 0.0,
+    "bb_squeeze_flag": 0.0,
+    "atr_pct": 0.0,
+}
+
 
 def calculate_bb_metrics(close_price: float, indicators: dict[str, float]) -> dict[str, float]:
-    output = {
-        "bb_position": 0.0,
-        "bb_bandwidth_pct": 0.0,
-        "bb_squeeze_flag": 0.0,
-        "atr_pct": 0.0,
-    }
-
-    if (
-        "bb_upper" not in indicators
-        or "bb_middle" not in indicators
-        or "bb_lower" not in indicators
-    ):
+    output = _DEFAULT_OUTPUT.copy()
+
+    bb_upper_value = indicators.get("bb_upper")
+    bb_middle_value = indicators.get("bb_middle")
+    bb_lower_value = indicators.get("bb_lower")
+    if bb_upper_value is None or bb_middle_value is None or bb_lower_value is None:
         return output
 
     try:
         close_float = float(close_price)
-        bb_upper = float(indicators["bb_upper"])
-        bb_middle = float(indicators["bb_middle"])
-        bb_lower = float(indicators["bb_lower"])
+        bb_upper = float(bb_upper_value)
+        bb_middle = float(bb_middle_value)
+        bb_lower = float(bb_lower_value)
     except Exception:
         return output
 
     if bb_upper > bb_lower:
         position = (close_float - bb_lower) / (bb_upper - bb_lower)
-        if position < 0.0:
-            position = 0.0
-        if position > 1.0:
-            position = 1.0
-        output["bb_position"] = float(position)
+        output["bb_position"] = 0.0 if position < 0.0 else 1.0 if position > 1.0 else position
 
     if bb_middle != 0.0:
-        output["bb_bandwidth_pct"] = float(((bb_upper - bb_lower) / bb_middle) * 100.0)
+        output["bb_bandwidth_pct"] = ((bb_upper - bb_lower) / bb_middle) * 100.0
 
     atr_value = indicators.get("atr")
     if close_float != 0.0 and atr_value is not None:
@@ -45,7 +42,7 @@ def calculate_bb_metrics(close_price: float, indicators: dict[str, float]) -> di
             atr_float = 0.0
 
         if atr_float > 0.0:
-            output["atr_pct"] = float((atr_float / close_float) * 100.0)
+            output["atr_pct"] = (atr_float / close_float) * 100.0
 
     if output["bb_bandwidth_pct"] < BB_SQUEEZE_BANDWIDTH_PCT_THRESHOLD:
         output["bb_squeeze_flag"] = 1.0
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+from src.core.models.candle import Candle, CandleArrays
+from src.features.arrays import as_candle_arrays
+from src.features.math.smoothing import ewm_series
+
+
+@dataclass(slots=True, frozen=True)
+class MovingAverages:
+    """
+    Full-length EMA 9, SMA 50 and SMA 200 series for one candle window.
+
+    The SMA series are NaN until their window fills. Computed once per
+    snapshot and shared by the slope and crossover features.
+    """
+
+    ema_9: pd.Series
+    sma_50: pd.Series
+    sma_200: pd.Series
+
+
+def calculate_moving_averages(candles: list[Candle] | CandleArrays) -> MovingAverages:
+    close_values = as_candle_arrays(candles).close
+    close = pd.Series(close_values)
+    return MovingAverages(
+        ema_9=pd.Series(ewm_series(close_values, alpha=2.0 / (9 + 1))),
+        sma_50=close.rolling(window=50).mean(),
+        sma_200=close.rolling(window=200).mean(),
+    )
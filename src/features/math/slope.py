@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 
@@ -16,9 +17,7 @@ def calculate_slope(series: pd.Series, window: int = 10) -> float:
     if values.size < 2:
         return 0.0
 
-    x = np.arange(values.size, dtype=float)
-    slope = np.polyfit(x, values, 1)[0]
-    return float(slope)
+    return _linear_slope(values)
 
 
 def calculate_normalized_slope(series: pd.Series, window: int = 10) -> float:
@@ -37,7 +36,14 @@ def calculate_normalized_slope(series: pd.Series, window: int = 10) -> float:
     if last_value == 0.0:
         return 0.0
 
-    x = np.arange(values.size, dtype=float)
-    slope = float(np.polyfit(x, values, 1)[0])
+    slope = _linear_slope(values)
     normalized = (slope / abs(last_value)) * 100.0
     return float(normalized)
+
+
+def _linear_slope(values: npt.NDArray[np.float64]) -> float:
+    # Least-squares slope against x = 0..n-1 in closed form. Centering x keeps
+    # the sum well conditioned; its squared deviations sum to n(n^2 - 1)/12.
+    n = values.size
+    centered_x = np.arange(n, dtype=float) - (n - 1) / 2.0
+    return float(centered_x @ values) / (n * (n * n - 1) / 12.0)
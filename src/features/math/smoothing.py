@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+def ewm_last(values: npt.NDArray[np.float64], alpha: float, seed: float | None = None) -> float:
+    """
+    Last value of the recursive average y[i] = (1 - alpha) * y[i-1] + alpha * x[i].
+
+    The recurrence is unrolled into one weighted sum, so only the final value
+    is computed. Without a seed it starts from values[0], like pandas'
+    ewm(adjust=False); with a seed, every value is folded into it.
+    """
+    decay = 1.0 - alpha
+    weights = alpha * decay ** np.arange(values.size - 1, -1, -1, dtype=np.float64)
+    if seed is None:
+        weights[0] = decay ** (values.size - 1)
+        return float(weights @ values)
+    return float(decay**values.size * seed + weights @ values)
+
+
+def rsi_last(close: npt.NDArray[np.float64], window: int) -> float:
+    # Matches ta.momentum.RSIIndicator: Wilder smoothing over every delta, with
+    # the undefined first delta counted as zero movement.
+    deltas = np.diff(close, prepend=close[0])
+    average_gain = ewm_last(np.where(deltas > 0, deltas, 0.0), alpha=1.0 / window)
+    average_loss = ewm_last(np.where(deltas < 0, -deltas, 0.0), alpha=1.0 / window)
+    if average_loss == 0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + average_gain / average_loss)
+
+
+def atr_last(
+    high: npt.NDArray[np.float64],
+    low: npt.NDArray[np.float64],
+    close: npt.NDArray[np.float64],
+    window: int,
+) -> float:
+    # Matches ta.volatility.AverageTrueRange: seeded with the mean true range of
+    # the first window bars, then Wilder-smoothed over the rest.
+    true_range = high - low
+    previous_close = close[:-1]
+    true_range[1:] = np.maximum(
+        true_range[1:],
+        np.maximum(np.abs(high[1:] - previous_close), np.abs(low[1:] - previous_close)),
+    )
+    seed = float(true_range[:window].mean())
+    return ewm_last(true_range[window:], alpha=1.0 / window, seed=seed)
+
+
+def ewm_series(values: npt.NDArray[np.float64], alpha: float) -> npt.NDArray[np.float64]:
+    """
+    Full recursive average y[i] = (1 - alpha) * y[i-1] + alpha * x[i], y[0] = x[0].
+
+    Same values as pandas' ewm(alpha=alpha, adjust=False).mean() on NaN-free
+    input, without building the pandas window object.
+    """
+    if values.size == 0:
+        return np.empty(0, dtype=np.float64)
+
+    decay = 1.0 - alpha
+    points = values.tolist()
+    average = points[0]
+    averages = [average]
+    append = averages.append
+    for value in points[1:]:
+        average = alpha * value + decay * average
+        append(average)
+    return np.array(averages, dtype=np.float64)
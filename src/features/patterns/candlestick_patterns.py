@@ -17,6 +17,11 @@ def _safe_float(value: object, default: float = 0.0) -> float:
     return result
 
 
+def _clamp_strength(value: float) -> float:
+    # A conditional expression is several times cheaper than max(min(...)) here.
+    return 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
+
+
 def _candle_metrics(candle: Candle) -> dict[str, float]:
     open_price = _safe_float(getattr(candle, "open", 0.0))
     close_price = _safe_float(getattr(candle, "close", 0.0))
@@ -68,13 +73,13 @@ def detect_candlestick_patterns(candles: list[Candle]) -> dict[str, object]:
         if is_big_body:
             return {
                 "candlestick_pattern": "BIG_BODY",
-                "candlestick_pattern_strength": float(max(0.0, min(100.0, body_ratio * 100.0))),
+                "candlestick_pattern_strength": _clamp_strength(body_ratio * 100.0),
             }
         if is_doji:
             doji_strength = ((0.1 - body_ratio) / 0.1) * 100.0
             return {
                 "candlestick_pattern": "DOJI",
-                "candlestick_pattern_strength": float(max(0.0, min(100.0, doji_strength))),
+                "candlestick_pattern_strength": _clamp_strength(doji_strength),
             }
         return result
 
@@ -104,7 +109,7 @@ def detect_candlestick_patterns(candles: list[Candle]) -> dict[str, object]:
         if prev_body == 0.0:
             strength = 100.0 if last_body > 0.0 else 0.0
         else:
-            strength = min(100.0, (last_body / prev_body) * 50.0)
+            strength = _clamp_strength((last_body / prev_body) * 50.0)
         return {"candlestick_pattern": pattern, "candlestick_pattern_strength": float(strength)}
 
     if bull_pin or bear_pin:
@@ -117,19 +122,19 @@ def detect_candlestick_patterns(candles: list[Candle]) -> dict[str, object]:
         if last_body == 0.0:
             strength = 100.0 if wick > 0.0 else 0.0
         else:
-            strength = min(100.0, (wick / last_body) * 25.0)
+            strength = _clamp_strength((wick / last_body) * 25.0)
         return {"candlestick_pattern": pattern, "candlestick_pattern_strength": float(strength)}
 
     if inside_bar:
         return {"candlestick_pattern": "INSIDE_BAR", "candlestick_pattern_strength": 40.0}
 
     if is_big_body:
-        strength = max(0.0, min(100.0, body_ratio * 100.0))
-        return {"candlestick_pattern": "BIG_BODY", "candlestick_pattern_strength": float(strength)}
+        strength = _clamp_strength(body_ratio * 100.0)
+        return {"candlestick_pattern": "BIG_BODY", "candlestick_pattern_strength": strength}
 
     if is_doji:
         doji_strength = ((0.1 - body_ratio) / 0.1) * 100.0
-        doji_strength = max(0.0, min(100.0, doji_strength))
-        return {"candlestick_pattern": "DOJI", "candlestick_pattern_strength": float(doji_strength)}
+        doji_strength = _clamp_strength(doji_strength)
+        return {"candlestick_pattern": "DOJI", "candlestick_pattern_strength": doji_strength}
 
     return result
@@ -1,15 +1,17 @@
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
 from src.features.indicators.indicator_engine import calculate_features
 
 
 class RegimeDetector:
     @staticmethod
-    def detect(candles: list[Candle]) -> str:
+    def detect(candles: list[Candle] | CandleArrays) -> str:
         if len(candles) < 200:
             return "RANGE"
 
         features = calculate_features(candles)
-        current_price = candles[-1].close
+        current_price = (
+            float(candles.close[-1]) if isinstance(candles, CandleArrays) else candles[-1].close
+        )
 
         sma_50 = features.get("sma_50", 0.0)
         sma_200 = features.get("sma_200", 0.0)
@@ -3,7 +3,15 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
+from src.features.indicators.moving_averages import MovingAverages, calculate_moving_averages
+
+_DEFAULT_RESULT: dict[str, object] = {
+    "ema9_sma50_crossover_type": "NONE",
+    "ema9_sma50_crossover_age_bars": -1,
+    "sma50_sma200_crossover_type": "NONE",
+    "sma50_sma200_crossover_age_bars": -1,
+}
 
 
 def _detect_last_crossover(
@@ -16,70 +24,48 @@ def _detect_last_crossover(
     if lookback_bars < 1:
         return "NONE", -1
 
-    diff = a - b
-    last_valid_index = diff.last_valid_index()
-    if last_valid_index is None:
-        return "NONE", -1
-
-    try:
-        last_valid_index_int = int(last_valid_index)
-    except Exception:
-        return "NONE", -1
-
-    start_index = max(0, last_valid_index_int - lookback_bars + 1)
-    window = diff.loc[start_index:last_valid_index_int]
-    if window.empty:
+    diff = a.to_numpy(dtype=float) - b.to_numpy(dtype=float)
+    valid_positions = np.flatnonzero(~np.isnan(diff))
+    if valid_positions.size == 0:
         return "NONE", -1
 
-    sign = pd.Series(np.sign(window.to_numpy(dtype=float)), index=window.index)
-    sign_clean = sign.replace(0.0, pd.NA).ffill()
-    prev_sign = sign_clean.shift(1)
+    last_valid_index = int(valid_positions[-1])
+    start_index = max(0, last_valid_index - lookback_bars + 1)
+    window = diff[start_index : last_valid_index + 1]
 
-    bullish = (prev_sign < 0.0) & (sign_clean > 0.0)
-    bearish = (prev_sign > 0.0) & (sign_clean < 0.0)
-
-    bullish_indices = bullish[bullish].index
-    bearish_indices = bearish[bearish].index
-
-    last_bullish_index = int(bullish_indices.max()) if len(bullish_indices) > 0 else None
-    last_bearish_index = int(bearish_indices.max()) if len(bearish_indices) > 0 else None
-
-    if last_bullish_index is None and last_bearish_index is None:
+    # Zero and NaN bars carry the previous sign forward, so a crossover is a
+    # flip between consecutive signed bars.
+    signed_positions = np.flatnonzero(~np.isnan(window) & (window != 0.0))
+    signs = np.sign(window[signed_positions])
+    flips = np.flatnonzero(signs[1:] != signs[:-1])
+    if flips.size == 0:
         return "NONE", -1
 
-    if last_bearish_index is None or (
-        last_bullish_index is not None and last_bullish_index > last_bearish_index
-    ):
-        crossover_type = bullish_type
-        crossover_index = last_bullish_index
-    else:
-        crossover_type = bearish_type
-        crossover_index = last_bearish_index
+    last_flip = int(flips[-1]) + 1
+    crossover_type = bullish_type if signs[last_flip] > 0.0 else bearish_type
+    age_bars = last_valid_index - (start_index + int(signed_positions[last_flip]))
+    return crossover_type, age_bars
 
-    assert crossover_index is not None
-    age_bars = last_valid_index_int - int(crossover_index)
-    return crossover_type, int(age_bars)
 
-
-def detect_crossovers(candles: list[Candle], lookback_bars: int = 50) -> dict[str, object]:
-    result = {
-        "ema9_sma50_crossover_type": "NONE",
-        "ema9_sma50_crossover_age_bars": -1,
-        "sma50_sma200_crossover_type": "NONE",
-        "sma50_sma200_crossover_age_bars": -1,
-    }
+def detect_crossovers(
+    candles: list[Candle] | CandleArrays,
+    lookback_bars: int = 50,
+    moving_averages: MovingAverages | None = None,
+) -> dict[str, object]:
+    result = _DEFAULT_RESULT.copy()
 
     if not candles:
         return result
 
-    try:
-        close = pd.Series([candle.close for candle in candles], dtype=float)
-    except Exception:
-        return result
+    if moving_averages is None:
+        try:
+            moving_averages = calculate_moving_averages(candles)
+        except Exception:
+            return result
 
-    ema_9 = close.ewm(span=9, adjust=False).mean()
-    sma_50 = close.rolling(window=50).mean()
-    sma_200 = close.rolling(window=200).mean()
+    ema_9 = moving_averages.ema_9
+    sma_50 = moving_averages.sma_50
+    sma_200 = moving_averages.sma_200
 
     if sma_50.dropna().empty:
         return result
@@ -7,6 +7,8 @@ from pydantic import BaseModel, Field, field_validator
 from src.core.models.candle import Candle
 from src.features.contracts.feature_contract import ValidationStatus
 
+_FLOAT_TYPE_SET = {float}
+
 
 class FeatureSnapshot(BaseModel):
     timestamp: datetime
@@ -50,9 +52,22 @@ class FeatureSnapshot(BaseModel):
     @field_validator("indicators")
     @classmethod
     def check_nan(cls, v: dict[str, Any]) -> dict[str, float]:
+        # When every value is a plain float, a finite sum proves none is NaN or
+        # Infinity; both reductions run in C. Anything else (or an overflowing
+        # sum) takes the per-value loop, which also names the offending key.
+        values = v.values()
+        if set(map(type, values)) == _FLOAT_TYPE_SET and math.isfinite(sum(values)):
+            return dict(v)
+
         cleaned: dict[str, float] = {}
         for key, value in v.items():
-            if isinstance(value, (int, float)):
+            # Indicators are almost always plain floats; check those without the
+            # isinstance/float() round trip.
+            if type(value) is float:
+                if not math.isfinite(value):
+                    raise ValueError(f"Indicator {key} contains NaN or Infinity")
+                cleaned[key] = value
+            elif isinstance(value, (int, float)):
                 if math.isnan(value) or math.isinf(value):
                     raise ValueError(f"Indicator {key} contains NaN or Infinity")
                 cleaned[key] = float(value)
@@ -61,133 +76,107 @@ class FeatureSnapshot(BaseModel):
         return cleaned
 
     def to_markdown(self) -> str:
-        lines: list[str] = []
-
-        def format_float(value: float | None, decimals: int = 2, suffix: str = "") -> str:
-            if value is None:
-                return "N/A"
-            if not isinstance(value, (int, float)):
-                return "N/A"
-            if math.isnan(value) or math.isinf(value):
-                return "N/A"
-            return f"{float(value):.{decimals}f}{suffix}"
-
-        def get_indicator(key: str) -> float | None:
-            value = self.indicators.get(key)
-            if value is None:
-                return None
-            if not isinstance(value, (int, float)):
-                return None
-            if math.isnan(value) or math.isinf(value):
-                return None
-            return float(value)
+        indicators = self.indicators
 
         current_price = self.candles[-1].close if self.candles else 0.0
-        lines.append(f"**Current Price:** {current_price:.5f}")
 
-        rsi = self.indicators.get("rsi", 0.0)
+        rsi = indicators.get("rsi", 0.0)
         if rsi > 70:
             rsi_status = "Overbought"
         elif rsi < 30:
             rsi_status = "Oversold"
         else:
             rsi_status = "Neutral"
-        lines.append(f"**RSI:** {rsi:.2f} ({rsi_status})")
-
-        sma_50 = self.indicators.get("sma_50", 0.0)
-        sma_200 = self.indicators.get("sma_200", 0.0)
-        lines.append(f"**SMA 50:** {sma_50:.5f}")
-        lines.append(f"**SMA 200:** {sma_200:.5f}")
-
-        ema_9 = self.indicators.get("ema_9", 0.0)
-        lines.append(f"**EMA 9:** {ema_9:.5f}")
-
-        bb_upper = self.indicators.get("bb_upper", 0.0)
-        bb_middle = self.indicators.get("bb_middle", 0.0)
-        bb_lower = self.indicators.get("bb_lower", 0.0)
-        lines.append(
-            f"**Bollinger Bands:** Upper={bb_upper:.5f}, "
-            f"Middle={bb_middle:.5f}, Lower={bb_lower:.5f}"
-        )
 
-        atr = self.indicators.get("atr", 0.0)
-        lines.append(f"**ATR:** {atr:.5f}")
-
-        lines.append("")
-        lines.append("### Trend")
-        lines.append(f"- **Direction:** {self.trend_direction or 'N/A'}")
-        lines.append(f"- **Strength:** {format_float(self.trend_strength, decimals=1)}")
-
-        lines.append("")
-        lines.append("### Structure")
-        structure_val = self.structure or self.indicators.get("structure")
+        structure_val = self.structure or indicators.get("structure")
         structure_str = structure_val if isinstance(structure_val, str) else "N/A"
-        lines.append(f"- **Market structure:** {structure_str}")
-
-        lines.append("")
-        lines.append("### Momentum")
-        lines.append(
-            "- **RSI deltas:** "
-            f"Δ1={format_float(get_indicator('rsi_delta_1'), decimals=2)}, "
-            f"Δ5={format_float(get_indicator('rsi_delta_5'), decimals=2)}"
-        )
-        lines.append(
-            "- **ROC:** "
-            f"5={format_float(get_indicator('roc_5'), decimals=2, suffix='%')}, "
-            f"20={format_float(get_indicator('roc_20'), decimals=2, suffix='%')}"
-        )
 
-        lines.append("")
-        lines.append("### Crossovers")
-        lines.append(
-            "- **EMA9/SMA50:** "
-            f"{self.ema9_sma50_crossover_type or 'N/A'} "
-            f"(age: {self.ema9_sma50_crossover_age_bars if self.ema9_sma50_crossover_age_bars is not None else 'N/A'})"
-        )
-        lines.append(
-            "- **SMA50/SMA200:** "
-            f"{self.sma50_sma200_crossover_type or 'N/A'} "
-            f"(age: {self.sma50_sma200_crossover_age_bars if self.sma50_sma200_crossover_age_bars is not None else 'N/A'})"
-        )
+        ema9_sma50_age = self.ema9_sma50_crossover_age_bars
+        sma50_sma200_age = self.sma50_sma200_crossover_age_bars
 
-        lines.append("")
-        lines.append("### Volatility/BB")
-        bb_position = get_indicator("bb_position")
-        bb_bandwidth_pct = get_indicator("bb_bandwidth_pct")
-        bb_squeeze_flag = get_indicator("bb_squeeze_flag")
+        bb_squeeze_flag = _indicator(indicators, "bb_squeeze_flag")
         if bb_squeeze_flag is None:
             squeeze_text = "N/A"
         else:
             squeeze_text = "YES" if bb_squeeze_flag == 1.0 else "NO"
-        lines.append(
-            "- **BB:** "
-            f"pos={format_float(bb_position, decimals=2)}, "
-            f"bandwidth={format_float(bb_bandwidth_pct, decimals=2, suffix='%')}, "
-            f"squeeze={squeeze_text}"
-        )
-        lines.append(
-            "- **ATR:** "
-            f"{format_float(get_indicator('atr'), decimals=5)}, "
-            f"ATR%={format_float(get_indicator('atr_pct'), decimals=2, suffix='%')}"
-        )
 
-        lines.append("")
-        lines.append("### Volume")
-        vol_confirm = get_indicator("volume_confirmation_flag")
+        vol_confirm = _indicator(indicators, "volume_confirmation_flag")
         confirm_text = "N/A" if vol_confirm is None else "YES" if vol_confirm == 1.0 else "NO"
-        lines.append(f"- **Trend:** {self.volume_trend or 'N/A'}")
-        lines.append(
-            "- **Context:** "
-            f"mean={format_float(get_indicator('volume_mean'), decimals=2)}, "
-            f"z={format_float(get_indicator('volume_zscore'), decimals=2)}, "
-            f"confirm={confirm_text}"
-        )
 
-        lines.append("")
-        lines.append("### Patterns")
-        lines.append(f"- **Pattern:** {self.candlestick_pattern or 'N/A'}")
-        lines.append(
-            f"- **Strength:** {format_float(self.candlestick_pattern_strength, decimals=1)}"
+        return "\n".join(
+            [
+                f"**Current Price:** {current_price:.5f}",
+                f"**RSI:** {rsi:.2f} ({rsi_status})",
+                f"**SMA 50:** {indicators.get('sma_50', 0.0):.5f}",
+                f"**SMA 200:** {indicators.get('sma_200', 0.0):.5f}",
+                f"**EMA 9:** {indicators.get('ema_9', 0.0):.5f}",
+                f"**Bollinger Bands:** Upper={indicators.get('bb_upper', 0.0):.5f}, "
+                f"Middle={indicators.get('bb_middle', 0.0):.5f}, "
+                f"Lower={indicators.get('bb_lower', 0.0):.5f}",
+                f"**ATR:** {indicators.get('atr', 0.0):.5f}",
+                "",
+                "### Trend",
+                f"- **Direction:** {self.trend_direction or 'N/A'}",
+                f"- **Strength:** {_format_float(self.trend_strength, 1)}",
+                "",
+                "### Structure",
+                f"- **Market structure:** {structure_str}",
+                "",
+                "### Momentum",
+                "- **RSI deltas:** "
+                f"Δ1={_format_float(_indicator(indicators, 'rsi_delta_1'), 2)}, "
+                f"Δ5={_format_float(_indicator(indicators, 'rsi_delta_5'), 2)}",
+                "- **ROC:** "
+                f"5={_format_float(_indicator(indicators, 'roc_5'), 2, '%')}, "
+                f"20={_format_float(_indicator(indicators, 'roc_20'), 2, '%')}",
+                "",
+                "### Crossovers",
+                "- **EMA9/SMA50:** "
+                f"{self.ema9_sma50_crossover_type or 'N/A'} "
+                f"(age: {ema9_sma50_age if ema9_sma50_age is not None else 'N/A'})",
+                "- **SMA50/SMA200:** "
+                f"{self.sma50_sma200_crossover_type or 'N/A'} "
+                f"(age: {sma50_sma200_age if sma50_sma200_age is not None else 'N/A'})",
+                "",
+                "### Volatility/BB",
+                "- **BB:** "
+                f"pos={_format_float(_indicator(indicators, 'bb_position'), 2)}, "
+                f"bandwidth={_format_float(_indicator(indicators, 'bb_bandwidth_pct'), 2, '%')}, "
+                f"squeeze={squeeze_text}",
+                "- **ATR:** "
+                f"{_format_float(_indicator(indicators, 'atr'), 5)}, "
+                f"ATR%={_format_float(_indicator(indicators, 'atr_pct'), 2, '%')}",
+                "",
+                "### Volume",
+                f"- **Trend:** {self.volume_trend or 'N/A'}",
+                "- **Context:** "
+                f"mean={_format_float(_indicator(indicators, 'volume_mean'), 2)}, "
+                f"z={_format_float(_indicator(indicators, 'volume_zscore'), 2)}, "
+                f"confirm={confirm_text}",
+                "",
+                "### Patterns",
+                f"- **Pattern:** {self.candlestick_pattern or 'N/A'}",
+                f"- **Strength:** {_format_float(self.candlestick_pattern_strength, 1)}",
+            ]
         )
 
-        return "\n".join(lines)
+
+def _format_float(value: float | None, decimals: int = 2, suffix: str = "") -> str:
+    if value is None:
+        return "N/A"
+    if not isinstance(value, (int, float)):
+        return "N/A"
+    if math.isnan(value) or math.isinf(value):
+        return "N/A"
+    return f"{float(value):.{decimals}f}{suffix}"
+
+
+def _indicator(indicators: dict[str, float], key: str) -> float | None:
+    value = indicators.get(key)
+    if value is None:
+        return None
+    if not isinstance(value, (int, float)):
+        return None
+    if math.isnan(value) or math.isinf(value):
+        return None
+    return float(value)
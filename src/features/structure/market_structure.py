@@ -1,26 +1,37 @@
 from __future__ import annotations
 
 import math
+from operator import attrgetter
 
 from src.features.structure.swing_points import SwingPoint
 
+_swing_index = attrgetter("index")
+
 
 def classify_structure(swings: list[SwingPoint]) -> dict[str, object]:
     try:
-        sorted_swings = sorted(swings, key=lambda sp: sp.index)
+        sorted_swings = sorted(swings, key=_swing_index)
     except Exception:
         sorted_swings = swings
 
-    highs = [sp for sp in sorted_swings if sp.type == "HIGH"]
-    lows = [sp for sp in sorted_swings if sp.type == "LOW"]
+    # Only the two most recent highs and lows matter, so scan from the end and
+    # stop once both pairs are found.
+    highs: list[SwingPoint] = []
+    lows: list[SwingPoint] = []
+    for swing in reversed(sorted_swings):
+        if swing.type == "HIGH":
+            if len(highs) < 2:
+                highs.append(swing)
+        elif swing.type == "LOW" and len(lows) < 2:
+            lows.append(swing)
+        if len(highs) == 2 and len(lows) == 2:
+            break
 
     if len(highs) < 2 or len(lows) < 2:
         return {"structure": "RANGE", "confidence": 0.0}
 
-    prev_high = highs[-2]
-    last_high = highs[-1]
-    prev_low = lows[-2]
-    last_low = lows[-1]
+    last_high, prev_high = highs
+    last_low, prev_low = lows
 
     try:
         prev_high_price = float(prev_high.price)
@@ -30,9 +41,11 @@ def classify_structure(swings: list[SwingPoint]) -> dict[str, object]:
     except Exception:
         return {"structure": "RANGE", "confidence": 0.0}
 
-    if not all(
-        math.isfinite(value)
-        for value in [prev_high_price, last_high_price, prev_low_price, last_low_price]
+    if not (
+        math.isfinite(prev_high_price)
+        and math.isfinite(last_high_price)
+        and math.isfinite(prev_low_price)
+        and math.isfinite(last_low_price)
     ):
         return {"structure": "RANGE", "confidence": 0.0}
 
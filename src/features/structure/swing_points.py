@@ -1,79 +1,92 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Literal
 
-from src.core.models.candle import Candle
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.core.models.candle import Candle, CandleArrays
 
 SwingPointType = Literal["HIGH", "LOW"]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class SwingPoint:
     index: int
     price: float
     type: SwingPointType
-    timestamp: object | None
+    timestamp: datetime | None
+
+
+_swing_index = attrgetter("index")
 
 
-def detect_swings(candles: list[Candle], depth: int = 5) -> list[SwingPoint]:
+def detect_swings(candles: list[Candle] | CandleArrays, depth: int = 5) -> list[SwingPoint]:
     if depth < 1:
         return []
 
     if len(candles) < (2 * depth + 1):
         return []
 
-    swings: list[SwingPoint] = []
-
     try:
-        last_confirmed_index_exclusive = len(candles) - depth
-        for i in range(depth, last_confirmed_index_exclusive):
-            center = candles[i]
-            center_high = float(center.high)
-            center_low = float(center.low)
-
-            left = i - depth
-            right_exclusive = i + depth + 1
-
-            is_swing_high = True
-            is_swing_low = True
-
-            for j in range(left, right_exclusive):
-                if j == i:
-                    continue
-
-                other = candles[j]
-                if center_high <= float(other.high):
-                    is_swing_high = False
-                if center_low >= float(other.low):
-                    is_swing_low = False
-
-                if not is_swing_high and not is_swing_low:
-                    break
-
-            timestamp = center.timestamp if hasattr(center, "timestamp") else None
-
-            if is_swing_high:
-                swings.append(
-                    SwingPoint(
-                        index=i,
-                        price=center_high,
-                        type="HIGH",
-                        timestamp=timestamp,
-                    )
-                )
-
-            if is_swing_low:
-                swings.append(
-                    SwingPoint(
-                        index=i,
-                        price=center_low,
-                        type="LOW",
-                        timestamp=timestamp,
-                    )
-                )
-
-        swings.sort(key=lambda sp: sp.index)
+        if isinstance(candles, CandleArrays):
+            highs = candles.high
+            lows = candles.low
+        else:
+            prices = np.array([(candle.high, candle.low) for candle in candles], dtype=np.float64)
+            highs = prices[:, 0]
+            lows = prices[:, 1]
+
+        # A swing must beat every bar within depth on both sides strictly, so the
+        # center is compared with the extreme of the depth bars to its left and
+        # to its right. Row k of each view covers bars k .. k + depth - 1.
+        center_count = len(candles) - 2 * depth
+        high_windows = sliding_window_view(highs, depth).max(axis=1)
+        low_windows = sliding_window_view(lows, depth).min(axis=1)
+        center_highs = highs[depth : depth + center_count]
+        center_lows = lows[depth : depth + center_count]
+
+        is_swing_high = (center_highs > high_windows[:center_count]) & (
+            center_highs > high_windows[depth + 1 :]
+        )
+        is_swing_low = (center_lows < low_windows[:center_count]) & (
+            center_lows < low_windows[depth + 1 :]
+        )
+
+        swings = [
+            SwingPoint(
+                index=index,
+                price=float(highs[index]),
+                type="HIGH",
+                timestamp=_swing_timestamp(candles, index),
+            )
+            for index in (np.flatnonzero(is_swing_high) + depth).tolist()
+        ]
+        swings.extend(
+            SwingPoint(
+                index=index,
+                price=float(lows[index]),
+                type="LOW",
+                timestamp=_swing_timestamp(candles, index),
+            )
+            for index in (np.flatnonzero(is_swing_low) + depth).tolist()
+        )
+
+        # Stable sort keeps a HIGH ahead of a LOW on the same bar.
+        swings.sort(key=_swing_index)
         return swings
     except Exception:
         return []
+
+
+def _swing_timestamp(candles: list[Candle] | CandleArrays, index: int) -> datetime | None:
+    # A candle list yields each candle's own timestamp. CandleArrays store UTC
+    # datetime64 values, so that path yields UTC-aware datetimes.
+    if isinstance(candles, CandleArrays):
+        # datetime64[us] converts to a naive datetime holding the UTC wall time.
+        value: datetime = candles.timestamp[index].astype("datetime64[us]").item()
+        return value.replace(tzinfo=UTC)
+    return getattr(candles[index], "timestamp", None)
@@ -2,71 +2,70 @@ from __future__ import annotations
 
 import math
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
+
+_DEFAULT_OUTPUT: dict[str, object] = {"trend_direction": "NEUTRAL", "trend_strength": 0.0}
 
 
 class TrendDetector:
     @staticmethod
-    def detect(candles: list[Candle], indicators: dict[str, float]) -> dict[str, object]:
-        default = {"trend_direction": "NEUTRAL", "trend_strength": 0.0}
-
+    def detect(
+        candles: list[Candle] | CandleArrays, indicators: dict[str, float]
+    ) -> dict[str, object]:
         if not candles:
-            return default
-
-        required_keys = [
-            "sma_50",
-            "sma_200",
-            "sma50_slope_pct",
-            "sma200_slope_pct",
-        ]
-        for key in required_keys:
-            if key not in indicators:
-                return default
+            return _DEFAULT_OUTPUT.copy()
 
+        # A missing key raises KeyError, which falls back to the default like a
+        # non-numeric value does.
         try:
-            close = float(candles[-1].close)
+            close = float(
+                candles.close[-1] if isinstance(candles, CandleArrays) else candles[-1].close
+            )
             sma_50 = float(indicators["sma_50"])
             sma_200 = float(indicators["sma_200"])
             sma50_slope_pct = float(indicators["sma50_slope_pct"])
             sma200_slope_pct = float(indicators["sma200_slope_pct"])
         except Exception:
-            return default
+            return _DEFAULT_OUTPUT.copy()
 
         if sma_50 == 0.0 or sma_200 == 0.0:
-            return default
+            return _DEFAULT_OUTPUT.copy()
 
-        if not all(
-            math.isfinite(value)
-            for value in [close, sma_50, sma_200, sma50_slope_pct, sma200_slope_pct]
+        if not (
+            math.isfinite(close)
+            and math.isfinite(sma_50)
+            and math.isfinite(sma_200)
+            and math.isfinite(sma50_slope_pct)
+            and math.isfinite(sma200_slope_pct)
         ):
-            return default
-
-        price_above_sma200 = close > sma_200
-        price_below_sma200 = close < sma_200
-        sma50_above_sma200 = sma_50 > sma_200
-        sma50_below_sma200 = sma_50 < sma_200
-        slopes_bullish = (sma50_slope_pct > 0.0) and (sma200_slope_pct > 0.0)
-        slopes_bearish = (sma50_slope_pct < 0.0) and (sma200_slope_pct < 0.0)
+            return _DEFAULT_OUTPUT.copy()
 
-        if price_above_sma200 and sma50_above_sma200 and slopes_bullish:
+        if (
+            close > sma_200
+            and sma_50 > sma_200
+            and sma50_slope_pct > 0.0
+            and sma200_slope_pct > 0.0
+        ):
             trend_direction = "BULLISH"
-        elif price_below_sma200 and sma50_below_sma200 and slopes_bearish:
+            strength_cap = 100.0
+        elif (
+            close < sma_200
+            and sma_50 < sma_200
+            and sma50_slope_pct < 0.0
+            and sma200_slope_pct < 0.0
+        ):
             trend_direction = "BEARISH"
+            strength_cap = 100.0
         else:
             trend_direction = "NEUTRAL"
+            strength_cap = 40.0
 
-        slope_magnitude = abs(sma50_slope_pct) + abs(sma200_slope_pct)
-        trend_strength = min(100.0, slope_magnitude * 100.0)
-
-        if trend_direction == "NEUTRAL":
-            trend_strength = min(trend_strength, 40.0)
-
-        if trend_strength < 0.0:
-            trend_strength = 0.0
-        if trend_strength > 100.0:
-            trend_strength = 100.0
+        # Both terms are finite absolute values, so the strength is never negative.
+        trend_strength = (abs(sma50_slope_pct) + abs(sma200_slope_pct)) * 100.0
+        if trend_strength > strength_cap:
+            trend_strength = strength_cap
 
         return {
             "trend_direction": trend_direction,
-            "trend_strength": float(trend_strength),
+            "trend_strength": trend_strength,
         }
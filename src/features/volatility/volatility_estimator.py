@@ -1,20 +1,35 @@
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
 from src.features.indicators.indicator_engine import calculate_features
 
 
 class VolatilityEstimator:
     @staticmethod
-    def estimate(candles: list[Candle]) -> str:
+    def estimate(
+        candles: list[Candle] | CandleArrays, features: dict[str, float] | None = None
+    ) -> str:
+        """
+        Classify volatility as HIGH, NORMAL or LOW.
+
+        Pass features when ATR and Bollinger values are already computed for
+        these candles; otherwise the indicator engine is run here.
+        """
         if len(candles) < 200:
             return "NORMAL"
 
-        features = calculate_features(candles)
+        if features is None:
+            features = calculate_features(candles)
 
-        atr = features.get("atr", 0.0)
-        bb_upper = features.get("bb_upper", 0.0)
-        bb_lower = features.get("bb_lower", 0.0)
-        close = candles[-1].close
+        return VolatilityEstimator.estimate_from_values(
+            atr=features.get("atr", 0.0),
+            bb_upper=features.get("bb_upper", 0.0),
+            bb_lower=features.get("bb_lower", 0.0),
+            close=float(candles.close[-1])
+            if isinstance(candles, CandleArrays)
+            else candles[-1].close,
+        )
 
+    @staticmethod
+    def estimate_from_values(atr: float, bb_upper: float, bb_lower: float, close: float) -> str:
         if atr == 0.0 or bb_upper == 0.0 or bb_lower == 0.0:
             return "NORMAL"
 
@@ -2,58 +2,57 @@ from __future__ import annotations
 
 import math
 
-import pandas as pd
+import numpy as np
 
-from src.core.models.candle import Candle
+from src.core.models.candle import Candle, CandleArrays
 
+_DEFAULT_OUTPUT: dict[str, object] = {
+    "volume_mean": 0.0,
+    "volume_zscore": 0.0,
+    "volume_trend": "UNKNOWN",
+    "volume_confirmation_flag": 0.0,
+}
 
-def calculate_volume_features(candles: list[Candle], window: int = 20) -> dict[str, object]:
-    output: dict[str, object] = {
-        "volume_mean": 0.0,
-        "volume_zscore": 0.0,
-        "volume_trend": "UNKNOWN",
-        "volume_confirmation_flag": 0.0,
-    }
+
+def calculate_volume_features(
+    candles: list[Candle] | CandleArrays, window: int = 20
+) -> dict[str, object]:
+    output = _DEFAULT_OUTPUT.copy()
 
     if not candles:
         return output
 
-    volumes: list[float] = []
-    for candle in candles:
-        if not hasattr(candle, "volume"):
-            volumes.append(float("nan"))
-            continue
-
-        try:
-            volumes.append(float(candle.volume))
-        except Exception:
-            volumes.append(float("nan"))
+    if isinstance(candles, CandleArrays):
+        volumes = candles.volume
+    else:
+        volumes = np.array([_volume_or_nan(candle) for candle in candles], dtype=np.float64)
 
-    series = pd.Series(volumes, dtype=float)
-    non_nan = series.dropna()
+    non_nan = volumes[~np.isnan(volumes)]
 
-    if non_nan.empty:
+    if non_nan.size == 0:
         return output
 
-    if (non_nan == 0.0).all():
+    if not non_nan.any():
         return output
 
     if window < 1:
         window = 1
 
-    rolling_mean = series.rolling(window=window, min_periods=window).mean()
-    mean_last = rolling_mean.iloc[-1]
-    mean_value = float(non_nan.mean()) if pd.isna(mean_last) else float(mean_last)
+    # Only the trailing window is needed; when it is short or holds a NaN, fall
+    # back to statistics over every known volume.
+    tail = volumes[-window:]
+    if tail.size < window or np.isnan(tail).any():
+        tail = non_nan
 
+    mean_value = float(tail.mean())
     if not math.isfinite(mean_value):
         mean_value = 0.0
 
-    last_volume = series.iloc[-1]
-    last_volume_value = 0.0 if pd.isna(last_volume) else float(last_volume)
+    last_volume_value = float(volumes[-1])
+    if math.isnan(last_volume_value):
+        last_volume_value = 0.0
 
-    rolling_std = series.rolling(window=window, min_periods=window).std(ddof=0)
-    std_last = rolling_std.iloc[-1]
-    std_value = float(non_nan.std(ddof=0)) if pd.isna(std_last) else float(std_last)
+    std_value = float(tail.std())
 
     if not math.isfinite(std_value) or std_value == 0.0:
         zscore = 0.0
@@ -62,10 +61,10 @@ def calculate_volume_features(candles: list[Candle], window: int = 20) -> dict[s
         if not math.isfinite(zscore):
             zscore = 0.0
 
-    last_10 = series.tail(10)
-    if len(last_10) == 10 and last_10.notna().all():
-        prev5 = float(last_10.iloc[:5].mean())
-        last5 = float(last_10.iloc[5:].mean())
+    last_10 = volumes[-10:]
+    if last_10.size == 10 and not np.isnan(last_10).any():
+        prev5 = float(last_10[:5].mean())
+        last5 = float(last_10[5:].mean())
 
         if math.isfinite(prev5) and math.isfinite(last5):
             if prev5 == 0.0:
@@ -91,3 +90,10 @@ def calculate_volume_features(candles: list[Candle], window: int = 20) -> dict[s
     output["volume_confirmation_flag"] = float(confirmation_flag)
 
     return output
+
+
+def _volume_or_nan(candle: Candle) -> float:
+    try:
+        return float(candle.volume)
+    except Exception:
+        return math.nan
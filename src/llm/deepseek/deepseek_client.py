@@ -1,12 +1,19 @@
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import httpx
+import orjson
 
 from src.core.models.llm import LlmRequest, LlmResponse
 from src.core.ports.llm_provider import HealthCheckResult, LlmProvider
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.http_client import HttpClientOwner
+from src.utils.retry import is_transient_error, retry_network_call
 
 
-class DeepSeekClient(LlmProvider):
+class DeepSeekClient(HttpClientOwner, LlmProvider):
     def __init__(
         self,
         base_url: str,
@@ -18,7 +25,28 @@ class DeepSeekClient(LlmProvider):
         self.api_key = api_key
         self.provider_name = provider_name
         self.default_timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+        # The API is served over HTTPS, so h2 is negotiated through ALPN and
+        # concurrent requests share one connection; httpx drops to HTTP/1.1 if
+        # the endpoint declines. retries=1 re-attempts only failed connection
+        # setup, request-level retries stay with retry_network_call.
+        self.client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=60.0,
+                ),
+                retries=1,
+            ),
+        )
+        self._own_client(self.client)
+        # Short-circuits generate_with_request during an outage so the router can
+        # fall back instead of waiting out every retry.
+        self._circuit_breaker = CircuitBreaker(
+            failure_threshold=5, failure_window=60.0, cooldown=30.0
+        )
 
     def get_provider_name(self) -> str:
         return self.provider_name
@@ -41,6 +69,57 @@ class DeepSeekClient(LlmProvider):
         if not self.api_key or not self.api_key.strip():
             raise ValueError("DeepSeek API key is required")
 
+        return self._request_choices(system_prompt, user_prompt, 1)[0]
+
+    def generate_many(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        n_per_prompt: int = 1,
+        max_concurrency: int = 4,
+    ) -> list[list[str]]:
+        """
+        Return n_per_prompt completions for each user prompt, in prompt order.
+
+        Each prompt asks for all of its samples in one request via "n". When the
+        endpoint returns fewer choices than asked for, the missing samples are
+        fetched with single-sample requests. Requests run concurrently on the
+        pooled client, at most max_concurrency at a time.
+        """
+        if not self.api_key or not self.api_key.strip():
+            raise ValueError("DeepSeek API key is required")
+        if n_per_prompt < 1:
+            raise ValueError("n_per_prompt must be at least 1")
+        if not user_prompts:
+            return []
+
+        def request_samples(job: tuple[str, int]) -> list[str]:
+            user_prompt, n = job
+            return self._request_choices(system_prompt, user_prompt, n)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrency, len(user_prompts)))
+        ) as executor:
+            results = list(
+                executor.map(request_samples, [(prompt, n_per_prompt) for prompt in user_prompts])
+            )
+
+            shortfall = [
+                (index, user_prompts[index])
+                for index, samples in enumerate(results)
+                for _ in range(n_per_prompt - len(samples))
+            ]
+            extra_samples = executor.map(request_samples, [(prompt, 1) for _, prompt in shortfall])
+            for (index, _), samples in zip(shortfall, extra_samples, strict=True):
+                results[index].extend(samples)
+
+        return results
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """Yield content deltas from DeepSeek's server-sent event stream."""
+        if not self.api_key or not self.api_key.strip():
+            raise ValueError("DeepSeek API key is required")
+
         url = f"{self.base_url}/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -53,32 +132,34 @@ class DeepSeekClient(LlmProvider):
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            "stream": False,
+            "stream": True,
         }
 
-        response = self.client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
+        with self.client.stream(
+            "POST", url, content=orjson.dumps(payload), headers=headers
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
 
-        data = response.json()
-        choices = data.get("choices", [])
-        if not choices:
-            raise ValueError("Empty response from DeepSeek")
-
-        message = choices[0].get("message", {})
-        content = message.get("content", "")
-
-        if not content:
-            raise ValueError("Empty content in DeepSeek response")
-
-        return str(content).strip()
+                choices = orjson.loads(data).get("choices") or []
+                if not choices:
+                    continue
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield str(content)
 
     def generate_with_request(self, request: LlmRequest) -> LlmResponse:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         model_to_use = request.model_name or "deepseek-chat"
         timeout_to_use = request.timeout_seconds or self.default_timeout
 
         if not self.api_key or not self.api_key.strip():
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return LlmResponse(
                 text="",
                 provider_name=self.provider_name,
@@ -88,6 +169,17 @@ class DeepSeekClient(LlmProvider):
                 error="missing api key",
             )
 
+        if not self._circuit_breaker.allow():
+            return LlmResponse(
+                text="",
+                provider_name=self.provider_name,
+                model_name=model_to_use,
+                latency_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                attempts=1,
+                error="circuit open: DeepSeek failed repeatedly, waiting for cooldown",
+            )
+
+        attempts = [0]
         try:
             url = f"{self.base_url}/v1/chat/completions"
             headers = {
@@ -105,43 +197,97 @@ class DeepSeekClient(LlmProvider):
                 "stream": False,
             }
 
-            with httpx.Client(timeout=timeout_to_use) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
+            data = self._post_chat_completion(url, payload, headers, timeout_to_use, attempts)
+            choices = data.get("choices", [])
+            if not choices:
+                raise ValueError("Empty response from DeepSeek")
 
-                data = response.json()
-                choices = data.get("choices", [])
-                if not choices:
-                    raise ValueError("Empty response from DeepSeek")
+            message = choices[0].get("message", {})
+            content = message.get("content", "")
 
-                message = choices[0].get("message", {})
-                content = message.get("content", "")
+            if not content:
+                raise ValueError("Empty content in DeepSeek response")
 
-                if not content:
-                    raise ValueError("Empty content in DeepSeek response")
+            text = str(content).strip()
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-                text = str(content).strip()
-                latency_ms = int((time.time() - start_time) * 1000)
-
-                return LlmResponse(
-                    text=text,
-                    provider_name=self.provider_name,
-                    model_name=model_to_use,
-                    latency_ms=latency_ms,
-                    attempts=1,
-                    error=None,
-                )
+            self._circuit_breaker.record_success()
+            return LlmResponse(
+                text=text,
+                provider_name=self.provider_name,
+                model_name=model_to_use,
+                latency_ms=latency_ms,
+                attempts=attempts[0],
+                error=None,
+            )
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            # Only outage-shaped failures count toward opening the circuit; a 401
+            # or a malformed body fails identically on every call and is reported
+            # as is.
+            if is_transient_error(e):
+                self._circuit_breaker.record_failure()
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return LlmResponse(
                 text="",
                 provider_name=self.provider_name,
                 model_name=model_to_use,
                 latency_ms=latency_ms,
-                attempts=1,
+                attempts=max(attempts[0], 1),
                 error=str(e),
             )
 
-    def __del__(self) -> None:
-        if hasattr(self, "client"):
-            self.client.close()
+    def _request_choices(self, system_prompt: str, user_prompt: str, n: int) -> list[str]:
+        """Request up to n choices in one round trip; "n" is only sent when above 1."""
+        url = f"{self.base_url}/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        payload: dict[str, Any] = {
+            "model": "deepseek-chat",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "stream": False,
+        }
+        if n > 1:
+            payload["n"] = n
+
+        response = self.client.post(url, content=orjson.dumps(payload), headers=headers)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        choices = data.get("choices", [])
+        if not choices:
+            raise ValueError("Empty response from DeepSeek")
+
+        texts: list[str] = []
+        for choice in choices[:n]:
+            content = choice.get("message", {}).get("content", "")
+            if not content:
+                raise ValueError("Empty content in DeepSeek response")
+            texts.append(str(content).strip())
+        return texts
+
+    @retry_network_call(
+        max_attempts=3, min_wait=1.0, max_wait=8.0, retry_on_status=True, reraise=True
+    )
+    def _post_chat_completion(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        timeout: float,
+        attempts: list[int],
+    ) -> Any:
+        """POST a chat completion, retrying timeouts, transport errors, 429 and 5xx."""
+        attempts[0] += 1
+        # The shared client keeps connections alive between calls; the
+        # request's own timeout overrides the client default.
+        response = self.client.post(
+            url, content=orjson.dumps(payload), headers=headers, timeout=timeout
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
@@ -1,13 +1,18 @@
 import time
+from collections.abc import Iterator
 
 import httpx
+import orjson
 
 from src.core.models.llm import LlmRequest, LlmResponse
 from src.core.ports.llm_provider import HealthCheckResult, LlmProvider
+from src.utils.http_client import HttpClientOwner
 from src.utils.retry import retry_network_call
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-class OllamaClient(LlmProvider):
+
+class OllamaClient(HttpClientOwner, LlmProvider):
     def __init__(
         self, base_url: str, model: str = "", provider_name: str = "ollama", timeout: float = 120.0
     ) -> None:
@@ -15,7 +20,23 @@ class OllamaClient(LlmProvider):
         self.model = model
         self.provider_name = provider_name
         self.default_timeout = timeout
-        self.client = httpx.Client(timeout=timeout)
+        # Ollama is normally reached over plain http, where h2 is never negotiated
+        # and httpx speaks HTTP/1.1; http2 only takes effect behind a TLS proxy.
+        # The keep-alive pool is what saves the reconnect per call. retries=1
+        # re-attempts only failed connection setup.
+        self.client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=60.0,
+                ),
+                retries=1,
+            ),
+        )
+        self._own_client(self.client)
 
     def get_provider_name(self) -> str:
         return self.provider_name
@@ -44,10 +65,10 @@ class OllamaClient(LlmProvider):
             "stream": False,
         }
 
-        response = self.client.post(url, json=payload)
+        response = self.client.post(url, content=orjson.dumps(payload), headers=_JSON_HEADERS)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         message = data.get("message", {})
         content = message.get("content", "")
 
@@ -57,8 +78,40 @@ class OllamaClient(LlmProvider):
         result: str = str(content).strip()
         return result
 
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """Yield content chunks from Ollama's newline-delimited JSON stream."""
+        model_to_use = self.model or "llama3:latest"
+        url = f"{self.base_url}/api/chat"
+
+        payload = {
+            "model": model_to_use,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "stream": True,
+        }
+
+        with self.client.stream(
+            "POST", url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+
+                chunk = orjson.loads(line)
+                if "error" in chunk:
+                    raise ValueError(f"Ollama stream error: {chunk['error']}")
+
+                content = (chunk.get("message") or {}).get("content")
+                if content:
+                    yield str(content)
+                if chunk.get("done"):
+                    break
+
     def generate_with_request(self, request: LlmRequest) -> LlmResponse:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         model_to_use = request.model_name or self.model or "llama3:latest"
         timeout_to_use = request.timeout_seconds or self.default_timeout
 
@@ -74,30 +127,34 @@ class OllamaClient(LlmProvider):
                 "stream": False,
             }
 
-            with httpx.Client(timeout=timeout_to_use) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
+            response = self.client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=timeout_to_use,
+            )
+            response.raise_for_status()
 
-                data = response.json()
-                message = data.get("message", {})
-                content = message.get("content", "")
+            data = orjson.loads(response.content)
+            message = data.get("message", {})
+            content = message.get("content", "")
 
-                if not content:
-                    raise ValueError("Empty response from Ollama")
+            if not content:
+                raise ValueError("Empty response from Ollama")
 
-                text = str(content).strip()
-                latency_ms = int((time.time() - start_time) * 1000)
+            text = str(content).strip()
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-                return LlmResponse(
-                    text=text,
-                    provider_name=self.provider_name,
-                    model_name=model_to_use,
-                    latency_ms=latency_ms,
-                    attempts=1,
-                    error=None,
-                )
+            return LlmResponse(
+                text=text,
+                provider_name=self.provider_name,
+                model_name=model_to_use,
+                latency_ms=latency_ms,
+                attempts=1,
+                error=None,
+            )
         except Exception as e:
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return LlmResponse(
                 text="",
                 provider_name=self.provider_name,
@@ -106,7 +163,3 @@ class OllamaClient(LlmProvider):
                 attempts=1,
                 error=str(e),
             )
-
-    def __del__(self) -> None:
-        if hasattr(self, "client"):
-            self.client.close()
@@ -83,9 +83,9 @@ class LlmRouter:
                 return cached_ok
 
         provider = self.providers[provider_name]
-        health_check_start = time.time()
+        health_check_start_ns = time.perf_counter_ns()
         health_result = provider.health_check()
-        health_check_duration_ms = (time.time() - health_check_start) * 1000
+        health_check_duration_ms = (time.perf_counter_ns() - health_check_start_ns) / 1_000_000
         is_available = health_result.ok
 
         self._health_cache[cache_key] = (is_available, current_time)
@@ -278,9 +278,9 @@ class LlmRouter:
             f"model={model_name}, timeout_seconds={provider_timeout}, "
             f"prompt_chars={len(request.system_prompt) + len(request.user_prompt)}"
         )
-        request_start = time.time()
+        request_start_ns = time.perf_counter_ns()
         response = provider.generate_with_request(step_request)
-        request_duration_ms = (time.time() - request_start) * 1000
+        request_duration_ms = (time.perf_counter_ns() - request_start_ns) / 1_000_000
 
         if response.error is None:
             response.attempts = 1
@@ -355,9 +355,9 @@ class LlmRouter:
                 f"model={model_name}, attempt={attempts}, timeout_seconds={provider_timeout}, "
                 f"prompt_chars={len(request.system_prompt) + len(request.user_prompt)}"
             )
-            request_start = time.time()
+            request_start_ns = time.perf_counter_ns()
             response = provider.generate_with_request(step_request)
-            request_duration_ms = (time.time() - request_start) * 1000
+            request_duration_ms = (time.perf_counter_ns() - request_start_ns) / 1_000_000
 
             if response.error is None:
                 response.attempts = attempts
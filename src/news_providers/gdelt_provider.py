@@ -5,7 +5,7 @@ from typing import Any
 import httpx
 
 from src.core.models.news import NewsArticle, NewsDigest
-from src.core.models.timeframe import Timeframe
+from src.core.models.timeframe import TIMEFRAME_H1, Timeframe
 from src.core.ports.news_provider import NewsProvider
 from src.utils.retry import retry_network_call
 
@@ -578,7 +578,7 @@ class GDELTProvider(NewsProvider):
 
     def get_news_summary(self, symbol: str) -> str:
         try:
-            digest = self.get_news_digest(symbol, Timeframe.H1)
+            digest = self.get_news_digest(symbol, TIMEFRAME_H1)
             if digest.summary:
                 return digest.summary
             return "No news found via GDELT."
@@ -1,5 +1,5 @@
 from src.core.models.news import NewsDigest
-from src.core.models.timeframe import Timeframe
+from src.core.models.timeframe import TIMEFRAME_H1, Timeframe
 from src.core.ports.news_provider import NewsProvider
 
 
@@ -55,7 +55,7 @@ class MultiNewsProvider(NewsProvider):
             return primary_digest
 
     def get_news_summary(self, symbol: str) -> str:
-        digest = self.get_news_digest(symbol, Timeframe.H1)
+        digest = self.get_news_digest(symbol, TIMEFRAME_H1)
         if digest.summary:
             return digest.summary
         return "No news found."
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 import httpx
 
 from src.core.models.news import NewsArticle, NewsDigest
-from src.core.models.timeframe import Timeframe
+from src.core.models.timeframe import TIMEFRAME_H1, Timeframe
 from src.core.ports.news_provider import NewsProvider
 from src.utils.retry import retry_network_call
 
@@ -386,7 +386,7 @@ class NewsAPIProvider(NewsProvider):
 
     def get_news_summary(self, symbol: str) -> str:
         try:
-            digest = self.get_news_digest(symbol, Timeframe.H1)
+            digest = self.get_news_digest(symbol, TIMEFRAME_H1)
             if digest.summary:
                 return digest.summary
             return "No news found via NewsAPI."
@@ -3,6 +3,7 @@ from datetime import datetime
 from src.core.models.candle import Candle
 from src.core.models.signal import Signal
 from src.core.models.timeframe import Timeframe
+from src.features.arrays import candles_to_arrays
 from src.features.contracts.feature_contract import FeatureContract, ValidationStatus
 from src.features.derived.basic_derived import calculate_basic_derived
 from src.features.derived.ma_distance import calculate_ma_distances
@@ -10,6 +11,7 @@ from src.features.derived.ma_slope import calculate_ma_slopes
 from src.features.derived.momentum_derived import calculate_momentum_features
 from src.features.derived.volatility_derived import calculate_bb_metrics
 from src.features.indicators.indicator_engine import calculate_features
+from src.features.indicators.moving_averages import calculate_moving_averages
 from src.features.patterns.candlestick_patterns import detect_candlestick_patterns
 from src.features.regime.regime_detector import RegimeDetector
 from src.features.signals.crossovers import detect_crossovers
@@ -30,7 +32,11 @@ class BuildFeaturesJob:
         candles: list[Candle],
     ) -> JobResult[tuple[FeatureSnapshot, Signal]]:
         try:
-            validation_result = FeatureContract.validate(candles, min_count=200)
+            # Extract the price columns once; validation and the array-based
+            # feature calculators all read them.
+            arrays = candles_to_arrays(candles)
+
+            validation_result = FeatureContract.validate(arrays, min_count=200)
             if validation_result.status == ValidationStatus.INVALID:
                 reasons_text = "; ".join(validation_result.reasons)
                 return JobResult[tuple[FeatureSnapshot, Signal]](
@@ -39,26 +45,33 @@ class BuildFeaturesJob:
                     error=f"Invalid candle data: {reasons_text}",
                 )
 
-            indicators = calculate_features(candles)
-            derived = calculate_basic_derived(candles)
+            indicators = calculate_features(arrays)
+            derived = calculate_basic_derived(arrays)
             for key, value in derived.items():
                 if key in indicators:
                     continue
                 indicators[key] = value
 
-            momentum = calculate_momentum_features(candles)
+            momentum = calculate_momentum_features(arrays)
             for key, value in momentum.items():
                 if key in indicators:
                     continue
                 indicators[key] = value
 
-            ma_slopes = calculate_ma_slopes(candles, slope_window=10)
+            # The slope and crossover features read the same EMA/SMA series.
+            moving_averages = calculate_moving_averages(arrays)
+
+            ma_slopes = calculate_ma_slopes(
+                arrays, slope_window=10, moving_averages=moving_averages
+            )
             for key, value in ma_slopes.items():
                 if key in indicators:
                     continue
                 indicators[key] = value
 
-            crossovers = detect_crossovers(candles, lookback_bars=50)
+            crossovers = detect_crossovers(
+                arrays, lookback_bars=50, moving_averages=moving_averages
+            )
             ema9_sma50_crossover_type = crossovers.get("ema9_sma50_crossover_type")
             ema9_sma50_crossover_age_bars = crossovers.get("ema9_sma50_crossover_age_bars")
             sma50_sma200_raw = crossovers.get("sma50_sma200_crossover_type")
@@ -87,7 +100,7 @@ class BuildFeaturesJob:
             candlestick_pattern = candlestick.get("candlestick_pattern")
             candlestick_pattern_strength = candlestick.get("candlestick_pattern_strength")
 
-            volume_features = calculate_volume_features(candles, window=20)
+            volume_features = calculate_volume_features(arrays, window=20)
             volume_trend = volume_features.get("volume_trend")
 
             for key in ["volume_mean", "volume_zscore", "volume_confirmation_flag"]:
@@ -97,7 +110,7 @@ class BuildFeaturesJob:
                 if isinstance(raw, (int, float)):
                     indicators[key] = float(raw)
 
-            trend = TrendDetector.detect(candles, indicators)
+            trend = TrendDetector.detect(arrays, indicators)
             trend_direction = trend.get("trend_direction")
             trend_strength = trend.get("trend_strength")
 
@@ -114,7 +127,7 @@ class BuildFeaturesJob:
                     continue
                 indicators[key] = value
 
-            swings = detect_swings(candles, depth=5)
+            swings = detect_swings(arrays, depth=5)
             structure_result = classify_structure(swings)
             structure = structure_result.get("structure")
 
@@ -154,8 +167,8 @@ class BuildFeaturesJob:
                 structure=structure if isinstance(structure, str) else None,
             )
 
-            regime = RegimeDetector.detect(candles)
-            volatility = VolatilityEstimator.estimate(candles)
+            regime = RegimeDetector.detect(arrays)
+            volatility = VolatilityEstimator.estimate(arrays, indicators)
 
             signal = Signal(
                 symbol=symbol,
@@ -7,8 +7,18 @@ from typing import TYPE_CHECKING, Any
 from src.agents.news_analyst import NewsAnalyst
 from src.agents.synthesizer import Synthesizer
 from src.agents.technical_analyst import TechnicalAnalyst
-from src.core.models.rationale import Rationale, RationaleType
-from src.core.models.run import Run, RunStatus
+from src.core.models.rationale import (
+    RATIONALE_NEWS,
+    RATIONALE_SYNTHESIS,
+    RATIONALE_TECHNICAL,
+    Rationale,
+)
+from src.core.models.run import (
+    RUN_STATUS_FAILED,
+    RUN_STATUS_PENDING,
+    RUN_STATUS_SUCCESS,
+    Run,
+)
 from src.core.models.timeframe import Timeframe
 from src.core.ports.market_data_provider import MarketDataProvider
 from src.core.ports.news_provider import NewsProvider
@@ -161,7 +171,7 @@ class RunAgentsJob:
             symbol=symbol,
             timeframe=timeframe,
             start_time=datetime.now(),
-            status=RunStatus.PENDING,
+            status=RUN_STATUS_PENDING,
         )
         run_id: int | None = None
 
@@ -211,7 +221,7 @@ class RunAgentsJob:
             self.rationales_repository.save(
                 Rationale(
                     run_id=run_id,
-                    rationale_type=RationaleType.TECHNICAL,
+                    rationale_type=RATIONALE_TECHNICAL,
                     content=technical_view,
                 )
             )
@@ -394,7 +404,7 @@ class RunAgentsJob:
             self.rationales_repository.save(
                 Rationale(
                     run_id=run_id,
-                    rationale_type=RationaleType.NEWS,
+                    rationale_type=RATIONALE_NEWS,
                     content=news_content,
                     raw_data=news_digest.model_dump_json(),
                 )
@@ -435,7 +445,7 @@ class RunAgentsJob:
             self.rationales_repository.save(
                 Rationale(
                     run_id=run_id,
-                    rationale_type=RationaleType.SYNTHESIS,
+                    rationale_type=RATIONALE_SYNTHESIS,
                     content=synthesis_content,
                     raw_data=raw_data_json,
                 )
@@ -447,7 +457,7 @@ class RunAgentsJob:
 
             self.runs_repository.update_run(
                 run_id=run_id,
-                status=RunStatus.SUCCESS.value,
+                status=RUN_STATUS_SUCCESS.value,
                 end_time=datetime.now(),
                 error_message=None,
             )
@@ -465,7 +475,7 @@ class RunAgentsJob:
             if run_id is not None:
                 self.runs_repository.update_run(
                     run_id=run_id,
-                    status=RunStatus.FAILED.value,
+                    status=RUN_STATUS_FAILED.value,
                     end_time=datetime.now(),
                     error_message=str(error),
                 )
@@ -25,6 +25,9 @@ class MinuteLoop:
         self.clock = clock
         self.config = config or RuntimeConfig()
 
+    def close(self) -> None:
+        self.orchestrator.close()
+
     def start(
         self,
         symbol: str | None = None,
@@ -11,9 +11,19 @@ from src.agents.technical_analyst import TechnicalAnalyst
 from src.agents.verifier import VerifierAgent
 from src.core.logging_helpers import stage_timer
 from src.core.models.llm import LlmRequest
-from src.core.models.rationale import Rationale, RationaleType
+from src.core.models.rationale import (
+    RATIONALE_NEWS,
+    RATIONALE_SYNTHESIS,
+    RATIONALE_TECHNICAL,
+    Rationale,
+)
 from src.core.models.recommendation import Recommendation
-from src.core.models.run import Run, RunStatus
+from src.core.models.run import (
+    RUN_STATUS_FAILED,
+    RUN_STATUS_PENDING,
+    RUN_STATUS_SUCCESS,
+    Run,
+)
 from src.core.models.timeframe import Timeframe
 from src.core.models.verification import VerificationReport
 from src.core.pipeline_trace import PipelineTrace
@@ -77,7 +87,7 @@ class RuntimeOrchestrator:
             symbol=symbol,
             timeframe=timeframe,
             start_time=datetime.now(),
-            status=RunStatus.PENDING,
+            status=RUN_STATUS_PENDING,
         )
         run_id = self.storage.runs.create(run)
         self.logger.info(f"Starting run {run_id} for {symbol} on {timeframe.value}")
@@ -160,7 +170,7 @@ class RuntimeOrchestrator:
             self.trace.step_done(f"Technical analysis complete ({provider_model})")
             technical_rationale = Rationale(
                 run_id=run_id,
-                rationale_type=RationaleType.TECHNICAL,
+                rationale_type=RATIONALE_TECHNICAL,
                 content=technical_view,
                 raw_data=None,
                 provider_name=tech_llm_response.provider_name,
@@ -242,7 +252,7 @@ class RuntimeOrchestrator:
 
             news_rationale = Rationale(
                 run_id=run_id,
-                rationale_type=RationaleType.NEWS,
+                rationale_type=RATIONALE_NEWS,
                 content=news_content,
                 raw_data=news_raw_data,
                 provider_name=news_llm_response.provider_name if news_llm_response else None,
@@ -383,7 +393,7 @@ Provide your analysis as JSON."""
             )
             synthesis_rationale = Rationale(
                 run_id=run_id,
-                rationale_type=RationaleType.SYNTHESIS,
+                rationale_type=RATIONALE_SYNTHESIS,
                 content=synthesis_content,
                 raw_data=json.dumps(synthesis_debug) if synthesis_debug else None,
                 provider_name=synthesis_llm_response.provider_name
@@ -657,7 +667,7 @@ Generate a corrected synthesis. Do NOT add new facts not in the input data. Retu
                             )
                             synthesis_rationale = Rationale(
                                 run_id=run_id,
-                                rationale_type=RationaleType.SYNTHESIS,
+                                rationale_type=RATIONALE_SYNTHESIS,
                                 content=synthesis_content,
                                 raw_data=json.dumps(last_synthesis_debug)
                                 if last_synthesis_debug
@@ -770,10 +780,14 @@ Generate a corrected synthesis. Do NOT add new facts not in the input data. Retu
             self._mark_run_failed(run_id, str(e))
             return run_id
 
+    def close(self) -> None:
+        """Release the market data provider's connections."""
+        self.market_data_provider.close()
+
     def _mark_run_failed(self, run_id: int, error_message: str) -> None:
         self.storage.runs.update_run(
             run_id=run_id,
-            status=RunStatus.FAILED.value,
+            status=RUN_STATUS_FAILED.value,
             end_time=datetime.now(),
             error_message=error_message,
         )
@@ -781,7 +795,7 @@ Generate a corrected synthesis. Do NOT add new facts not in the input data. Retu
     def _mark_run_success(self, run_id: int) -> None:
         self.storage.runs.update_run(
             run_id=run_id,
-            status=RunStatus.SUCCESS.value,
+            status=RUN_STATUS_SUCCESS.value,
             end_time=datetime.now(),
             error_message=None,
         )
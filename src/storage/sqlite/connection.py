@@ -1,13 +1,55 @@
+import queue
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from pathlib import Path
 
 
+class ConnectionPool:
+    """
+    Keep up to ``size`` idle SQLite connections for reuse.
+
+    Checkouts never block: when every pooled connection is busy a fresh one is
+    opened, and connections beyond ``size`` are closed on release.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = 8) -> None:
+        self._connect = connect
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=size)
+
+    @contextmanager
+    def acquire(self) -> Generator[sqlite3.Connection, None, None]:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            connection.close()
+
+
 class DBConnection:
-    def __init__(self, db_path: str = "trading_assistant.db") -> None:
+    def __init__(self, db_path: str = "trading_assistant.db", pool_size: int = 8) -> None:
         self.db_path = db_path
+        self._local = threading.local()
         self._ensure_db_directory()
+        self._pool = ConnectionPool(self._connect, pool_size)
+        self._read_pool = ConnectionPool(self._connect_read_only, pool_size)
 
     def _ensure_db_directory(self) -> None:
         db_path_obj = Path(self.db_path)
@@ -15,19 +57,93 @@ class DBConnection:
         if db_directory != Path(".") and not db_directory.exists():
             db_directory.mkdir(parents=True, exist_ok=True)
 
+    def _connect(self) -> sqlite3.Connection:
+        # Pooled connections move between threads, one checkout at a time.
+        # Implicit transactions start with BEGIN IMMEDIATE so writers queue on
+        # the lock up front instead of failing with SQLITE_BUSY on upgrade.
+        connection = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level="IMMEDIATE"
+        )
+        connection.row_factory = sqlite3.Row
+        # WAL lets readers proceed while a writer holds the lock.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _connect_read_only(self) -> sqlite3.Connection:
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        self._pool.close()
+        self._read_pool.close()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        Group several repository writes into a single SQLite transaction.
+
+        Cursors opened via get_cursor() inside the block share one connection
+        and are committed together on exit (or rolled back on error). Nested
+        calls join the outer transaction.
+        """
+        if getattr(self._local, "connection", None) is not None:
+            yield
+            return
+
+        with self._pool.acquire() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._local.connection = connection
+            try:
+                yield
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self._local.connection = None
+
     @contextmanager
     def get_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
-        connection = sqlite3.connect(self.db_path)
-        connection.row_factory = sqlite3.Row
-        cursor = connection.cursor()
-        try:
-            yield cursor
-            connection.commit()
-        except Exception:
-            connection.rollback()
-            raise
-        finally:
-            connection.close()
+        shared_connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if shared_connection is not None:
+            yield shared_connection.cursor()
+            return
+
+        with self._pool.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                yield cursor
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def get_read_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """
+        Yield a cursor on a read-only connection.
+
+        Read-only connections never take the write lock, so lookups can run
+        alongside a writer. Inside transaction() the shared connection is
+        reused so uncommitted writes stay visible.
+        """
+        shared_connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if shared_connection is not None:
+            yield shared_connection.cursor()
+            return
+
+        with self._read_pool.acquire() as connection:
+            cursor = connection.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
 
     def run_migration(self, migration_path: str) -> None:
         path = Path(migration_path)
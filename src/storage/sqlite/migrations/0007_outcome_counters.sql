@@ -0,0 +1,19 @@
+CREATE TABLE IF NOT EXISTS outcome_counters (
+    symbol TEXT PRIMARY KEY,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR REPLACE INTO outcome_counters (symbol, wins, losses, draws, skipped)
+SELECT
+    j.symbol,
+    SUM(CASE WHEN UPPER(o.win_or_loss) = 'WIN' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN UPPER(o.win_or_loss) = 'LOSS' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN UPPER(o.win_or_loss) = 'DRAW' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN UPPER(o.win_or_loss) = 'VOID' THEN 1 ELSE 0 END)
+FROM outcomes o
+JOIN journal_entries j ON o.journal_entry_id = j.id
+WHERE UPPER(o.win_or_loss) IN ('WIN', 'LOSS', 'DRAW', 'VOID')
+GROUP BY j.symbol;
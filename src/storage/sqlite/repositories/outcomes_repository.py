@@ -1,6 +1,21 @@
 from src.core.models.outcome import Outcome
 from src.storage.sqlite.connection import DBConnection
 
+# One upsert per counter column; the symbol comes from the outcome's journal entry.
+_INCREMENT_COUNTER_QUERIES = {
+    result: f"""
+        INSERT INTO outcome_counters (symbol, {column})
+        SELECT symbol, 1 FROM journal_entries WHERE id = ?
+        ON CONFLICT(symbol) DO UPDATE SET {column} = {column} + 1
+    """
+    for result, column in (
+        ("WIN", "wins"),
+        ("LOSS", "losses"),
+        ("DRAW", "draws"),
+        ("VOID", "skipped"),
+    )
+}
+
 
 class OutcomesRepository:
     def __init__(self, db: DBConnection) -> None:
@@ -24,6 +39,10 @@ class OutcomesRepository:
             row_id = cursor.lastrowid
             if row_id is None:
                 raise RuntimeError("Failed to get lastrowid after insert")
+
+            increment_query = _INCREMENT_COUNTER_QUERIES.get(outcome.win_or_loss.upper())
+            if increment_query is not None:
+                cursor.execute(increment_query, (outcome.journal_entry_id,))
             return row_id
 
     def get_all_with_details(self) -> list[dict[str, str | int | None]]:
@@ -48,3 +67,62 @@ class OutcomesRepository:
                 row_dict: dict[str, str | int | None] = dict(row)
                 result.append(row_dict)
             return result
+
+    def get_counters(self) -> list[tuple[str, int, int, int, int]]:
+        """
+        Return the running (symbol, wins, losses, draws, skipped) counters.
+
+        The counters are maintained by save(), so this reads one row per symbol
+        regardless of how many outcomes have been logged.
+        """
+        query = """
+            SELECT symbol, wins, losses, draws, skipped
+            FROM outcome_counters
+            ORDER BY symbol
+        """
+        with self.db.get_read_cursor() as cursor:
+            cursor.execute(query)
+            return [
+                (
+                    str(row["symbol"]),
+                    int(row["wins"]),
+                    int(row["losses"]),
+                    int(row["draws"]),
+                    int(row["skipped"]),
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def get_winrate_stats(self) -> list[tuple[str, int, int, int, int]]:
+        """
+        Return (symbol, wins, losses, draws, skipped) per symbol, aggregated in SQL.
+
+        Recomputes from the full outcome history; useful to reconcile against
+        get_counters(). Only symbols with at least one WIN/LOSS/DRAW/VOID outcome
+        are included.
+        """
+        query = """
+            SELECT
+                COALESCE(j.symbol, 'UNKNOWN') AS symbol,
+                SUM(CASE WHEN UPPER(o.win_or_loss) = 'WIN' THEN 1 ELSE 0 END) AS wins,
+                SUM(CASE WHEN UPPER(o.win_or_loss) = 'LOSS' THEN 1 ELSE 0 END) AS losses,
+                SUM(CASE WHEN UPPER(o.win_or_loss) = 'DRAW' THEN 1 ELSE 0 END) AS draws,
+                SUM(CASE WHEN UPPER(o.win_or_loss) = 'VOID' THEN 1 ELSE 0 END) AS skipped
+            FROM outcomes o
+            JOIN journal_entries j ON o.journal_entry_id = j.id
+            WHERE UPPER(o.win_or_loss) IN ('WIN', 'LOSS', 'DRAW', 'VOID')
+            GROUP BY COALESCE(j.symbol, 'UNKNOWN')
+            ORDER BY symbol
+        """
+        with self.db.get_read_cursor() as cursor:
+            cursor.execute(query)
+            return [
+                (
+                    str(row["symbol"]),
+                    int(row["wins"]),
+                    int(row["losses"]),
+                    int(row["draws"]),
+                    int(row["skipped"]),
+                )
+                for row in cursor.fetchall()
+            ]
@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from src.core.models.recommendation import Recommendation
 from src.core.models.timeframe import Timeframe
@@ -11,7 +11,7 @@ class RecommendationsRepository:
 
     def get_by_run_id(self, run_id: int) -> Recommendation | None:
         query = "SELECT * FROM recommendations WHERE run_id = ? ORDER BY id DESC LIMIT 1"
-        with self.db.get_cursor() as cursor:
+        with self.db.get_read_cursor() as cursor:
             cursor.execute(query, (run_id,))
             row = cursor.fetchone()
             if row:
@@ -28,9 +28,9 @@ class RecommendationsRepository:
                     row_dict["reason_codes"] = []
                 elif isinstance(reason_codes_value, str):
                     try:
-                        parsed = json.loads(reason_codes_value)
+                        parsed = orjson.loads(reason_codes_value)
                         row_dict["reason_codes"] = parsed if isinstance(parsed, list) else []
-                    except (TypeError, ValueError, json.JSONDecodeError):
+                    except (TypeError, ValueError, orjson.JSONDecodeError):
                         row_dict["reason_codes"] = []
                 elif isinstance(reason_codes_value, list):
                     row_dict["reason_codes"] = reason_codes_value
@@ -54,7 +54,7 @@ class RecommendationsRepository:
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
-        reason_codes_json = json.dumps(list(recommendation.reason_codes))
+        reason_codes_json = orjson.dumps(list(recommendation.reason_codes)).decode()
         with self.db.get_cursor() as cursor:
             cursor.execute(
                 query,
@@ -76,7 +76,7 @@ class RecommendationsRepository:
 
     def get_latest(self) -> Recommendation | None:
         query = "SELECT * FROM recommendations ORDER BY id DESC LIMIT 1"
-        with self.db.get_cursor() as cursor:
+        with self.db.get_read_cursor() as cursor:
             cursor.execute(query)
             row = cursor.fetchone()
             if row:
@@ -93,9 +93,9 @@ class RecommendationsRepository:
                     row_dict["reason_codes"] = []
                 elif isinstance(reason_codes_value, str):
                     try:
-                        parsed = json.loads(reason_codes_value)
+                        parsed = orjson.loads(reason_codes_value)
                         row_dict["reason_codes"] = parsed if isinstance(parsed, list) else []
-                    except (TypeError, ValueError, json.JSONDecodeError):
+                    except (TypeError, ValueError, orjson.JSONDecodeError):
                         row_dict["reason_codes"] = []
                 elif isinstance(reason_codes_value, list):
                     row_dict["reason_codes"] = reason_codes_value
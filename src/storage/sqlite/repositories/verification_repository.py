@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from src.core.models.verification import VerificationReport
 from src.storage.sqlite.connection import DBConnection
@@ -9,7 +9,7 @@ class VerificationRepository:
         self.db = db
 
     def create(self, run_id: int, report: VerificationReport) -> int:
-        issues_json = json.dumps(
+        issues_json = orjson.dumps(
             [
                 {
                     "code": issue.code,
@@ -19,7 +19,7 @@ class VerificationRepository:
                 }
                 for issue in report.issues
             ]
-        )
+        ).decode()
 
         query = """
             INSERT INTO verification_reports (
@@ -62,7 +62,7 @@ class VerificationRepository:
                 return None
 
             row_dict = dict(row)
-            issues_data = json.loads(row_dict["issues_json"])
+            issues_data = orjson.loads(row_dict["issues_json"])
 
             from src.core.models.verification import (
                 VerificationIssue,
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from src.core.ports.storage import (
     JournalRepositoryPort,
     OutcomesRepositoryPort,
@@ -42,3 +45,8 @@ class SqliteStorage(Storage):
     @property
     def outcomes(self) -> OutcomesRepositoryPort:
         return self._outcomes_repo
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._db.transaction():
+            yield
@@ -0,0 +1,52 @@
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker that opens after ``failure_threshold`` consecutive
+    failures within ``failure_window`` seconds.
+
+    While open, ``allow`` returns False for ``cooldown`` seconds. After that,
+    calls are let through again; a failure before the next success reopens the
+    breaker immediately.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, failure_window: float = 60.0, cooldown: float = 30.0
+    ) -> None:
+        if failure_threshold <= 0 or failure_window <= 0 or cooldown <= 0:
+            raise ValueError("failure_threshold, failure_window and cooldown must be positive")
+        self._failure_threshold = failure_threshold
+        self._failure_window = failure_window
+        self._cooldown = cooldown
+        self._failure_count = 0
+        self._first_failure_at = 0.0
+        self._opened_until: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            return self._opened_until is None or time.monotonic() >= self._opened_until
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failure_count = 0
+            self._opened_until = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._opened_until is not None:
+                # A failed trial call after the cooldown reopens straight away.
+                self._opened_until = now + self._cooldown
+                return
+
+            if self._failure_count == 0 or now - self._first_failure_at > self._failure_window:
+                self._failure_count = 0
+                self._first_failure_at = now
+
+            self._failure_count += 1
+            if self._failure_count >= self._failure_threshold:
+                self._failure_count = 0
+                self._opened_until = now + self._cooldown
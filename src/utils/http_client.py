@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import weakref
+from typing import Self
+
+import httpx
+
+
+class HttpClientOwner:
+    """
+    Lifecycle for classes that own one pooled ``httpx.Client``.
+
+    Subclasses call ``_own_client`` right after building their client. close()
+    is idempotent and the owner works as a context manager. If close() is never
+    called, weakref.finalize closes the pool once the owner is collected, and
+    also at interpreter exit, which __del__ does not guarantee.
+    """
+
+    _close_client: weakref.finalize[[], HttpClientOwner]
+
+    def _own_client(self, client: httpx.Client) -> None:
+        self._close_client = weakref.finalize(self, client.close)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client; safe to call more than once."""
+        self._close_client()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import orjson
 
 
 def extract_json_from_text(text: str) -> str | None:
@@ -21,8 +21,8 @@ def try_parse_json(text: str) -> dict[str, object] | None:
         return None
 
     try:
-        parsed = json.loads(text)
-    except (TypeError, ValueError, json.JSONDecodeError):
+        parsed = orjson.loads(text)
+    except (TypeError, ValueError, orjson.JSONDecodeError):
         return None
 
     if isinstance(parsed, dict):
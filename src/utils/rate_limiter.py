@@ -0,0 +1,36 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing ``rate`` calls per ``period`` seconds.
+
+    Bursts up to ``rate`` calls pass immediately; beyond that, ``acquire``
+    blocks until a token has been refilled.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._refill_per_second = rate / period
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
+                self._updated_at = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait_seconds = (1.0 - self._tokens) / self._refill_per_second
+
+            time.sleep(wait_seconds)
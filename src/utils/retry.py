@@ -4,27 +4,61 @@ from typing import Any, TypeVar
 import httpx
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
+from tenacity.retry import retry_base
 
 T = TypeVar("T")
 
+_TRANSIENT_EXCEPTION_TYPES = (
+    httpx.TransportError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    TimeoutError,
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """True for transport failures, timeouts, HTTP 429 and 5xx responses."""
+    return isinstance(error, _TRANSIENT_EXCEPTION_TYPES) or _is_retryable_status_error(error)
+
+
+def _is_retryable_status_error(error: BaseException) -> bool:
+    if not isinstance(error, httpx.HTTPStatusError):
+        return False
+    status_code = error.response.status_code
+    return status_code == 429 or status_code >= 500
+
 
 def retry_network_call(
     func: Callable[..., T] | None = None,
     max_attempts: int = 3,
     min_wait: float = 2.0,
     max_wait: float = 10.0,
+    retry_on_status: bool = False,
+    reraise: bool = False,
 ) -> Any:
+    """
+    Retry transient network failures with jittered exponential backoff.
+
+    Jitter keeps concurrent callers from retrying in lockstep. With
+    retry_on_status, HTTP 429 and 5xx responses are retried as well. With
+    reraise, the last error is raised as-is instead of wrapped in RetryError.
+    """
+
     def decorator(f: Callable[..., T]) -> Any:
+        retry_condition: retry_base = retry_if_exception_type(_TRANSIENT_EXCEPTION_TYPES)
+        if retry_on_status:
+            retry_condition = retry_condition | retry_if_exception(_is_retryable_status_error)
+
         retry_decorator = retry(
             stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-            retry=retry_if_exception_type(
-                (httpx.TransportError, httpx.TimeoutException, httpx.NetworkError, TimeoutError)
-            ),
+            wait=wait_exponential_jitter(initial=min_wait, max=max_wait),
+            retry=retry_condition,
+            reraise=reraise,
         )
         return retry_decorator(f)
 
@@ -3,6 +3,9 @@ from typing import Any
 from unittest.mock import Mock
 
 import httpx
+import numpy as np
+import orjson
+import pytest
 
 from src.core.models.candle import Candle
 from src.core.models.timeframe import Timeframe
@@ -38,7 +41,7 @@ def test_fetch_candles_parses_oanda_response() -> None:
     }
 
     mock_response = Mock(spec=httpx.Response)
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.status_code = 200
 
     mock_client = Mock(spec=httpx.Client)
@@ -95,7 +98,7 @@ def test_fetch_candles_skips_incomplete_candles() -> None:
     }
 
     mock_response = Mock(spec=httpx.Response)
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.status_code = 200
 
     mock_client = Mock(spec=httpx.Client)
@@ -118,7 +121,7 @@ def test_fetch_candles_with_date_range() -> None:
     mock_response_data: dict[str, list[dict[str, Any]]] = {"candles": []}
 
     mock_response = Mock(spec=httpx.Response)
-    mock_response.json.return_value = mock_response_data
+    mock_response.content = orjson.dumps(mock_response_data)
     mock_response.status_code = 200
 
     mock_client = Mock(spec=httpx.Client)
@@ -152,3 +155,111 @@ def test_convert_timeframe_to_oanda() -> None:
     assert provider._convert_timeframe_to_oanda(Timeframe.M15) == "M15"
     assert provider._convert_timeframe_to_oanda(Timeframe.H1) == "H1"
     assert provider._convert_timeframe_to_oanda(Timeframe.D1) == "D"
+
+
+def test_close_releases_client() -> None:
+    provider = OandaProvider(api_key="test-key", base_url="https://api.test.com")
+
+    assert provider.client.timeout.connect == 10.0
+
+    provider.close()
+    assert provider.client.is_closed
+
+
+def test_context_manager_closes_client_once() -> None:
+    with OandaProvider(api_key="test-key", base_url="https://api.test.com") as provider:
+        assert not provider.client.is_closed
+
+    assert provider.client.is_closed
+    provider.close()
+
+
+def test_fetch_candles_serves_repeated_reads_from_cache() -> None:
+    mock_response = Mock(spec=httpx.Response)
+    mock_response_data: dict[str, Any] = {
+        "candles": [
+            {
+                "time": "2024-01-01T12:00:00.000000000Z",
+                "mid": {"o": "1.1000", "h": "1.1010", "l": "1.0990", "c": "1.1005"},
+                "volume": 1000,
+                "complete": True,
+            }
+        ]
+    }
+    mock_response.content = orjson.dumps(mock_response_data)
+    mock_response.status_code = 200
+
+    mock_client = Mock(spec=httpx.Client)
+    mock_client.get.return_value = mock_response
+
+    provider = OandaProvider(api_key="test-key", base_url="https://api.test.com")
+    provider.client = mock_client
+
+    first = provider.fetch_candles(symbol="EUR_USD", timeframe=Timeframe.H1, count=1)
+    second = provider.fetch_candles(symbol="EUR_USD", timeframe=Timeframe.H1, count=1)
+    provider.fetch_candles(symbol="EUR_USD", timeframe=Timeframe.H1, count=2)
+
+    assert first == second
+    assert first is not second
+    assert mock_client.get.call_count == 2
+
+
+def test_fetch_candles_columnar_matches_row_parsing() -> None:
+    mock_response = Mock(spec=httpx.Response)
+    mock_response_data: dict[str, Any] = {
+        "candles": [
+            {
+                "time": "2024-01-01T12:00:00.000000000Z",
+                "mid": {"o": "1.1000", "h": "1.1010", "l": "1.0990", "c": "1.1005"},
+                "volume": 1000,
+                "complete": True,
+            },
+            {
+                "time": "2024-01-01T13:00:00.000000000Z",
+                "mid": {"o": "1.1005", "h": "1.1020", "l": "1.1000", "c": "1.1015"},
+                "volume": 1500,
+                "complete": False,
+            },
+            {
+                "time": "2024-01-01T14:00:00.000000000Z",
+                "mid": {"o": "1.1015", "h": "1.1030", "l": "1.1010", "c": "1.1025"},
+                "volume": 1200,
+                "complete": True,
+            },
+        ]
+    }
+    mock_response.content = orjson.dumps(mock_response_data)
+    mock_response.status_code = 200
+
+    mock_client = Mock(spec=httpx.Client)
+    mock_client.get.return_value = mock_response
+
+    provider = OandaProvider(api_key="test-key", base_url="https://api.test.com")
+    provider.client = mock_client
+
+    arrays = provider.fetch_candles_columnar(symbol="EUR_USD", timeframe=Timeframe.H1, count=3)
+    candles = provider.fetch_candles(symbol="EUR_USD", timeframe=Timeframe.H1, count=3)
+
+    assert len(arrays) == len(candles) == 2
+    assert arrays.close.dtype == np.float64
+    assert arrays.close.tolist() == [candle.close for candle in candles]
+    assert arrays.volume.tolist() == [candle.volume for candle in candles]
+    expected_timestamps = np.array(
+        ["2024-01-01T12:00:00", "2024-01-01T14:00:00"], dtype="datetime64[ns]"
+    )
+    assert np.array_equal(arrays.timestamp, expected_timestamps)
+
+
+def test_fetch_candles_reports_bad_request_without_json_body() -> None:
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.content = b"<html>Bad Request</html>"
+    mock_response.status_code = 400
+
+    mock_client = Mock(spec=httpx.Client)
+    mock_client.get.return_value = mock_response
+
+    provider = OandaProvider(api_key="test-key", base_url="https://api.test.com")
+    provider.client = mock_client
+
+    with pytest.raises(ValueError, match="OANDA API error: Bad Request"):
+        provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=1)
@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 
 import httpx
+import orjson
 
 from src.core.models.llm import LlmRequest
 from src.core.ports.llm_provider import HealthCheckResult
@@ -43,11 +44,10 @@ def test_ollama_client_generate_with_request_uses_model_from_request():
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"message": {"content": "test response"}}
+        mock_response.content = orjson.dumps({"message": {"content": "test response"}})
         mock_response.raise_for_status = Mock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        mock_client_class.return_value.__exit__.return_value = None
+        mock_client_class.return_value = mock_client
 
         client = OllamaClient(
             base_url="http://localhost:11434", model="default-model", provider_name="ollama_local"
@@ -68,7 +68,7 @@ def test_ollama_client_generate_with_request_uses_model_from_request():
         assert response.text == "test response"
         assert response.provider_name == "ollama_local"
         call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["model"] == "request-model"
+        assert orjson.loads(call_args[1]["content"])["model"] == "request-model"
 
 
 def test_ollama_client_generate_with_request_uses_default_model():
@@ -76,11 +76,10 @@ def test_ollama_client_generate_with_request_uses_default_model():
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"message": {"content": "test response"}}
+        mock_response.content = orjson.dumps({"message": {"content": "test response"}})
         mock_response.raise_for_status = Mock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        mock_client_class.return_value.__exit__.return_value = None
+        mock_client_class.return_value = mock_client
 
         client = OllamaClient(
             base_url="http://localhost:11434", model="default-model", provider_name="ollama_local"
@@ -99,15 +98,14 @@ def test_ollama_client_generate_with_request_uses_default_model():
 
         assert response.model_name == "default-model"
         call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["model"] == "default-model"
+        assert orjson.loads(call_args[1]["content"])["model"] == "default-model"
 
 
 def test_ollama_client_generate_with_request_handles_error():
     with patch("httpx.Client") as mock_client_class:
         mock_client = Mock()
         mock_client.post.side_effect = httpx.RequestError("Network error")
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        mock_client_class.return_value.__exit__.return_value = None
+        mock_client_class.return_value = mock_client
 
         client = OllamaClient(base_url="http://localhost:11434", provider_name="ollama_local")
         request = LlmRequest(
@@ -131,3 +129,29 @@ def test_ollama_client_get_provider_name():
         base_url="http://localhost:11434", provider_name="ollama_server", model="test"
     )
     assert client.get_provider_name() == "ollama_server"
+
+
+def test_ollama_client_generate_stream_yields_chunks():
+    body = (
+        b'{"message": {"role": "assistant", "content": "Hel"}, "done": false}\n'
+        b'{"message": {"role": "assistant", "content": "lo"}, "done": false}\n'
+        b'{"message": {"role": "assistant", "content": ""}, "done": true}\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert b'"stream":true' in request.content.replace(b" ", b"")
+        return httpx.Response(200, content=body)
+
+    client = OllamaClient(base_url="http://localhost:11434", model="llama3:latest")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert list(client.generate_stream("system", "user")) == ["Hel", "lo"]
+
+
+def test_ollama_client_close_is_idempotent():
+    client = OllamaClient(base_url="http://localhost:11434")
+
+    client.close()
+    client.close()
+
+    assert client.client.is_closed
@@ -0,0 +1,186 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import httpx
+
+from src.core.models.timeframe import Timeframe
+from src.data_providers.cache import CandleFileCache
+from src.data_providers.forex.twelve_data_provider import TwelveDataProvider
+
+
+def _make_provider(response_data: dict[str, Any]) -> tuple[TwelveDataProvider, Mock]:
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.json.return_value = response_data
+    mock_response.status_code = 200
+
+    mock_client = Mock(spec=httpx.Client)
+    mock_client.get.return_value = mock_response
+
+    provider = TwelveDataProvider(api_key="test-key", base_url="https://api.test.com")
+    provider.client = mock_client
+    return provider, mock_client
+
+
+def test_fetch_candles_parses_twelve_data_response() -> None:
+    provider, mock_client = _make_provider(
+        {
+            "status": "ok",
+            "values": [
+                {
+                    "datetime": "2024-01-01 13:00:00",
+                    "open": "1.1005",
+                    "high": "1.1020",
+                    "low": "1.1000",
+                    "close": "1.1015",
+                },
+                {
+                    "datetime": "2024-01-01 12:00:00",
+                    "open": "1.1000",
+                    "high": "1.1010",
+                    "low": "1.0990",
+                    "close": "1.1005",
+                    "volume": "1000",
+                },
+            ],
+        }
+    )
+
+    candles = provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=2)
+
+    assert [candle.timestamp for candle in candles] == [
+        datetime(2024, 1, 1, 12, 0, 0),
+        datetime(2024, 1, 1, 13, 0, 0),
+    ]
+    assert candles[0].open == 1.1000
+    assert candles[0].volume == 1000.0
+    assert candles[1].close == 1.1015
+    assert candles[1].volume == 0.0
+
+    params = mock_client.get.call_args.kwargs["params"]
+    assert params["symbol"] == "EUR/USD"
+    assert params["interval"] == "1h"
+
+
+def test_close_releases_client() -> None:
+    provider = TwelveDataProvider(api_key="test-key", base_url="https://api.test.com")
+
+    assert provider.client.timeout.connect == 10.0
+
+    provider.close()
+    assert provider.client.is_closed
+
+
+def test_context_manager_closes_client_once() -> None:
+    with TwelveDataProvider(api_key="test-key", base_url="https://api.test.com") as provider:
+        assert not provider.client.is_closed
+
+    assert provider.client.is_closed
+    provider.close()
+
+
+def test_fetch_candles_serves_repeated_reads_from_file_cache(tmp_path: Path) -> None:
+    provider, mock_client = _make_provider(
+        {
+            "status": "ok",
+            "values": [
+                {
+                    "datetime": "2024-01-01 12:00:00",
+                    "open": "1.1000",
+                    "high": "1.1010",
+                    "low": "1.0990",
+                    "close": "1.1005",
+                },
+            ],
+        }
+    )
+    provider.cache = CandleFileCache(tmp_path)
+
+    first = provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=1)
+    second = provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=1)
+
+    assert second == first
+    mock_client.get.assert_called_once()
+    assert "test-key" not in "".join(path.name for path in tmp_path.rglob("*"))
+
+
+def test_fetch_candles_parses_daily_dates() -> None:
+    provider, _ = _make_provider(
+        {
+            "status": "ok",
+            "values": [
+                {
+                    "datetime": "2024-01-02",
+                    "open": "1.1000",
+                    "high": "1.1010",
+                    "low": "1.0990",
+                    "close": "1.1005",
+                },
+            ],
+        }
+    )
+
+    candles = provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.D1, count=1)
+
+    assert [candle.timestamp for candle in candles] == [datetime(2024, 1, 2)]
+
+
+def test_fetch_candles_batch_keeps_request_order_and_isolates_errors() -> None:
+    close_by_symbol = {"EUR/USD": "1.1", "XAU/USD": "2000.0"}
+
+    def fake_get(url: str, params: dict[str, Any]) -> Mock:
+        response = Mock(spec=httpx.Response)
+        response.status_code = 200
+        if params["symbol"] == "BAD/PAIR":
+            response.json.return_value = {"status": "error", "message": "unknown symbol"}
+        else:
+            response.json.return_value = {
+                "status": "ok",
+                "values": [
+                    {
+                        "datetime": "2024-01-01 12:00:00",
+                        "open": close_by_symbol[params["symbol"]],
+                        "high": close_by_symbol[params["symbol"]],
+                        "low": close_by_symbol[params["symbol"]],
+                        "close": close_by_symbol[params["symbol"]],
+                    },
+                ],
+            }
+        return response
+
+    provider = TwelveDataProvider(api_key="test-key", base_url="https://api.test.com")
+    provider.client = Mock(spec=httpx.Client)
+    provider.client.get.side_effect = fake_get
+
+    results = provider.fetch_candles_batch(
+        [
+            ("EURUSD", Timeframe.H1, 1),
+            ("BAD_PAIR", Timeframe.H1, 1),
+            ("XAU/USD", Timeframe.H1, 1),
+        ],
+        max_concurrency=3,
+    )
+
+    assert isinstance(results[0], list)
+    assert isinstance(results[2], list)
+    assert results[0][0].close == 1.1
+    assert isinstance(results[1], ValueError)
+    assert results[2][0].close == 2000.0
+    assert provider.client.get.call_count == 3
+
+
+def test_fetch_candles_sorts_out_of_order_values() -> None:
+    provider, _ = _make_provider(
+        {
+            "status": "ok",
+            "values": [
+                {"datetime": day, "open": "1", "high": "1", "low": "1", "close": "1"}
+                for day in ["2024-01-02", "2024-01-03", "2024-01-01"]
+            ],
+        }
+    )
+
+    candles = provider.fetch_candles(symbol="EURUSD", timeframe=Timeframe.D1, count=3)
+
+    assert [candle.timestamp.day for candle in candles] == [1, 2, 3]
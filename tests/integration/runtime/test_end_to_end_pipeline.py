@@ -78,135 +78,138 @@ def test_end_to_end_pipeline_offline():
         artifacts_dir = Path(tmpdir) / "artifacts"
 
         db = DBConnection(str(db_path))
-        db.run_migration("src/storage/sqlite/migrations")
-
-        storage = SqliteStorage(db)
-        artifact_store = ArtifactStore(artifacts_dir)
-
-        mock_tech_provider = MockLlmProvider("test_provider", "test_model")
-
-        from src.agents.news_analyst import NewsAnalyst
-        from src.agents.synthesizer import Synthesizer
-        from src.agents.technical_analyst import TechnicalAnalyst
-        from src.agents.verifier import VerifierAgent
-        from src.core.models.llm import LlmResponse
-        from src.core.ports.llm_tasks import (
-            TASK_NEWS_ANALYSIS,
-            TASK_SYNTHESIS,
-            TASK_TECH_ANALYSIS,
-            TASK_VERIFICATION,
-        )
-        from src.llm.providers.llm_router import (
-            LlmRouter,
-            LlmRouteStep,
-            LlmRoutingConfig,
-            LlmTaskRouting,
-        )
-
-        providers: dict[str, LlmProvider] = {"test_provider": mock_tech_provider}
-        routing_config = LlmRoutingConfig(
-            router_mode="sequential",
-            verifier_enabled=True,
-            max_retries=1,
-            timeout_seconds=60.0,
-            temperature=0.2,
-        )
-
-        task_routings: dict[str, LlmTaskRouting] = {
-            TASK_TECH_ANALYSIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-            TASK_NEWS_ANALYSIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-            TASK_SYNTHESIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-            TASK_VERIFICATION: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-        }
-
-        router = LlmRouter(providers, routing_config, task_routings)
-
-        def mock_generate(task, system_prompt, user_prompt):
-            if task == TASK_VERIFICATION:
-                return LlmResponse(
-                    text='{"passed": true, "issues": [], "suggested_fix": null, "policy_version": "1.0"}',
-                    provider_name="test_provider",
-                    model_name="test_model",
-                    latency_ms=50,
-                    attempts=1,
-                    error=None,
-                )
-            elif task == TASK_SYNTHESIS:
-                return LlmResponse(
-                    text='{"action": "CALL", "confidence": 0.75, "brief": "Test recommendation"}',
-                    provider_name="test_provider",
-                    model_name="test_model",
-                    latency_ms=100,
-                    attempts=1,
-                    error=None,
-                )
-            else:
-                return LlmResponse(
-                    text="Test analysis",
-                    provider_name="test_provider",
-                    model_name="test_model",
-                    latency_ms=80,
-                    attempts=1,
-                    error=None,
-                )
-
-        from unittest.mock import patch
-
-        from src.storage.sqlite.repositories.verification_repository import (
-            VerificationRepository,
-        )
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+
+            storage = SqliteStorage(db)
+            artifact_store = ArtifactStore(artifacts_dir)
+
+            mock_tech_provider = MockLlmProvider("test_provider", "test_model")
+
+            from src.agents.news_analyst import NewsAnalyst
+            from src.agents.synthesizer import Synthesizer
+            from src.agents.technical_analyst import TechnicalAnalyst
+            from src.agents.verifier import VerifierAgent
+            from src.core.models.llm import LlmResponse
+            from src.core.ports.llm_tasks import (
+                TASK_NEWS_ANALYSIS,
+                TASK_SYNTHESIS,
+                TASK_TECH_ANALYSIS,
+                TASK_VERIFICATION,
+            )
+            from src.llm.providers.llm_router import (
+                LlmRouter,
+                LlmRouteStep,
+                LlmRoutingConfig,
+                LlmTaskRouting,
+            )
 
-        with patch.object(router, "generate", side_effect=mock_generate):
-            technical_analyst = TechnicalAnalyst(router)
-            news_analyst = NewsAnalyst(router)
-            synthesizer = Synthesizer(router)
-            verifier = VerifierAgent(router)
-
-            verification_repo = VerificationRepository(db)
-
-            orchestrator = RuntimeOrchestrator(
-                storage=storage,
-                artifact_store=artifact_store,
-                market_data_provider=MockMarketDataProvider(),
-                news_provider=MockNewsProvider(),
-                technical_analyst=technical_analyst,
-                news_analyst=news_analyst,
-                synthesizer=synthesizer,
-                candles_repository=None,
-                verifier_agent=verifier,
-                verification_repository=verification_repo,
+            providers: dict[str, LlmProvider] = {"test_provider": mock_tech_provider}
+            routing_config = LlmRoutingConfig(
+                router_mode="sequential",
                 verifier_enabled=True,
+                max_retries=1,
+                timeout_seconds=60.0,
+                temperature=0.2,
+            )
+
+            task_routings: dict[str, LlmTaskRouting] = {
+                TASK_TECH_ANALYSIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+                TASK_NEWS_ANALYSIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+                TASK_SYNTHESIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+                TASK_VERIFICATION: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+            }
+
+            router = LlmRouter(providers, routing_config, task_routings)
+
+            def mock_generate(task, system_prompt, user_prompt):
+                if task == TASK_VERIFICATION:
+                    return LlmResponse(
+                        text='{"passed": true, "issues": [], "suggested_fix": null, "policy_version": "1.0"}',
+                        provider_name="test_provider",
+                        model_name="test_model",
+                        latency_ms=50,
+                        attempts=1,
+                        error=None,
+                    )
+                elif task == TASK_SYNTHESIS:
+                    return LlmResponse(
+                        text='{"action": "CALL", "confidence": 0.75, "brief": "Test recommendation"}',
+                        provider_name="test_provider",
+                        model_name="test_model",
+                        latency_ms=100,
+                        attempts=1,
+                        error=None,
+                    )
+                else:
+                    return LlmResponse(
+                        text="Test analysis",
+                        provider_name="test_provider",
+                        model_name="test_model",
+                        latency_ms=80,
+                        attempts=1,
+                        error=None,
+                    )
+
+            from unittest.mock import patch
+
+            from src.storage.sqlite.repositories.verification_repository import (
+                VerificationRepository,
             )
 
-            run_id = orchestrator.run_analysis("EURUSD", Timeframe.H1)
+            with patch.object(router, "generate", side_effect=mock_generate):
+                technical_analyst = TechnicalAnalyst(router)
+                news_analyst = NewsAnalyst(router)
+                synthesizer = Synthesizer(router)
+                verifier = VerifierAgent(router)
+
+                verification_repo = VerificationRepository(db)
+
+                orchestrator = RuntimeOrchestrator(
+                    storage=storage,
+                    artifact_store=artifact_store,
+                    market_data_provider=MockMarketDataProvider(),
+                    news_provider=MockNewsProvider(),
+                    technical_analyst=technical_analyst,
+                    news_analyst=news_analyst,
+                    synthesizer=synthesizer,
+                    candles_repository=None,
+                    verifier_agent=verifier,
+                    verification_repository=verification_repo,
+                    verifier_enabled=True,
+                )
 
-            assert run_id > 0
+                run_id = orchestrator.run_analysis("EURUSD", Timeframe.H1)
 
-            recommendation = storage.recommendations.get_latest()
-            assert recommendation is not None
-            assert recommendation.symbol == "EURUSD"
-            assert recommendation.timeframe == Timeframe.H1
+                assert run_id > 0
 
-            rationales = storage.rationales.get_by_run_id(run_id)
-            assert len(rationales) >= 3
+                recommendation = storage.recommendations.get_latest()
+                assert recommendation is not None
+                assert recommendation.symbol == "EURUSD"
+                assert recommendation.timeframe == Timeframe.H1
 
-            verification_report = verification_repo.get_latest_by_run_id(run_id)
-            assert verification_report is not None
-            assert verification_report.passed is True
+                rationales = storage.rationales.get_by_run_id(run_id)
+                assert len(rationales) >= 3
 
-            run_dir = artifacts_dir / f"run_{run_id}"
-            assert run_dir.exists()
+                verification_report = verification_repo.get_latest_by_run_id(run_id)
+                assert verification_report is not None
+                assert verification_report.passed is True
 
-            llm_dir = run_dir / "llm"
-            assert llm_dir.exists()
+                run_dir = artifacts_dir / f"run_{run_id}"
+                assert run_dir.exists()
+
+                llm_dir = run_dir / "llm"
+                assert llm_dir.exists()
+        finally:
+            db.close()
 
 
 def test_end_to_end_pipeline_with_trace():
@@ -217,121 +220,126 @@ def test_end_to_end_pipeline_with_trace():
         artifacts_dir = Path(tmpdir) / "artifacts"
 
         db = DBConnection(str(db_path))
-        db.run_migration("src/storage/sqlite/migrations")
-
-        storage = SqliteStorage(db)
-        artifact_store = ArtifactStore(artifacts_dir)
-
-        mock_tech_provider = MockLlmProvider("test_provider", "test_model")
-
-        from src.agents.news_analyst import NewsAnalyst
-        from src.agents.synthesizer import Synthesizer
-        from src.agents.technical_analyst import TechnicalAnalyst
-        from src.core.models.llm import LlmResponse
-        from src.core.ports.llm_tasks import (
-            TASK_NEWS_ANALYSIS,
-            TASK_SYNTHESIS,
-            TASK_TECH_ANALYSIS,
-        )
-        from src.llm.providers.llm_router import (
-            LlmRouter,
-            LlmRouteStep,
-            LlmRoutingConfig,
-            LlmTaskRouting,
-        )
-
-        providers: dict[str, LlmProvider] = {"test_provider": mock_tech_provider}
-        routing_config = LlmRoutingConfig(
-            router_mode="sequential",
-            verifier_enabled=False,
-            max_retries=1,
-            timeout_seconds=60.0,
-            temperature=0.2,
-        )
-
-        task_routings: dict[str, LlmTaskRouting] = {
-            TASK_TECH_ANALYSIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-            TASK_NEWS_ANALYSIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-            TASK_SYNTHESIS: LlmTaskRouting(
-                steps=[LlmRouteStep(provider="test_provider", model="test_model")]
-            ),
-        }
-
-        router = LlmRouter(providers, routing_config, task_routings)
-
-        def mock_generate(task, system_prompt, user_prompt):
-            if task == TASK_SYNTHESIS:
-                return LlmResponse(
-                    text='{"action": "CALL", "confidence": 0.75, "brief": "Test recommendation"}',
-                    provider_name="test_provider",
-                    model_name="test_model",
-                    latency_ms=100,
-                    attempts=1,
-                    error=None,
-                )
-            else:
-                return LlmResponse(
-                    text="Test analysis",
-                    provider_name="test_provider",
-                    model_name="test_model",
-                    latency_ms=80,
-                    attempts=1,
-                    error=None,
-                )
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+
+            storage = SqliteStorage(db)
+            artifact_store = ArtifactStore(artifacts_dir)
+
+            mock_tech_provider = MockLlmProvider("test_provider", "test_model")
+
+            from src.agents.news_analyst import NewsAnalyst
+            from src.agents.synthesizer import Synthesizer
+            from src.agents.technical_analyst import TechnicalAnalyst
+            from src.core.models.llm import LlmResponse
+            from src.core.ports.llm_tasks import (
+                TASK_NEWS_ANALYSIS,
+                TASK_SYNTHESIS,
+                TASK_TECH_ANALYSIS,
+            )
+            from src.llm.providers.llm_router import (
+                LlmRouter,
+                LlmRouteStep,
+                LlmRoutingConfig,
+                LlmTaskRouting,
+            )
 
-        from unittest.mock import patch
-
-        with patch.object(router, "generate", side_effect=mock_generate):
-            technical_analyst = TechnicalAnalyst(router)
-            news_analyst = NewsAnalyst(router)
-            synthesizer = Synthesizer(router)
-
-            from unittest.mock import MagicMock
-
-            mock_reporter = MagicMock()
-            trace = PipelineTrace(enabled=True, reporter=mock_reporter)
-
-            orchestrator = RuntimeOrchestrator(
-                storage=storage,
-                artifact_store=artifact_store,
-                market_data_provider=MockMarketDataProvider(),
-                news_provider=MockNewsProvider(),
-                technical_analyst=technical_analyst,
-                news_analyst=news_analyst,
-                synthesizer=synthesizer,
-                candles_repository=None,
-                verifier_agent=None,
-                verification_repository=None,
+            providers: dict[str, LlmProvider] = {"test_provider": mock_tech_provider}
+            routing_config = LlmRoutingConfig(
+                router_mode="sequential",
                 verifier_enabled=False,
-                trace=trace,
+                max_retries=1,
+                timeout_seconds=60.0,
+                temperature=0.2,
             )
 
-            run_id = orchestrator.run_analysis("EURUSD", Timeframe.H1)
+            task_routings: dict[str, LlmTaskRouting] = {
+                TASK_TECH_ANALYSIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+                TASK_NEWS_ANALYSIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+                TASK_SYNTHESIS: LlmTaskRouting(
+                    steps=[LlmRouteStep(provider="test_provider", model="test_model")]
+                ),
+            }
+
+            router = LlmRouter(providers, routing_config, task_routings)
+
+            def mock_generate(task, system_prompt, user_prompt):
+                if task == TASK_SYNTHESIS:
+                    return LlmResponse(
+                        text='{"action": "CALL", "confidence": 0.75, "brief": "Test recommendation"}',
+                        provider_name="test_provider",
+                        model_name="test_model",
+                        latency_ms=100,
+                        attempts=1,
+                        error=None,
+                    )
+                else:
+                    return LlmResponse(
+                        text="Test analysis",
+                        provider_name="test_provider",
+                        model_name="test_model",
+                        latency_ms=80,
+                        attempts=1,
+                        error=None,
+                    )
+
+            from unittest.mock import patch
+
+            with patch.object(router, "generate", side_effect=mock_generate):
+                technical_analyst = TechnicalAnalyst(router)
+                news_analyst = NewsAnalyst(router)
+                synthesizer = Synthesizer(router)
+
+                from unittest.mock import MagicMock
+
+                mock_reporter = MagicMock()
+                trace = PipelineTrace(enabled=True, reporter=mock_reporter)
+
+                orchestrator = RuntimeOrchestrator(
+                    storage=storage,
+                    artifact_store=artifact_store,
+                    market_data_provider=MockMarketDataProvider(),
+                    news_provider=MockNewsProvider(),
+                    technical_analyst=technical_analyst,
+                    news_analyst=news_analyst,
+                    synthesizer=synthesizer,
+                    candles_repository=None,
+                    verifier_agent=None,
+                    verification_repository=None,
+                    verifier_enabled=False,
+                    trace=trace,
+                )
 
-            assert run_id > 0
+                run_id = orchestrator.run_analysis("EURUSD", Timeframe.H1)
 
-            # Check that verbose reporter methods were called
-            assert mock_reporter.step_start.called
-            assert mock_reporter.step_done.called
-            assert mock_reporter.panel.called
-            assert mock_reporter.llm_summary.called
+                assert run_id > 0
 
-            # Check specific step calls
-            step_start_calls = [str(call) for call in mock_reporter.step_start.call_args_list]
-            step_done_calls = [str(call) for call in mock_reporter.step_done.call_args_list]
+                # Check that verbose reporter methods were called
+                assert mock_reporter.step_start.called
+                assert mock_reporter.step_done.called
+                assert mock_reporter.panel.called
+                assert mock_reporter.llm_summary.called
 
-            assert any("Fetching market data" in str(call) for call in step_start_calls)
-            assert any("candles" in str(call) for call in step_done_calls)
-            assert any("Calculating technical indicators" in str(call) for call in step_start_calls)
-            assert any("indicators" in str(call) for call in step_done_calls)
-            assert any("technical analysis" in str(call).lower() for call in step_start_calls)
+                # Check specific step calls
+                step_start_calls = [str(call) for call in mock_reporter.step_start.call_args_list]
+                step_done_calls = [str(call) for call in mock_reporter.step_done.call_args_list]
 
-            # Check panel calls
-            panel_calls = [str(call) for call in mock_reporter.panel.call_args_list]
-            assert any("Technical Rationale" in str(call) for call in panel_calls)
-            assert any("News Digest" in str(call) for call in panel_calls)
-            assert any("Synthesis Logic" in str(call) for call in panel_calls)
+                assert any("Fetching market data" in str(call) for call in step_start_calls)
+                assert any("candles" in str(call) for call in step_done_calls)
+                assert any(
+                    "Calculating technical indicators" in str(call) for call in step_start_calls
+                )
+                assert any("indicators" in str(call) for call in step_done_calls)
+                assert any("technical analysis" in str(call).lower() for call in step_start_calls)
+
+                # Check panel calls
+                panel_calls = [str(call) for call in mock_reporter.panel.call_args_list]
+                assert any("Technical Rationale" in str(call) for call in panel_calls)
+                assert any("News Digest" in str(call) for call in panel_calls)
+                assert any("Synthesis Logic" in str(call) for call in panel_calls)
+        finally:
+            db.close()
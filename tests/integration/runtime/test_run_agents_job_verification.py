@@ -20,36 +20,38 @@ def test_verification_report_persistence():
     with tempfile.TemporaryDirectory() as tmpdir:
         db_path = Path(tmpdir) / "test.db"
         db = DBConnection(str(db_path))
+        try:
+            db.run_migration(settings.storage_migration_path)
 
-        db.run_migration(settings.storage_migration_path)
+            repository = VerificationRepository(db)
 
-        repository = VerificationRepository(db)
+            report = VerificationReport(
+                passed=False,
+                issues=[
+                    VerificationIssue(
+                        code="unsupported_claim",
+                        message="Test issue",
+                        severity=VerificationIssueSeverity.MEDIUM,
+                        evidence="Test evidence",
+                    )
+                ],
+                suggested_fix="Fix the issue",
+                policy_version="1.0",
+                provider_name="test_provider",
+                model_name="test_model",
+            )
 
-        report = VerificationReport(
-            passed=False,
-            issues=[
-                VerificationIssue(
-                    code="unsupported_claim",
-                    message="Test issue",
-                    severity=VerificationIssueSeverity.MEDIUM,
-                    evidence="Test evidence",
-                )
-            ],
-            suggested_fix="Fix the issue",
-            policy_version="1.0",
-            provider_name="test_provider",
-            model_name="test_model",
-        )
+            report_id = repository.create(1, report)
+            assert report_id > 0
 
-        report_id = repository.create(1, report)
-        assert report_id > 0
-
-        retrieved = repository.get_latest_by_run_id(1)
-        assert retrieved is not None
-        assert retrieved.passed is False
-        assert len(retrieved.issues) == 1
-        assert retrieved.issues[0].code == "unsupported_claim"
-        assert retrieved.suggested_fix == "Fix the issue"
+            retrieved = repository.get_latest_by_run_id(1)
+            assert retrieved is not None
+            assert retrieved.passed is False
+            assert len(retrieved.issues) == 1
+            assert retrieved.issues[0].code == "unsupported_claim"
+            assert retrieved.suggested_fix == "Fix the issue"
+        finally:
+            db.close()
 
 
 def test_verifier_agent_integration():
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from src.storage.sqlite.connection import DBConnection
+
+
+def test_connections_use_wal_journal(tmp_path: Path) -> None:
+    db = DBConnection(str(tmp_path / "test.db"))
+    try:
+        with db.get_cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            assert cursor.fetchone()[0] == "wal"
+    finally:
+        db.close()
+
+
+def test_pool_reuses_released_connections(tmp_path: Path) -> None:
+    db = DBConnection(str(tmp_path / "test.db"), pool_size=1)
+    try:
+        with db.get_cursor() as cursor:
+            first_connection = cursor.connection
+        with db.get_cursor() as cursor:
+            assert cursor.connection is first_connection
+    finally:
+        db.close()
+
+
+def test_pool_opens_extra_connection_when_exhausted(tmp_path: Path) -> None:
+    db = DBConnection(str(tmp_path / "test.db"), pool_size=1)
+    try:
+        db.run_migration("src/storage/sqlite/migrations")
+
+        with db.get_cursor() as outer, db.get_cursor() as inner:
+            assert inner.connection is not outer.connection
+            inner.execute("SELECT COUNT(*) FROM journal_entries")
+            assert inner.fetchone()[0] == 0
+    finally:
+        db.close()
+
+
+def test_reader_sees_committed_rows_while_writer_is_open(tmp_path: Path) -> None:
+    db = DBConnection(str(tmp_path / "test.db"))
+    try:
+        db.run_migration("src/storage/sqlite/migrations")
+
+        with db.get_cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO journal_entries "
+                "(recommendation_id, symbol, open_time, expiry_seconds, user_action) "
+                "VALUES (1, 'EURUSD', '2024-01-01T12:00:00', 300, 'CALL')"
+            )
+
+        with db.get_cursor() as writer:
+            writer.execute(
+                "INSERT INTO journal_entries "
+                "(recommendation_id, symbol, open_time, expiry_seconds, user_action) "
+                "VALUES (2, 'GBPUSD', '2024-01-01T12:00:00', 300, 'PUT')"
+            )
+            with db.get_read_cursor() as reader:
+                reader.execute("SELECT COUNT(*) FROM journal_entries")
+                assert reader.fetchone()[0] == 1
+    finally:
+        db.close()
@@ -0,0 +1,125 @@
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from src.core.models.journal_entry import JournalEntry
+from src.core.models.outcome import Outcome
+from src.core.services.reporter import Reporter
+from src.storage.sqlite.connection import DBConnection
+from src.storage.sqlite.repositories.journal_repository import JournalRepository
+from src.storage.sqlite.repositories.outcomes_repository import OutcomesRepository
+
+
+def _log_outcome(
+    journal: JournalRepository, outcomes: OutcomesRepository, symbol: str, result: str
+) -> None:
+    entry_id = journal.save(
+        JournalEntry(
+            recommendation_id=1,
+            symbol=symbol,
+            open_time=datetime(2024, 1, 1, 12, 0, 0),
+            expiry_seconds=300,
+            user_action="CALL",
+        )
+    )
+    outcomes.save(
+        Outcome(
+            journal_entry_id=entry_id,
+            close_time=datetime(2024, 1, 1, 12, 5, 0),
+            win_or_loss=result,
+        )
+    )
+
+
+def test_winrate_stats_match_python_aggregation() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DBConnection(str(Path(temp_dir) / "test.db"))
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+            journal = JournalRepository(db)
+            outcomes = OutcomesRepository(db)
+
+            for symbol, result in [
+                ("GBPUSD", "WIN"),
+                ("EURUSD", "WIN"),
+                ("EURUSD", "LOSS"),
+                ("EURUSD", "DRAW"),
+                ("EURUSD", "VOID"),
+                ("EURUSD", "WIN"),
+            ]:
+                _log_outcome(journal, outcomes, symbol, result)
+
+            stats = outcomes.get_winrate_stats()
+
+            assert stats == [
+                ("EURUSD", 2, 1, 1, 1),
+                ("GBPUSD", 1, 0, 0, 0),
+            ]
+
+            sql_table = Reporter(winrate_stats=stats).generate_daily_report()
+            python_table = Reporter(outcomes.get_all_with_details()).generate_daily_report()
+            assert [list(column.cells) for column in sql_table.columns] == [
+                list(column.cells) for column in python_table.columns
+            ]
+        finally:
+            db.close()
+
+
+def test_counters_track_saved_outcomes() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DBConnection(str(Path(temp_dir) / "test.db"))
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+            journal = JournalRepository(db)
+            outcomes = OutcomesRepository(db)
+
+            for symbol, result in [
+                ("EURUSD", "win"),
+                ("EURUSD", "LOSS"),
+                ("GBPUSD", "VOID"),
+                ("GBPUSD", "PENDING"),
+            ]:
+                _log_outcome(journal, outcomes, symbol, result)
+
+            assert outcomes.get_counters() == [
+                ("EURUSD", 1, 1, 0, 0),
+                ("GBPUSD", 0, 0, 0, 1),
+            ]
+            assert outcomes.get_counters() == outcomes.get_winrate_stats()
+        finally:
+            db.close()
+
+
+def test_counters_migration_backfills_existing_outcomes() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DBConnection(str(Path(temp_dir) / "test.db"))
+        try:
+            migrations = sorted(Path("src/storage/sqlite/migrations").glob("*.sql"))
+            counters_migration = next(m for m in migrations if "outcome_counters" in m.name)
+            for migration in migrations:
+                if migration != counters_migration:
+                    db.run_migration(str(migration))
+
+            journal = JournalRepository(db)
+            for result in ["WIN", "WIN", "DRAW"]:
+                entry_id = journal.save(
+                    JournalEntry(
+                        recommendation_id=1,
+                        symbol="USDJPY",
+                        open_time=datetime(2024, 1, 1, 12, 0, 0),
+                        expiry_seconds=300,
+                        user_action="PUT",
+                    )
+                )
+                with db.get_cursor() as cursor:
+                    cursor.execute(
+                        "INSERT INTO outcomes (journal_entry_id, close_time, win_or_loss) "
+                        "VALUES (?, ?, ?)",
+                        (entry_id, "2024-01-01T12:05:00", result),
+                    )
+
+            db.run_migration(str(counters_migration))
+
+            assert OutcomesRepository(db).get_counters() == [("USDJPY", 2, 0, 1, 0)]
+        finally:
+            db.close()
@@ -0,0 +1,33 @@
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.storage.sqlite.connection import DBConnection
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Iterator[DBConnection]:
+    db = DBConnection(str(tmp_path / "test.db"))
+    db.run_migration("src/storage/sqlite/migrations")
+    yield db
+    db.close()
+
+
+def test_read_cursor_rejects_writes(db: DBConnection) -> None:
+    with pytest.raises(sqlite3.OperationalError), db.get_read_cursor() as cursor:
+        cursor.execute("DELETE FROM recommendations")
+
+
+def test_read_cursor_sees_uncommitted_writes_inside_transaction(db: DBConnection) -> None:
+    with db.transaction():
+        with db.get_cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO journal_entries "
+                "(recommendation_id, symbol, open_time, expiry_seconds, user_action) "
+                "VALUES (1, 'EURUSD', '2024-01-01T12:00:00', 300, 'CALL')"
+            )
+        with db.get_read_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM journal_entries")
+            assert cursor.fetchone()[0] == 1
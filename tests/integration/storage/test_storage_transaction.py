@@ -0,0 +1,61 @@
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.models.journal_entry import JournalEntry
+from src.core.models.outcome import Outcome
+from src.storage.sqlite.connection import DBConnection
+from src.storage.sqlite.storage import SqliteStorage
+
+
+def _make_entry() -> JournalEntry:
+    return JournalEntry(
+        recommendation_id=1,
+        symbol="EURUSD",
+        open_time=datetime(2024, 1, 1, 12, 0, 0),
+        expiry_seconds=300,
+        user_action="CALL",
+    )
+
+
+def test_transaction_commits_journal_and_outcome_together() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DBConnection(str(Path(temp_dir) / "test.db"))
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+            storage = SqliteStorage(db)
+
+            with storage.transaction():
+                entry_id = storage.journal.save(_make_entry())
+                storage.outcomes.save(
+                    Outcome(
+                        journal_entry_id=entry_id,
+                        close_time=datetime(2024, 1, 1, 12, 5, 0),
+                        win_or_loss="WIN",
+                    )
+                )
+
+            rows = storage.outcomes.get_all_with_details()
+            assert len(rows) == 1
+            assert rows[0]["journal_entry_id"] == entry_id
+            assert rows[0]["symbol"] == "EURUSD"
+        finally:
+            db.close()
+
+
+def test_transaction_rolls_back_all_writes_on_error() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DBConnection(str(Path(temp_dir) / "test.db"))
+        try:
+            db.run_migration("src/storage/sqlite/migrations")
+            storage = SqliteStorage(db)
+
+            with pytest.raises(RuntimeError), storage.transaction():
+                storage.journal.save(_make_entry())
+                raise RuntimeError("boom")
+
+            assert storage.journal.get_latest() is None
+        finally:
+            db.close()
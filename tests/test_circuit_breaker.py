@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker
+
+
+def test_circuit_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, failure_window=60.0, cooldown=60.0)
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_circuit_breaker_success_resets_failure_count() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, failure_window=60.0, cooldown=60.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow()
+
+
+def test_circuit_breaker_reopens_when_trial_call_fails() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, failure_window=60.0, cooldown=0.01)
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.02)
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_circuit_breaker_rejects_non_positive_settings() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
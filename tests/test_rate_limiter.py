@@ -0,0 +1,66 @@
+import time
+
+import httpx
+import pytest
+
+from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import retry_network_call
+
+
+def test_rate_limiter_allows_burst_up_to_rate() -> None:
+    limiter = RateLimiter(rate=5, period=1.0)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+
+
+def test_rate_limiter_blocks_once_bucket_is_empty() -> None:
+    limiter = RateLimiter(rate=50, period=1.0)
+    for _ in range(50):
+        limiter.acquire()
+
+    start = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - start >= 0.015
+
+
+def test_rate_limiter_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.test.com")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_retry_on_status_retries_rate_limited_responses() -> None:
+    calls: list[int] = []
+
+    @retry_network_call(max_attempts=3, min_wait=0.0, max_wait=0.0, retry_on_status=True)
+    def flaky() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise _status_error(429)
+        return "ok"
+
+    assert flaky() == "ok"
+    assert len(calls) == 3
+
+
+def test_retry_on_status_does_not_retry_client_errors() -> None:
+    calls: list[int] = []
+
+    @retry_network_call(max_attempts=3, min_wait=0.0, max_wait=0.0, retry_on_status=True)
+    def not_found() -> str:
+        calls.append(1)
+        raise _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        not_found()
+    assert len(calls) == 1
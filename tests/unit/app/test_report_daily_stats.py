@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.services.reporter import Reporter
+
+pytestmark = pytest.mark.unit
+
+
+def test_generate_daily_report_aggregates_outcomes_per_symbol() -> None:
+    outcomes: list[dict[str, str | int | None]] = [
+        {"symbol": "GBPUSD", "win_or_loss": "win"},
+        {"symbol": "EURUSD", "win_or_loss": "WIN"},
+        {"symbol": "EURUSD", "win_or_loss": "LOSS"},
+        {"symbol": "EURUSD", "win_or_loss": "DRAW"},
+        {"symbol": "EURUSD", "win_or_loss": "VOID"},
+        {"symbol": "USDJPY", "win_or_loss": "PENDING"},
+        {"symbol": None, "win_or_loss": None},
+    ]
+
+    table = Reporter(outcomes).generate_daily_report()
+    rows = list(zip(*(column.cells for column in table.columns), strict=True))
+
+    assert rows == [
+        ("EURUSD", "3", "33.3%", "1", "1", "1", "1"),
+        ("GBPUSD", "1", "100.0%", "1", "0", "0", "0"),
+    ]
+
+
+def test_generate_daily_report_without_outcomes() -> None:
+    table = Reporter([]).generate_daily_report()
+    rows = list(zip(*(column.cells for column in table.columns), strict=True))
+
+    assert rows == [("No data", "0", "0.0%", "0", "0", "0", "0")]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.core.models.rationale import RATIONALE_NEWS, RATIONALE_TECHNICAL, Rationale
+from src.core.services.reporter import Reporter
+
+pytestmark = pytest.mark.unit
+
+
+def _news(raw_data: str | None) -> Rationale:
+    return Rationale(run_id=1, rationale_type=RATIONALE_NEWS, content="news", raw_data=raw_data)
+
+
+def test_generate_news_stats_counts_quality_across_payload_shapes() -> None:
+    rationales = [
+        _news('{"quality": "high"}'),
+        _news(json.dumps('{"quality": "HIGH"}')),
+        _news('{"news_digest": {"quality": "low"}}'),
+        _news("not json"),
+        _news(None),
+        Rationale(
+            run_id=1,
+            rationale_type=RATIONALE_TECHNICAL,
+            content="tech",
+            raw_data='{"quality": "LOW"}',
+        ),
+    ]
+
+    reporter = Reporter([])
+    first = reporter.generate_news_stats(rationales)
+    second = reporter.generate_news_stats(rationales)
+
+    for table in (first, second):
+        rows = list(zip(*(column.cells for column in table.columns), strict=True))
+        assert rows == [
+            ("HIGH", "2", "66.7%"),
+            ("MEDIUM", "0", "0.0%"),
+            ("LOW", "1", "33.3%"),
+        ]
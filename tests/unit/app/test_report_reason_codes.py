@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.core.services.reporter import count_reason_codes
+from src.core.services.reporter import count_reason_codes, generate_reason_codes_table
 
 pytestmark = pytest.mark.unit
 
@@ -22,3 +22,18 @@ def test_count_reason_codes_handles_json_and_ignores_invalid() -> None:
     assert counts["LOW_VOLATILITY_NO_SQUEEZE"] == 1
     assert counts["NO_FRESH_CROSSOVER"] == 2
     assert counts["WEAK_MOMENTUM"] == 1
+
+
+def test_reason_codes_table_orders_by_count_then_code() -> None:
+    values: list[object] = [
+        ["B_CODE", "A_CODE", "C_CODE"],
+        ["C_CODE", "A_CODE"],
+        ["D_CODE"],
+    ]
+
+    table = generate_reason_codes_table(values, top_n=3)
+    codes = list(table.columns[0].cells)
+    counts = list(table.columns[1].cells)
+
+    assert codes == ["A_CODE", "C_CODE", "B_CODE"]
+    assert counts == ["2", "2", "1"]
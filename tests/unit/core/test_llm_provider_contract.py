@@ -87,3 +87,45 @@ def test_health_check_returns_result():
     assert isinstance(result, HealthCheckResult)
     assert result.ok is True
     assert result.reason == "test"
+
+
+def test_generate_batch_preserves_request_order():
+    class EchoProvider(LlmProvider):
+        def generate(self, system_prompt: str, user_prompt: str) -> str:
+            if user_prompt == "fail":
+                raise ValueError("boom")
+            return f"echo:{user_prompt}"
+
+        def health_check(self) -> HealthCheckResult:
+            return HealthCheckResult(ok=True)
+
+        def get_provider_name(self) -> str:
+            return "echo_provider"
+
+    provider = EchoProvider()
+    requests = [
+        LlmRequest(
+            task="test",
+            system_prompt="system",
+            user_prompt=prompt,
+            temperature=0.2,
+            timeout_seconds=60.0,
+            max_retries=1,
+        )
+        for prompt in ["a", "fail", "c"]
+    ]
+
+    responses = provider.generate_batch(requests, max_concurrency=3)
+
+    assert [response.text for response in responses] == ["echo:a", "", "echo:c"]
+    assert responses[1].error == "boom"
+    assert provider.generate_batch([]) == []
+
+
+def test_generate_stream_defaults_to_single_generate_chunk():
+    provider = TestLlmProvider()
+
+    chunks = list(provider.generate_stream(system_prompt="system", user_prompt="user"))
+
+    assert chunks == ["test response"]
+    assert provider.generate_called is True
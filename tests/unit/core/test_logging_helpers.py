@@ -0,0 +1,33 @@
+import logging
+
+from src.core.logging_helpers import log_stage_end, log_stage_start, stage_timer
+
+LOGGER_NAME = "src.core.logging_helpers"
+
+
+def test_stage_logs_include_extra_when_debug_enabled(caplog):
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        log_stage_start("fetch_candles", symbol="EURUSD", count=300)
+        log_stage_end("fetch_candles", 12.34, symbol="EURUSD")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "Stage start: fetch_candles (symbol=EURUSD, count=300)",
+        "Stage end: fetch_candles, duration=12.3ms (symbol=EURUSD)",
+    ]
+
+
+def test_stage_timer_emits_nothing_when_debug_disabled(caplog):
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME), stage_timer("build_features"):
+        pass
+
+    assert caplog.records == []
+
+
+def test_stage_timer_emits_start_and_end_when_debug_enabled(caplog):
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME), stage_timer("synthesis"):
+        pass
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "Stage start: synthesis"
+    assert messages[1].startswith("Stage end: synthesis, duration=")
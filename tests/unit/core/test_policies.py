@@ -63,6 +63,12 @@ def test_sanitize_brief_adds_disclaimer() -> None:
     assert "manual decision" in sanitized.lower()
 
 
+def test_sanitize_brief_keeps_existing_disclaimer_regardless_of_case() -> None:
+    brief = "Trend is up. MANUAL DECISION required."
+    sanitized = sanitize_brief(brief)
+    assert sanitized == brief
+
+
 def test_safety_policy_validate_passes_valid() -> None:
     policy = SafetyPolicy()
     recommendation = Recommendation(
@@ -103,8 +109,11 @@ def test_safety_policy_sanitize() -> None:
         action="CALL",
         brief="You should execute the trade now.",
         confidence=0.75,
+        reason_codes=["NO_FRESH_CROSSOVER"],
     )
     sanitized = policy.sanitize(recommendation)
     assert sanitized.action == "CALL"
     assert sanitized.confidence == 0.75
+    assert sanitized.reason_codes == ["NO_FRESH_CROSSOVER"]
     assert "manual decision" in sanitized.brief.lower()
+    assert recommendation.brief == "You should execute the trade now."
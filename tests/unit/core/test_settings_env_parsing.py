@@ -418,3 +418,14 @@ def test_last_resort_default():
         assert last_resort.model == "llama3:latest"
 
     get_settings.cache_clear()
+
+
+def test_empty_ollama_model_resolves_to_default():
+    with patch.dict(os.environ, {"OLLAMA_MODEL": "  "}, clear=False):
+        get_settings.cache_clear()
+        settings = get_settings()
+
+        assert settings.ollama_model == "llama3:latest"
+        assert settings.get_tech_routing().steps[-1].model == "llama3:latest"
+
+    get_settings.cache_clear()
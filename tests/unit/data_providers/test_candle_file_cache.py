@@ -0,0 +1,93 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.models.candle import Candle
+from src.core.models.timeframe import Timeframe
+from src.data_providers.cache import CandleFileCache
+
+_PARAMS = {"symbol": "EUR/USD", "interval": "1h", "outputsize": 2}
+
+
+def _make_candles() -> list[Candle]:
+    return [
+        Candle(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            open=1.1,
+            high=1.2,
+            low=1.0,
+            close=1.15,
+            volume=100.0,
+        ),
+        Candle(
+            timestamp=datetime(2024, 1, 1, 13, 0, 0),
+            open=1.15,
+            high=1.25,
+            low=1.1,
+            close=1.2,
+            volume=0.0,
+        ),
+    ]
+
+
+def test_cache_round_trips_candles(tmp_path: Path) -> None:
+    cache = CandleFileCache(tmp_path)
+
+    assert cache.get("EURUSD", Timeframe.H1, _PARAMS) is None
+
+    cache.put("EURUSD", Timeframe.H1, _PARAMS, _make_candles())
+
+    assert cache.get("EURUSD", Timeframe.H1, _PARAMS) == _make_candles()
+    assert cache.get("EURUSD", Timeframe.H1, {**_PARAMS, "outputsize": 3}) is None
+
+
+def test_cache_entries_expire_after_ttl(tmp_path: Path) -> None:
+    cache = CandleFileCache(tmp_path, ttl_seconds={Timeframe.H1: 60.0})
+    cache.put("EURUSD", Timeframe.H1, _PARAMS, _make_candles())
+
+    (entry,) = tmp_path.rglob("*.json")
+    stale_time = entry.stat().st_mtime - 120
+    os.utime(entry, (stale_time, stale_time))
+
+    assert cache.get("EURUSD", Timeframe.H1, _PARAMS) is None
+
+
+def test_cache_entries_expire_at_the_next_bar_close(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = CandleFileCache(tmp_path, ttl_seconds={Timeframe.M1: 60.0})
+    cache.put("EURUSD", Timeframe.M1, _PARAMS, _make_candles())
+
+    (entry,) = tmp_path.rglob("*.json")
+    bar_open = 1_700_000_040.0
+    os.utime(entry, (bar_open + 30.0, bar_open + 30.0))
+
+    monkeypatch.setattr("src.data_providers.cache.time.time", lambda: bar_open + 59.5)
+    assert cache.get("EURUSD", Timeframe.M1, _PARAMS) == _make_candles()
+
+    # Less than a full TTL has passed, but the bar the entry was written in closed.
+    monkeypatch.setattr("src.data_providers.cache.time.time", lambda: bar_open + 60.5)
+    assert cache.get("EURUSD", Timeframe.M1, _PARAMS) is None
+
+
+def test_cache_put_ignores_unwritable_directory(tmp_path: Path) -> None:
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")
+    cache = CandleFileCache(blocker)
+
+    cache.put("EURUSD", Timeframe.H1, _PARAMS, _make_candles())
+
+    assert cache.get("EURUSD", Timeframe.H1, _PARAMS) is None
+
+
+def test_cache_clear_removes_only_requested_symbol(tmp_path: Path) -> None:
+    cache = CandleFileCache(tmp_path)
+    cache.put("EURUSD", Timeframe.H1, _PARAMS, _make_candles())
+    cache.put("GBPUSD", Timeframe.H1, _PARAMS, _make_candles())
+
+    cache.clear(symbol="EURUSD")
+
+    assert cache.get("EURUSD", Timeframe.H1, _PARAMS) is None
+    assert cache.get("GBPUSD", Timeframe.H1, _PARAMS) == _make_candles()
@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -111,3 +112,116 @@ def test_fallback_provider_raises_when_primary_fails_and_no_secondary() -> None:
         )
 
     primary.fetch_candles.assert_called_once()
+
+
+def _make_candles(close: float) -> list[Candle]:
+    return [
+        Candle(
+            timestamp=datetime.now(),
+            open=1.0,
+            high=1.1,
+            low=0.9,
+            close=close,
+            volume=1000.0,
+        )
+    ]
+
+
+def test_hedged_fallback_uses_secondary_when_primary_is_slow() -> None:
+    release_primary = threading.Event()
+    primary = Mock()
+    secondary = Mock()
+
+    primary_candles = _make_candles(1.01)
+    secondary_candles = _make_candles(1.02)
+
+    def slow_primary(*_: object) -> list[Candle]:
+        release_primary.wait(timeout=5)
+        return primary_candles
+
+    primary.fetch_candles.side_effect = slow_primary
+    secondary.fetch_candles.return_value = secondary_candles
+
+    fallback = FallbackMarketDataProvider(
+        primary=primary, secondary=secondary, hedge_delay_seconds=0.01
+    )
+
+    try:
+        result = fallback.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=100)
+    finally:
+        release_primary.set()
+
+    assert result == secondary_candles
+    secondary.fetch_candles.assert_called_once()
+
+
+def test_hedged_fallback_skips_secondary_when_primary_is_fast() -> None:
+    primary = Mock()
+    secondary = Mock()
+
+    primary_candles = _make_candles(1.01)
+    primary.fetch_candles.return_value = primary_candles
+
+    fallback = FallbackMarketDataProvider(
+        primary=primary, secondary=secondary, hedge_delay_seconds=1.0
+    )
+
+    result = fallback.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=100)
+
+    assert result == primary_candles
+    secondary.fetch_candles.assert_not_called()
+
+
+def test_hedged_fallback_raises_when_both_fail() -> None:
+    primary = Mock()
+    secondary = Mock()
+
+    primary.fetch_candles.side_effect = httpx.NetworkError("Primary connection failed")
+    secondary.fetch_candles.side_effect = httpx.TimeoutException("Secondary timeout")
+
+    fallback = FallbackMarketDataProvider(
+        primary=primary, secondary=secondary, hedge_delay_seconds=0.0
+    )
+
+    with pytest.warns(UserWarning), pytest.raises(RuntimeError, match="Both providers failed"):
+        fallback.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=100)
+
+
+def test_hedged_fallback_keeps_hedging_while_primary_hangs() -> None:
+    release_primary = threading.Event()
+    primary = Mock()
+    secondary = Mock()
+
+    secondary_candles = _make_candles(1.02)
+
+    def hung_primary(*_: object) -> list[Candle]:
+        release_primary.wait(timeout=5)
+        return _make_candles(1.01)
+
+    primary.fetch_candles.side_effect = hung_primary
+    secondary.fetch_candles.return_value = secondary_candles
+
+    fallback = FallbackMarketDataProvider(
+        primary=primary, secondary=secondary, hedge_delay_seconds=0.01
+    )
+
+    try:
+        # Abandoned primary requests must not hold up the hedges that follow.
+        results = [
+            fallback.fetch_candles(symbol="EURUSD", timeframe=Timeframe.H1, count=100)
+            for _ in range(6)
+        ]
+    finally:
+        release_primary.set()
+
+    assert results == [secondary_candles] * 6
+
+
+def test_close_closes_both_providers() -> None:
+    primary = Mock()
+    secondary = Mock()
+
+    FallbackMarketDataProvider(primary=primary, secondary=secondary).close()
+
+    primary.close.assert_called_once()
+    secondary.close.assert_called_once()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.decision.scoring import calculate_scores
+from src.decision.scoring import calculate_scores, parse_indicators
 
 pytestmark = pytest.mark.unit
 
@@ -68,3 +68,32 @@ def test_missing_keys_does_not_crash_and_scores_are_clamped() -> None:
     assert 0.0 <= scores.bull_score <= 100.0
     assert 0.0 <= scores.bear_score <= 100.0
     assert 0.0 <= scores.no_trade_score <= 100.0
+
+
+def test_parse_indicators_normalizes_values_and_falls_back_to_technical_analysis() -> None:
+    parsed = parse_indicators(
+        {"trend_direction": " bullish ", "roc_5": "0.5", "atr_pct": float("nan")},
+        technical_analysis={"structure": "range", "roc_5": 9.0},
+    )
+
+    assert parsed.trend_direction == "BULLISH"
+    assert parsed.structure == "RANGE"
+    assert parsed.roc_5 == 0.5
+    assert parsed.atr_pct is None
+    assert parsed.validation_status == ""
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (1.5, 1.5),
+        (3, 3.0),
+        (True, 1.0),
+        ("2.5", 2.5),
+        (float("inf"), None),
+        (float("nan"), None),
+        ("abc", None),
+    ],
+)
+def test_parse_indicators_float_conversion(raw: object, expected: float | None) -> None:
+    assert parse_indicators({"roc_5": raw}).roc_5 == expected
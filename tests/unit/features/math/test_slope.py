@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -44,3 +45,13 @@ def test_calculate_normalized_slope_flat_zero() -> None:
     normalized = calculate_normalized_slope(series, window=5)
 
     assert normalized == pytest.approx(0.0)
+
+
+def test_calculate_slope_matches_least_squares_fit() -> None:
+    values = [1.1012, 1.1008, 1.1021, 1.1017, 1.1030, 1.1026, 1.1041, 1.1035]
+    series = pd.Series([float("nan"), *values])
+
+    slope = calculate_slope(series, window=8)
+
+    expected = np.polyfit(np.arange(len(values), dtype=float), values, 1)[0]
+    assert slope == pytest.approx(expected, rel=1e-12)
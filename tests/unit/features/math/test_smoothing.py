@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.math.smoothing import ewm_last, ewm_series
+
+
+def test_ewm_series_matches_pandas_exactly() -> None:
+    values = np.array([1.1012, 1.1008, 1.1021, 1.1017, 1.1030, 1.1026, 1.1041, 1.1035])
+
+    result = ewm_series(values, alpha=0.2)
+
+    expected = pd.Series(values).ewm(alpha=0.2, adjust=False).mean().to_numpy()
+    assert np.array_equal(result, expected)
+
+
+def test_ewm_series_keeps_flat_series_flat() -> None:
+    result = ewm_series(np.full(50, 100.0), alpha=0.2)
+
+    assert np.all(result == 100.0)
+
+
+def test_ewm_series_handles_empty_input() -> None:
+    assert ewm_series(np.array([], dtype=float), alpha=0.2).size == 0
+
+
+def test_ewm_last_matches_last_series_value() -> None:
+    values = np.linspace(1.0, 2.0, 40) + np.sin(np.arange(40.0)) * 0.1
+
+    assert ewm_last(values, alpha=0.2) == pytest.approx(ewm_series(values, alpha=0.2)[-1])
@@ -58,3 +58,19 @@ def test_insufficient_points_returns_range_zero() -> None:
     result = classify_structure(swings)
 
     assert result == {"structure": "RANGE", "confidence": 0.0}
+
+
+def test_uses_latest_swings_by_index_regardless_of_order() -> None:
+    swings = [
+        SwingPoint(index=6, price=95.0, type="LOW", timestamp=None),
+        SwingPoint(index=1, price=120.0, type="HIGH", timestamp=None),
+        SwingPoint(index=5, price=110.0, type="HIGH", timestamp=None),
+        SwingPoint(index=2, price=80.0, type="LOW", timestamp=None),
+        SwingPoint(index=3, price=100.0, type="HIGH", timestamp=None),
+        SwingPoint(index=4, price=90.0, type="LOW", timestamp=None),
+    ]
+
+    result = classify_structure(swings)
+
+    assert result["structure"] == "BULLISH"
+    assert result["confidence"] == pytest.approx(91.1111111111, rel=1e-6)
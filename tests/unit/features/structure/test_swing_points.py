@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from src.core.models.candle import Candle
+from src.features.arrays import candles_to_arrays
 from src.features.structure.swing_points import detect_swings
 
 
@@ -74,3 +75,23 @@ def test_insufficient_candles_returns_empty() -> None:
     swings = detect_swings(candles, depth=2)
 
     assert swings == []
+
+
+def test_candle_arrays_match_candle_list() -> None:
+    highs = [3.0, 4.0, 6.0, 4.0, 3.0, 2.0, 3.0, 5.0, 7.0, 5.0, 4.0, 4.5, 3.0]
+    lows = [high - 1.5 for high in highs]
+    candles = create_candles_from_high_low(highs, lows)
+
+    list_swings = detect_swings(candles, depth=2)
+    array_swings = detect_swings(candles_to_arrays(candles), depth=2)
+
+    assert [(swing.index, swing.price, swing.type) for swing in array_swings] == [
+        (swing.index, swing.price, swing.type) for swing in list_swings
+    ]
+    assert len(list_swings) > 0
+    assert [swing.timestamp for swing in list_swings] == [
+        candles[swing.index].timestamp for swing in list_swings
+    ]
+    assert [swing.timestamp for swing in array_swings] == [
+        candles[swing.index].timestamp.replace(tzinfo=UTC) for swing in list_swings
+    ]
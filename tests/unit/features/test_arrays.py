@@ -0,0 +1,75 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import numpy as np
+
+from src.core.models.candle import Candle
+from src.features.arrays import candles_to_arrays
+from src.features.derived.basic_derived import calculate_basic_derived
+from src.features.derived.momentum_derived import calculate_momentum_features
+from src.features.signals.crossovers import detect_crossovers
+
+
+def create_test_candles(count: int) -> list[Candle]:
+    base_time = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        Candle(
+            timestamp=base_time + timedelta(hours=i),
+            open=1.1000 + (i % 7) * 0.0002,
+            high=1.1020 + (i % 7) * 0.0002,
+            low=1.0980 + (i % 7) * 0.0002,
+            close=1.1005 + (i % 11) * 0.0002,
+            volume=1000.0 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def test_candles_to_arrays_extracts_columns() -> None:
+    candles = create_test_candles(3)
+
+    arrays = candles_to_arrays(candles)
+
+    assert len(arrays) == 3
+    assert arrays.close.dtype == np.float64
+    assert arrays.open.tolist() == [candle.open for candle in candles]
+    assert arrays.high.tolist() == [candle.high for candle in candles]
+    assert arrays.low.tolist() == [candle.low for candle in candles]
+    assert arrays.close.tolist() == [candle.close for candle in candles]
+    assert arrays.volume.tolist() == [candle.volume for candle in candles]
+
+
+def test_candles_to_arrays_normalizes_timestamps_to_utc() -> None:
+    candle = create_test_candles(1)[0]
+    candles = [
+        candle.model_copy(update={"timestamp": datetime(2024, 1, 1, 12, 0, 0, 250)}),
+        candle.model_copy(update={"timestamp": datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)}),
+        candle.model_copy(
+            update={
+                "timestamp": datetime(2024, 1, 1, 16, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+            }
+        ),
+    ]
+
+    arrays = candles_to_arrays(candles)
+
+    expected = np.array(
+        ["2024-01-01T12:00:00.000250", "2024-01-01T13:00:00", "2024-01-01T14:00:00"],
+        dtype="datetime64[ns]",
+    )
+    assert np.array_equal(arrays.timestamp, expected)
+
+
+def test_candles_to_arrays_handles_empty_list() -> None:
+    arrays = candles_to_arrays([])
+
+    assert len(arrays) == 0
+    assert arrays.timestamp.dtype == np.dtype("datetime64[ns]")
+
+
+def test_feature_calculators_accept_candle_arrays() -> None:
+    candles = create_test_candles(250)
+    arrays = candles_to_arrays(candles)
+
+    assert calculate_momentum_features(arrays) == calculate_momentum_features(candles)
+    assert detect_crossovers(arrays) == detect_crossovers(candles)
+    assert calculate_basic_derived(arrays) == calculate_basic_derived(candles)
@@ -60,3 +60,12 @@ def test_price_change_pct_1_sanity() -> None:
     derived = calculate_basic_derived(candles)
 
     assert derived["price_change_pct_1"] == pytest.approx(10.0)
+
+
+def test_zero_close_yields_zero_instead_of_infinity() -> None:
+    candles = create_test_candles([0.0, 100.0])
+
+    derived = calculate_basic_derived(candles)
+
+    assert derived["price_change_pct_1"] == 0.0
+    assert derived["range_pct"] == pytest.approx(2.0)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
 
 from src.core.models.candle import Candle
+from src.features.arrays import candles_to_arrays
 from src.features.contracts.feature_contract import FeatureContract, ValidationStatus
 
 
@@ -150,3 +154,81 @@ def test_duplicate_timestamps_degraded() -> None:
 
     assert result.status == ValidationStatus.DEGRADED
     assert "duplicate_timestamps" in result.reasons
+
+
+def test_timestamp_gaps_degraded() -> None:
+    candles = create_test_candles(5)
+    candles[4] = Candle(
+        timestamp=candles[3].timestamp + (candles[3].timestamp - candles[2].timestamp) * 2,
+        open=candles[4].open,
+        high=candles[4].high,
+        low=candles[4].low,
+        close=candles[4].close,
+        volume=candles[4].volume,
+    )
+
+    result = FeatureContract.validate(candles, min_count=5)
+
+    assert result.status == ValidationStatus.DEGRADED
+    assert result.reasons == ["timestamp_gaps_detected"]
+
+
+def test_fail_fast_stops_at_first_invalid_reason() -> None:
+    candles = create_test_candles(5)
+    candles[1] = Candle(
+        timestamp=candles[1].timestamp,
+        open=0.0,
+        high=candles[1].high,
+        low=0.0,
+        close=candles[1].close,
+        volume=candles[1].volume,
+    )
+    candles[3] = Candle(
+        timestamp=candles[3].timestamp,
+        open=candles[3].open,
+        high=candles[3].high,
+        low=candles[3].low,
+        close=candles[3].high + 0.01,
+        volume=candles[3].volume,
+    )
+
+    full_result = FeatureContract.validate(candles, min_count=5)
+    fast_result = FeatureContract.validate(candles, min_count=5, fail_fast=True)
+
+    assert full_result.reasons == ["non_positive_prices", "close_outside_range"]
+    assert fast_result.status == ValidationStatus.INVALID
+    assert fast_result.reasons == ["non_positive_prices"]
+
+
+def test_fail_fast_returns_before_scanning_short_series() -> None:
+    result = FeatureContract.validate(create_test_candles(5), min_count=10, fail_fast=True)
+
+    assert result.status == ValidationStatus.INVALID
+    assert result.reasons == ["insufficient_candles: expected>=10 got=5"]
+
+
+@pytest.mark.parametrize(
+    ("index", "update"),
+    [
+        (None, {}),
+        (2, {"open": 0.0}),
+        (2, {"low": 2.0}),
+        (2, {"open": 1.5}),
+        (2, {"close": 0.5}),
+        (2, {"timestamp": datetime(2023, 12, 31)}),
+        (2, {"timestamp": datetime(2024, 1, 1, 13, 0, 0)}),
+        (4, {"timestamp": datetime(2024, 1, 1, 20, 0, 0)}),
+        (None, {"volume": 0.0}),
+    ],
+)
+def test_candle_arrays_validate_like_candle_list(index: int | None, update: dict[str, Any]) -> None:
+    candles = create_test_candles(6)
+    if index is None:
+        candles = [candle.model_copy(update=update) for candle in candles]
+    else:
+        candles[index] = candles[index].model_copy(update=update)
+
+    list_result = FeatureContract.validate(candles, min_count=5)
+    arrays_result = FeatureContract.validate(candles_to_arrays(candles), min_count=5)
+
+    assert arrays_result == list_result
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
+import ta
 
 from src.core.models.candle import Candle
 from src.features.indicators.indicator_engine import calculate_features
@@ -80,6 +82,37 @@ def test_calculate_features_bollinger_bands_order() -> None:
     assert features["bb_middle"] > features["bb_lower"]
 
 
+def test_calculate_features_matches_ta_library() -> None:
+    candles = create_test_candles(300)
+    for i, candle in enumerate(candles):
+        drift = ((i * 7) % 13 - 6) * 0.0003
+        candles[i] = candle.model_copy(
+            update={"close": candle.close + drift, "high": candle.high + abs(drift)}
+        )
+
+    features = calculate_features(candles)
+
+    close = pd.Series([candle.close for candle in candles])
+    high = pd.Series([candle.high for candle in candles])
+    low = pd.Series([candle.low for candle in candles])
+    bollinger = ta.volatility.BollingerBands(close=close, window=20, window_dev=2)
+    expected = {
+        "sma_50": ta.trend.SMAIndicator(close=close, window=50).sma_indicator().iloc[-1],
+        "sma_200": ta.trend.SMAIndicator(close=close, window=200).sma_indicator().iloc[-1],
+        "ema_9": ta.trend.EMAIndicator(close=close, window=9).ema_indicator().iloc[-1],
+        "rsi": ta.momentum.RSIIndicator(close=close, window=14).rsi().iloc[-1],
+        "bb_upper": bollinger.bollinger_hband().iloc[-1],
+        "bb_middle": bollinger.bollinger_mavg().iloc[-1],
+        "bb_lower": bollinger.bollinger_lband().iloc[-1],
+        "atr": ta.volatility.AverageTrueRange(high=high, low=low, close=close, window=14)
+        .average_true_range()
+        .iloc[-1],
+    }
+
+    for name, value in expected.items():
+        assert features[name] == pytest.approx(float(value), rel=1e-9), name
+
+
 def test_volatility_estimator_returns_string() -> None:
     candles = create_test_candles(250)
 
@@ -116,3 +149,13 @@ def test_volatility_estimator_high_volatility() -> None:
     result = VolatilityEstimator.estimate(candles)
 
     assert result in ["HIGH", "NORMAL", "LOW"]
+
+
+def test_volatility_estimator_uses_precomputed_features() -> None:
+    candles = create_test_candles(250)
+    features = calculate_features(candles)
+
+    assert VolatilityEstimator.estimate(candles, features) == VolatilityEstimator.estimate(candles)
+    wide_features = {"atr": 0.05, "bb_upper": 1.2, "bb_lower": 1.0}
+    assert VolatilityEstimator.estimate(candles, wide_features) == "HIGH"
+    assert VolatilityEstimator.estimate(candles, {}) == "NORMAL"
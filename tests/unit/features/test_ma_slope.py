@@ -6,6 +6,7 @@ import pytest
 
 from src.core.models.candle import Candle
 from src.features.derived.ma_slope import calculate_ma_slopes
+from src.features.indicators.moving_averages import calculate_moving_averages
 
 
 def create_test_candles(closes: list[float]) -> list[Candle]:
@@ -58,3 +59,13 @@ def test_short_series_sma200_slope_is_zero_and_no_crash() -> None:
     assert set(result.keys()) == {"sma50_slope_pct", "sma200_slope_pct", "ema9_slope_pct"}
     assert all(isinstance(value, float) for value in result.values())
     assert result["sma200_slope_pct"] == 0.0
+
+
+def test_precomputed_moving_averages_give_same_slopes() -> None:
+    candles = create_test_candles([100.0 + float(i % 17) for i in range(230)])
+
+    moving_averages = calculate_moving_averages(candles)
+
+    assert calculate_ma_slopes(
+        candles, slope_window=10, moving_averages=moving_averages
+    ) == calculate_ma_slopes(candles, slope_window=10)
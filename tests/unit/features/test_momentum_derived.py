@@ -3,6 +3,10 @@ from __future__ import annotations
 import math
 from datetime import datetime, timedelta
 
+import pandas as pd
+import pytest
+from ta.momentum import RSIIndicator
+
 from src.core.models.candle import Candle
 from src.features.derived.momentum_derived import calculate_momentum_features
 
@@ -57,3 +61,15 @@ def test_upward_series_has_positive_roc_values() -> None:
 
     assert result["roc_5"] > 0.0
     assert result["roc_20"] > 0.0
+
+
+def test_rsi_deltas_match_full_rsi_series() -> None:
+    closes = [100.0 + ((i * 7) % 13 - 6) * 0.4 + i * 0.05 for i in range(60)]
+    candles = create_test_candles(closes)
+
+    result = calculate_momentum_features(candles)
+
+    rsi = RSIIndicator(close=pd.Series(closes), window=14).rsi()
+    assert result["rsi_delta_1"] == pytest.approx(rsi.iloc[-1] - rsi.iloc[-2], abs=1e-9)
+    assert result["rsi_delta_5"] == pytest.approx(rsi.iloc[-1] - rsi.iloc[-6], abs=1e-9)
+    assert result["roc_20"] == pytest.approx((closes[-1] / closes[-21] - 1.0) * 100.0)
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from typing import Any
 
 import pytest
 
@@ -108,6 +109,38 @@ def test_feature_snapshot_validation_rejects_infinity() -> None:
         )
 
 
+def test_feature_snapshot_validation_handles_overflowing_and_cancelling_values() -> None:
+    snapshot = FeatureSnapshot(
+        timestamp=datetime.now(),
+        candles=[],
+        indicators={"big_a": 1e308, "big_b": 1e308},
+    )
+
+    assert snapshot.indicators == {"big_a": 1e308, "big_b": 1e308}
+
+    with pytest.raises(ValueError, match="Indicator pos_inf contains NaN or Infinity"):
+        FeatureSnapshot(
+            timestamp=datetime.now(),
+            candles=[],
+            indicators={"pos_inf": float("inf"), "neg_inf": float("-inf")},
+        )
+
+
+def test_feature_snapshot_coerces_int_indicators_and_rejects_strings() -> None:
+    snapshot = FeatureSnapshot(
+        timestamp=datetime.now(),
+        candles=[],
+        indicators={"rsi": 55.5, "volume_confirmation_flag": 1},
+    )
+
+    assert snapshot.indicators == {"rsi": 55.5, "volume_confirmation_flag": 1.0}
+    assert type(snapshot.indicators["volume_confirmation_flag"]) is float
+
+    indicators: dict[str, Any] = {"rsi": "high"}
+    with pytest.raises(ValueError, match="valid number"):
+        FeatureSnapshot(timestamp=datetime.now(), candles=[], indicators=indicators)
+
+
 def test_feature_snapshot_to_markdown() -> None:
     candles = create_test_candles(250)
     indicators = calculate_features(candles)
@@ -103,3 +103,11 @@ def test_close_price_zero_returns_zero_atr_pct_without_crashing() -> None:
     result = calculate_bb_metrics(0.0, indicators)
 
     assert result["atr_pct"] == 0.0
+
+
+def test_output_keys_are_stable_when_all_inputs_present() -> None:
+    indicators = {"bb_upper": 120.0, "bb_middle": 110.0, "bb_lower": 100.0, "atr": 1.5}
+
+    result = calculate_bb_metrics(110.0, indicators)
+
+    assert set(result) == {"bb_position", "bb_bandwidth_pct", "bb_squeeze_flag", "atr_pct"}
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.core.models.candle import Candle
+from src.features.arrays import candles_to_arrays
 from src.features.volume.volume_features import calculate_volume_features
 
 
@@ -87,3 +89,17 @@ def test_output_types_and_keys() -> None:
     assert result["volume_confirmation_flag"] in {0.0, 1.0}
 
     assert result["volume_mean"] == pytest.approx(100.0)
+
+
+def test_candle_arrays_match_candle_list() -> None:
+    volumes = [100.0 + (idx % 7) * 35.0 for idx in range(30)] + [900.0]
+    candles = create_test_candles(volumes)
+
+    list_result = calculate_volume_features(candles, window=20)
+    arrays_result = calculate_volume_features(candles_to_arrays(candles), window=20)
+
+    assert arrays_result == list_result
+    assert list_result["volume_mean"] == pytest.approx(np.mean(volumes[-20:]))
+    assert list_result["volume_zscore"] == pytest.approx(
+        (volumes[-1] - np.mean(volumes[-20:])) / np.std(volumes[-20:])
+    )
@@ -1,6 +1,8 @@
+from typing import Any
 from unittest.mock import Mock, patch
 
 import httpx
+import orjson
 
 from src.core.models.llm import LlmRequest
 from src.core.ports.llm_provider import HealthCheckResult
@@ -60,11 +62,12 @@ def test_deepseek_client_generate_with_request_success():
         mock_client = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"choices": [{"message": {"content": "test response"}}]}
+        mock_response.content = orjson.dumps(
+            {"choices": [{"message": {"content": "test response"}}]}
+        )
         mock_response.raise_for_status = Mock()
         mock_client.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        mock_client_class.return_value.__exit__.return_value = None
+        mock_client_class.return_value = mock_client
 
         client = DeepSeekClient(
             base_url="https://api.deepseek.com", api_key="test-key", provider_name="deepseek_api"
@@ -86,8 +89,10 @@ def test_deepseek_client_generate_with_request_success():
         assert response.model_name == "deepseek-chat"
         assert response.error is None
         call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["model"] == "deepseek-chat"
-        assert call_args[1]["json"]["temperature"] == 0.2
+        assert orjson.loads(call_args[1]["content"])["model"] == "deepseek-chat"
+        assert orjson.loads(call_args[1]["content"])["temperature"] == 0.2
+        assert call_args[1]["timeout"] == 60.0
+        mock_client_class.assert_called_once()
 
 
 def test_deepseek_client_generate_with_request_missing_api_key():
@@ -113,8 +118,7 @@ def test_deepseek_client_generate_with_request_handles_error():
     with patch("httpx.Client") as mock_client_class:
         mock_client = Mock()
         mock_client.post.side_effect = httpx.RequestError("Network error")
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        mock_client_class.return_value.__exit__.return_value = None
+        mock_client_class.return_value = mock_client
 
         client = DeepSeekClient(
             base_url="https://api.deepseek.com", api_key="test-key", provider_name="deepseek_api"
@@ -140,3 +144,117 @@ def test_deepseek_client_get_provider_name():
         base_url="https://api.deepseek.com", api_key="test-key", provider_name="deepseek_api"
     )
     assert client.get_provider_name() == "deepseek_api"
+
+
+def _chat_request() -> LlmRequest:
+    return LlmRequest(
+        task="test",
+        system_prompt="system",
+        user_prompt="user",
+        temperature=0.2,
+        timeout_seconds=60.0,
+        max_retries=1,
+    )
+
+
+def _http_response(status_code: int, payload: dict[str, Any] | None = None) -> httpx.Response:
+    request = httpx.Request("POST", "https://api.deepseek.com/v1/chat/completions")
+    return httpx.Response(status_code, json=payload or {}, request=request)
+
+
+def test_deepseek_client_generate_with_request_retries_server_errors(monkeypatch):
+    monkeypatch.setattr(DeepSeekClient._post_chat_completion.retry, "sleep", lambda _: None)
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock()
+        mock_client.post.side_effect = [
+            _http_response(503),
+            _http_response(200, {"choices": [{"message": {"content": "recovered"}}]}),
+        ]
+        mock_client_class.return_value = mock_client
+
+        client = DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key")
+        response = client.generate_with_request(_chat_request())
+
+        assert response.error is None
+        assert response.text == "recovered"
+        assert response.attempts == 2
+
+
+def test_deepseek_client_circuit_opens_after_repeated_failures(monkeypatch):
+    monkeypatch.setattr(DeepSeekClient._post_chat_completion.retry, "sleep", lambda _: None)
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock()
+        mock_client.post.return_value = _http_response(503)
+        mock_client_class.return_value = mock_client
+
+        client = DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key")
+        for _ in range(5):
+            assert "503" in str(client.generate_with_request(_chat_request()).error)
+
+        response = client.generate_with_request(_chat_request())
+
+        assert response.error is not None
+        assert response.error.startswith("circuit open")
+        assert mock_client.post.call_count == 15
+
+
+def test_deepseek_client_circuit_ignores_client_errors():
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock()
+        mock_client.post.return_value = _http_response(401)
+        mock_client_class.return_value = mock_client
+
+        client = DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key")
+        for _ in range(6):
+            assert "401" in str(client.generate_with_request(_chat_request()).error)
+
+        assert mock_client.post.call_count == 6
+
+
+def test_deepseek_client_generate_stream_yields_deltas():
+    body = (
+        b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+        b"data: [DONE]\n\n"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert b'"stream":true' in request.content.replace(b" ", b"")
+        return httpx.Response(200, content=body)
+
+    client = DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert list(client.generate_stream("system", "user")) == ["Hel", "lo"]
+
+
+def test_deepseek_client_generate_many_uses_n_and_fills_shortfall():
+    posted: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = orjson.loads(request.content)
+        posted.append(payload)
+        user_prompt = payload["messages"][1]["content"]
+        # "b" simulates an endpoint that ignores n and returns a single choice.
+        n = 1 if user_prompt == "b" else payload.get("n", 1)
+        choices = [{"message": {"content": f"{user_prompt}{i}"}} for i in range(n)]
+        return httpx.Response(200, content=orjson.dumps({"choices": choices}))
+
+    client = DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key")
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    results = client.generate_many("system", ["a", "b"], n_per_prompt=3)
+
+    assert results == [["a0", "a1", "a2"], ["b0", "b0", "b0"]]
+    assert len(posted) == 4
+    assert sorted(payload.get("n", 1) for payload in posted) == [1, 1, 3, 3]
+
+
+def test_deepseek_client_context_manager_closes_pooled_client():
+    with DeepSeekClient(base_url="https://api.deepseek.com", api_key="test-key") as client:
+        http_client = client.client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+    client.close()
@@ -33,3 +33,15 @@ def test_minute_loop_runs_n_iterations() -> None:
 
     assert mock_orchestrator.run_analysis.call_count == 3
     assert len(mock_clock.sleep_calls) == 2
+
+
+def test_minute_loop_close_closes_orchestrator() -> None:
+    mock_orchestrator = Mock(spec=OrchestratorProtocol)
+    mock_clock = MockClock()
+    loop = MinuteLoop(
+        orchestrator=mock_orchestrator, scheduler=Scheduler(mock_clock), clock=mock_clock
+    )
+
+    loop.close()
+
+    mock_orchestrator.close.assert_called_once()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -13,11 +14,15 @@ from src.storage.sqlite.repositories.recommendations_repository import Recommend
 pytestmark = pytest.mark.unit
 
 
-def test_recommendations_repo_roundtrips_reason_codes(tmp_path: Path) -> None:
-    db_path = tmp_path / "test.sqlite3"
-    db = DBConnection(str(db_path))
+@pytest.fixture
+def db(tmp_path: Path) -> Iterator[DBConnection]:
+    db = DBConnection(str(tmp_path / "test.sqlite3"))
     db.run_migration("src/storage/sqlite/migrations")
+    yield db
+    db.close()
 
+
+def test_recommendations_repo_roundtrips_reason_codes(db: DBConnection) -> None:
     repo = RecommendationsRepository(db)
 
     rec = Recommendation(